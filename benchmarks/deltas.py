@@ -0,0 +1,171 @@
+# dependencies
+from sympy import Symbol
+import numpy as np
+import os
+import sys
+import time
+
+# qom modules
+from qom.ui import init_log
+
+# add path to local libraries
+sys.path.append(os.path.abspath(os.path.join('.')))
+# import system
+from systems.BoseEinsteinCondensate import BEC_10
+
+# all parameters
+params = {
+    'rtol'  : 1e-9,
+    'cases' : {
+        'default'       : {},
+        'L_p = 3'       : {'L_p': 3},
+        'l = 10'        : {'l': 10, 'L_p': 2},
+        'P_lc = 1e-14'  : {'P_lc': 1e-14, 'Delta_tilde': -0.5},
+        'basic'         : {'t_oss_method': 'basic', 'l': 14}
+    },
+    'axes'  : {
+        'L_p'   : [0, 1, 2, 3],
+        'l'     : [10, 20]
+    }
+}
+
+def get_coeffs_deltas_symbolic(system, c):
+    """Function to obtain the coefficients of the polynomial in probe detuning by expanding its symbolic expression, as in the previous implementation of ``BEC_10.get_deltas``.
+
+    Parameters
+    ----------
+    system : :class:`systems.BoseEinsteinCondensate.BEC_10`
+        Instance of the system.
+    c : numpy.ndarray
+        Derived constants and controls.
+
+    Returns
+    -------
+    coeffs : numpy.ndarray
+        Coefficients of the polynomial in descending powers of the probe detuning.
+    """
+
+    # extract frequently used variables
+    Delta_tilde = c[0]
+    G = c[4]
+    gamma_m = c[6]
+    gamma_o = c[7]
+
+    # get effective values
+    A_mathcal, Omegas, omega_tildes, C = system.get_effective_values(
+        c=c
+    )
+    # get mean optical occupancy
+    N_o = system.get_mean_optical_occupancies()[0]
+    # calculate effective detuning
+    Delta = Delta_tilde + C * N_o
+
+    # probe detuning
+    delta = Symbol('delta', complex=True)
+    # effective values
+    Gamma_m = gamma_o / 2 - 1j * (Delta + delta)
+    Gamma_p = gamma_o / 2 + 1j * (Delta - delta)
+    chis =  [1 / (Omegas[i]**2 - 1j * delta * gamma_m - delta**2) for i in range(2)]
+    # Lambda
+    _num = A_mathcal * chis[0] * chis[1] * (omega_tildes[0] - omega_tildes[1])
+    _num += sum([chis[i] * omega_tildes[i] for i in range(2)])
+    _den = A_mathcal**2 * chis[0] * chis[1] + 1
+    Lambda = _num / _den
+
+    # equation for delta
+    eqtn_delta = Gamma_m * Gamma_p + 2 * Delta * G**2 * Lambda * N_o
+    eqtn_delta *= _den / chis[0] / chis[1]
+    eqtn_delta = eqtn_delta.factor().expand()
+
+    # coefficients in descending powers
+    coeffs = [eqtn_delta.coeff(delta, i) for i in range(6, 0, -1)]
+    coeffs.append((eqtn_delta - sum([coeffs[6 - i] * delta**i for i in range(6, 0, -1)])).expand())
+
+    return np.array([complex(coeff) for coeff in coeffs], dtype=np.complex_)
+
+def get_deviation_roots(roots, roots_ref):
+    """Function to obtain the largest relative deviation between two sets of roots paired by proximity.
+
+    Parameters
+    ----------
+    roots : numpy.ndarray
+        Roots to check.
+    roots_ref : numpy.ndarray
+        Reference roots.
+
+    Returns
+    -------
+    deviation : float
+        Largest relative deviation.
+    """
+
+    # pair each reference root with the nearest remaining root
+    roots = list(roots)
+    deviation = 0.0
+    for root_ref in roots_ref:
+        k = int(np.argmin(np.abs(np.array(roots) - root_ref)))
+        deviation = max(deviation, np.abs(roots.pop(k) - root_ref) / max(np.abs(root_ref), 1.0))
+
+    return deviation
+
+# init log
+init_log()
+
+print('\ncompiled against symbolic coefficients and roots (relative tolerance {:.0e})'.format(params['rtol']))
+print('{:<16}{:>14}{:>14}{:>14}{:>10}'.format('case', 'symbolic (ms)', 'compiled (ms)', 'err coeffs', 'err roots'))
+
+for name, params_system in params['cases'].items():
+    # initialize system
+    system = BEC_10(
+        params=params_system
+    )
+    _, _, c = system.get_ivc()
+
+    # symbolic path
+    _start = time.perf_counter()
+    coeffs_ref = get_coeffs_deltas_symbolic(
+        system=system,
+        c=c
+    )
+    roots_ref = np.roots(coeffs_ref)
+    time_ref = time.perf_counter() - _start
+
+    # compiled path, warmed up once
+    system.get_deltas(
+        c=c
+    )
+    _start = time.perf_counter()
+    coeffs = system.get_coeffs_deltas(
+        c=c
+    )
+    roots = np.array(system.get_deltas(
+        c=c
+    ))
+    time_compiled = time.perf_counter() - _start
+
+    # deviations
+    err_coeffs = np.max(np.abs(coeffs - coeffs_ref)) / np.max(np.abs(coeffs_ref))
+    err_roots = get_deviation_roots(roots, roots_ref)
+    print('{:<16}{:>14.2f}{:>14.3f}{:>14.1e}{:>10.1e}'.format(name, time_ref * 1e3, time_compiled * 1e3, err_coeffs, err_roots))
+    assert err_coeffs < params['rtol'] and err_roots < params['rtol'], "Compiled coefficients or roots of case ``'{}'`` deviate from the symbolic ones".format(name)
+
+# batched roots against the symbolic path at each point of the grid
+system = BEC_10(
+    params={}
+)
+deltas = system.get_deltas_batch(
+    axes=params['axes']
+)
+keys = list(params['axes'].keys())
+err_batch = 0.0
+for idxs in np.ndindex(*deltas.shape[:-1]):
+    system = BEC_10(
+        params={keys[i]: params['axes'][keys[i]][idxs[i]] for i in range(len(keys))}
+    )
+    _, _, c = system.get_ivc()
+    err_batch = max(err_batch, get_deviation_roots(deltas[idxs], np.roots(get_coeffs_deltas_symbolic(
+        system=system,
+        c=c
+    ))))
+print('{:<16}{:>52.1e}'.format('batch', err_batch))
+assert err_batch < params['rtol'], "Batched roots deviate from the symbolic ones"
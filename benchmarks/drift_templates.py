@@ -0,0 +1,85 @@
+# dependencies
+import cProfile
+import numpy as np
+import os
+import pstats
+import sys
+import timeit
+
+# qom modules
+from qom.ui import init_log
+
+# add path to local libraries
+sys.path.append(os.path.abspath(os.path.join('.')))
+# import systems
+from systems.Bidirectional import Bi_00
+from systems.BoseEinsteinCondensate import BEC_10
+from systems.MiddleMembrane import MM_01
+from systems.OptoElectroMechanical import OEM_20
+from systems.Unidirectional import Uni_00
+# import solver
+from solvers.deterministic import HLEIntegrator
+
+# all parameters
+params = {
+    'num_calls' : 20000,
+    'cases'     : {
+        'Bi_00'         : (Bi_00, {}),
+        'Uni_00'        : (Uni_00, {}),
+        'MM_01 (RWA)'   : (MM_01, {'t_rwa': True}),
+        'MM_01'         : (MM_01, {'t_rwa': False}),
+        'OEM_20'        : (OEM_20, {}),
+        'BEC_10'        : (BEC_10, {})
+    }
+}
+
+# names of the functions assembling the drift and noise matrices
+names_matrices = ['get_A', 'get_D', 'func_A', 'func_A_D', '<lambda>']
+
+# init log
+init_log()
+
+print('\nright-hand side: {} calls per case'.format(params['num_calls']))
+print('{:<14}{:>12}{:>10}{:>12}{:>10}{:>10}{:>10}'.format('system', 'before (us)', 'matrices', 'after (us)', 'matrices', 'speedup', 'max err'))
+
+for name, (System, params_system) in params['cases'].items():
+    # state at a random point
+    system = System(
+        params=params_system
+    )
+    _, _, c = system.get_ivc()
+    dim = 2 * system.num_modes
+    rng = np.random.default_rng(0)
+    v = rng.normal(size=dim + dim**2)
+    V = np.reshape(v[dim:], (dim, dim))
+    v[dim:] = np.ravel(V + np.transpose(V))
+
+    # rates before and after the templates
+    times_call = list()
+    shares = list()
+    results = list()
+    for use_templates in [False, True]:
+        hle_integrator = HLEIntegrator(
+            system=system,
+            params={
+                'use_templates' : use_templates
+            }
+        )
+        func_rates, _ = hle_integrator.get_func_rates(
+            c=c
+        )
+        results.append(np.array(func_rates(0.5, v)))
+
+        # time per call without the profiler
+        times_call.append(np.min(timeit.repeat(lambda: func_rates(0.5, v), number=params['num_calls'], repeat=3)) / params['num_calls'] * 1e6)
+
+        # share of the drift and noise matrices in the profile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        for _ in range(params['num_calls']):
+            func_rates(0.5, v)
+        profiler.disable()
+        stats = pstats.Stats(profiler)
+        shares.append(np.sum([val[2] for key, val in stats.stats.items() if key[2] in names_matrices]) / stats.total_tt)
+
+    print('{:<14}{:>12.2f}{:>10.1%}{:>12.2f}{:>10.1%}{:>10.2f}{:>10.1e}'.format(name, times_call[0], shares[0], times_call[1], shares[1], times_call[0] / times_call[1], np.max(np.abs(results[1] - results[0]))))
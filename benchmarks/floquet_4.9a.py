@@ -0,0 +1,134 @@
+# dependencies
+import numpy as np
+import os
+import sys
+import time
+
+# qom modules
+from qom.solvers.deterministic import HLESolver
+from qom.ui import init_log
+
+# add path to local libraries
+sys.path.append(os.path.abspath(os.path.join('.')))
+# import systems
+from systems.EndMirror import EM_01
+from systems.OptoElectroMechanical import OEM_20
+# import solver
+from solvers.deterministic import FloquetSolver
+# import measures
+from utils.measures import get_log_negativities
+
+# all parameters
+params = {
+    'looper': {
+        'X'             : {
+            'var'   : 'Omegas',
+            'idx'   : 1,
+            'min'   : 1.9,
+            'max'   : 2.1,
+            'dim'   : 2001
+        },
+        'stride'        : 1
+    },
+    'solver': {
+        'show_progress' : False,
+        'cache'         : False,
+        'ode_method'    : 'vode',
+        't_min'         : 0.0,
+        't_max'         : 1000.0,
+        't_dim'         : 10001,
+        't_index_min'   : 9371,
+        't_index_max'   : 10001,
+        'max_period'    : 25.0
+    },
+    'system': {
+        'A_ls'      : [100.0, 10.0, 10.0],
+        'A_vs'      : [50.0, 50.0, 50.0],
+        'Delta_0'   : 1.0,
+        'gammas'    : [0.1, 1e-6, 1e-2],
+        'gs'        : [1e-3, 2e-4],
+        'n_ths'     : [0.0, 0.0],
+        'Omegas'    : [2.0, 2.0, 2.0],
+        'omega_c0'  : 1.1,
+        'theta'     : 0.5,
+        't_mod'     : 'cos',
+        't_pos'     : 'top'
+    },
+    'unstable': {
+        'solver': {
+            'ode_method'    : 'vode',
+            't_min'         : 0.0,
+            't_max'         : 10.0,
+            't_dim'         : 101
+        },
+        'system': {
+            'Delta_0_norm'  : 1.0
+        }
+    }
+}
+
+# function to obtain squeezing and entanglement
+def func(Corrs):
+    # window of the times
+    Corrs = Corrs[params['solver']['t_index_min']:params['solver']['t_index_max']]
+
+    return np.array([np.min(Corrs[:, 2, 2]), np.max(get_log_negativities(Corrs, 0, 2))], dtype=np.float_)
+
+# init log
+init_log()
+
+# sweep
+xs = np.linspace(params['looper']['X']['min'], params['looper']['X']['max'], params['looper']['X']['dim'])[::params['looper']['stride']]
+times_hle = np.zeros(len(xs), dtype=np.float_)
+times_floquet = np.zeros(len(xs), dtype=np.float_)
+errs = np.zeros((len(xs), 2), dtype=np.float_)
+is_periodic = np.zeros(len(xs), dtype=np.bool_)
+for i, x in enumerate(xs):
+    system_params = {
+        **params['system'],
+        'Omegas': [params['system']['Omegas'][0], x, params['system']['Omegas'][2]]
+    }
+
+    # current path
+    _start = time.perf_counter()
+    Corrs = HLESolver(
+        system=OEM_20(
+            params=system_params
+        ),
+        params=params['solver']
+    ).get_modes_corrs()[1]
+    ms_hle = func(Corrs)
+    times_hle[i] = time.perf_counter() - _start
+
+    # periodic steady state if the common period is short enough for the shooting to be cheaper than the integration
+    floquet_solver = FloquetSolver(
+        system=OEM_20(
+            params=system_params
+        ),
+        params=params['solver']
+    )
+    is_periodic[i] = floquet_solver.period <= params['solver']['max_period']
+    if not is_periodic[i]:
+        times_floquet[i] = times_hle[i]
+        continue
+    _start = time.perf_counter()
+    ms_floquet = func(floquet_solver.get_corrs())
+    times_floquet[i] = time.perf_counter() - _start
+    errs[i] = np.abs(ms_floquet - ms_hle)
+    print('Omega_v = {:0.4f}: period = {:0.3f}, time = {:0.3f} s vs {:0.3f} s, errors = {:0.2e}, {:0.2e}'.format(x, floquet_solver.period, times_floquet[i], times_hle[i], errs[i][0], errs[i][1]))
+
+print('\n{} of {} points have a common period up to {:0.3f}'.format(np.sum(is_periodic), len(xs), params['solver']['max_period']))
+if np.any(is_periodic):
+    print('periodic points: {:0.3f} s vs {:0.3f} s ({:0.1f}x)'.format(np.sum(times_floquet[is_periodic]), np.sum(times_hle[is_periodic]), np.sum(times_hle[is_periodic]) / np.sum(times_floquet[is_periodic])))
+print('full sweep: {:0.3f} s vs {:0.3f} s ({:0.2f}x)'.format(np.sum(times_floquet), np.sum(times_hle), np.sum(times_hle) / np.sum(times_floquet)))
+
+# unstable point with the modes on their periodic orbit and NaN correlations
+floquet_solver = FloquetSolver(
+    system=EM_01(
+        params=params['unstable']['system']
+    ),
+    params=params['unstable']['solver']
+)
+Modes, Corrs = floquet_solver.get_modes_corrs()
+assert np.all(np.isfinite(Modes)) and np.all(np.isnan(Corrs)), "Unstable point should have finite modes and NaN correlations"
+print('unstable point: max |mu| = {:0.3f}, closure residual of the modes = {:0.2e}'.format(np.max(np.abs(floquet_solver.multipliers)), floquet_solver.stats['closure_residual']))
@@ -0,0 +1,109 @@
+# dependencies
+import numpy as np
+import os
+import sys
+import time
+
+# qom modules
+from qom.solvers.deterministic import HLESolver
+from qom.ui import init_log
+
+# add path to local libraries
+sys.path.append(os.path.abspath(os.path.join('.')))
+# import system
+from systems.EndMirror import EM_00, EM_01
+# import solver
+from solvers.deterministic import HLEIntegrator
+
+# all parameters
+params = {
+    'solver': {
+        'show_progress' : False,
+        'cache'         : False,
+        'ode_method'    : 'vode',
+        't_min'         : 0.0,
+        't_max'         : 300.0,
+        't_dim'         : 3001
+    },
+    'system': {
+        'A_l_norm'      : 25.0,
+        'A_l_norms'     : [25.0, 2.5, 2.5],
+        'Delta_0_norm'  : -1.0,
+        'g_0_norm'      : 0.005,
+        'gamma_norm'    : 0.005,
+        'kappa_norm'    : 0.15,
+        'T_norm'        : 0.0
+    },
+    'cases': {
+        'generic rates'         : {
+            'ode_method'    : 'vode',
+            'use_fused'     : False,
+            'use_jacobian'  : False
+        },
+        'fused rates'           : {
+            'ode_method'    : 'vode',
+            'use_fused'     : True,
+            'use_jacobian'  : False
+        },
+        'fused rates + jac'     : {
+            'ode_method'    : 'vode',
+            'use_fused'     : True,
+            'use_jacobian'  : True
+        },
+        'fused rates + jac BDF' : {
+            'ode_method'    : 'BDF',
+            'use_fused'     : True,
+            'use_jacobian'  : True
+        },
+        'fused rates + jac Radau' : {
+            'ode_method'    : 'Radau',
+            'use_fused'     : True,
+            'use_jacobian'  : True
+        }
+    }
+}
+
+# init log
+init_log()
+
+for System in [EM_00, EM_01]:
+    print('\n{}: {} steps'.format(System.__name__, params['solver']['t_dim']))
+    print('{:<26}{:>10}{:>12}{:>8}{:>8}{:>12}{:>12}'.format('case', 'time (s)', 'steps/s', 'nfev', 'njev', 'err modes', 'err corrs'))
+
+    # current path with mode rates counted per call
+    system = System(
+        params=params['system']
+    )
+    counts = {'nfev': 0}
+    _get_mode_rates = system.get_mode_rates
+    def get_mode_rates(modes, c, t):
+        counts['nfev'] += 1
+        return _get_mode_rates(modes, c, t)
+    system.get_mode_rates = get_mode_rates
+    hle_solver = HLESolver(
+        system=system,
+        params=params['solver']
+    )
+    _start = time.perf_counter()
+    Modes_0, Corrs_0 = hle_solver.get_modes_corrs()
+    _time = time.perf_counter() - _start
+    print('{:<26}{:>10.3f}{:>12.1f}{:>8d}{:>8d}{:>12.2e}{:>12.2e}'.format('qom HLESolver', _time, params['solver']['t_dim'] / _time, counts['nfev'], 0, 0.0, 0.0))
+
+    # repo-local integrator
+    for name, case in params['cases'].items():
+        system = System(
+            params=params['system']
+        )
+        if not case['use_fused']:
+            system.get_rates_modes_corrs = None
+        hle_integrator = HLEIntegrator(
+            system=system,
+            params={
+                **params['solver'],
+                'ode_method'    : case['ode_method'],
+                'use_jacobian'  : case['use_jacobian']
+            }
+        )
+        Modes, Corrs = hle_integrator.get_modes_corrs()
+        stats = hle_integrator.stats
+        print('{:<26}{:>10.3f}{:>12.1f}{:>8d}{:>8d}{:>12.2e}{:>12.2e}'.format(name, stats['time'], params['solver']['t_dim'] / stats['time'], stats['nfev'], stats['njev'], np.max(np.abs(Modes - Modes_0)), np.max(np.abs(Corrs - Corrs_0))))
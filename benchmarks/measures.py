@@ -0,0 +1,94 @@
+# dependencies
+import numpy as np
+import os
+import sys
+import time
+
+# qom modules
+from qom.solvers.measure import QCMSolver
+from qom.ui import init_log
+
+# add path to local libraries
+sys.path.append(os.path.abspath(os.path.join('.')))
+# import system
+from systems.Bidirectional import Bi_00
+# import solver
+from solvers.deterministic import HLEIntegrator
+# import measures
+from utils.measures import get_log_negativities, get_Pearson_correlations, get_synchronizations_phase
+
+# all parameters
+params = {
+    'solver': {
+        'indices'       : [1, 3],
+        'ode_method'    : 'vode',
+        't_min'         : 0.0,
+        't_max'         : 1000.0,
+        't_dim'         : 10001,
+        't_index_min'   : 9000,
+        't_index_max'   : 10001
+    },
+    'system': {
+        'A_l'           : 52.0,
+        'Delta_0_sign'  : 1.0,
+        'delta'         : 0.01,
+        'g_0s'          : [0.005, 0.005],
+        'gammas'        : [0.005, 0.005],
+        'kappas'        : [0.15, 0.15],
+        'lambda'        : 0.075,
+        'n_ths'         : [0.0, 0.0],
+        'omega_mL'      : 1.0
+    },
+    'window_dims'   : [630, 1000],
+    'num_repeats'   : 20
+}
+
+# function to obtain the measures per time with the conventions of qom
+def func_qcm(Modes, Corrs, pos_i, pos_j):
+    return QCMSolver(
+        Modes=Modes,
+        Corrs=Corrs,
+        params={
+            'show_progress' : False,
+            'measure_codes' : ['entan_ln', 'sync_p', 'corrs_P_p'],
+            'indices'       : [pos_i, pos_j]
+        }
+    ).get_measures()
+
+# function to obtain the measures for all times together
+def func_batch(Modes, Corrs, pos_i, pos_j):
+    return np.transpose([
+        get_log_negativities(Corrs, pos_i, pos_j),
+        get_synchronizations_phase(Modes, Corrs, pos_i, pos_j),
+        get_Pearson_correlations(Corrs, pos_i, pos_j)
+    ])
+
+# init log
+init_log()
+
+# get modes and correlations
+hle_solver = HLEIntegrator(
+    system=Bi_00(
+        params=params['system']
+    ),
+    params=params['solver']
+)
+Modes, Corrs = hle_solver.get_modes_corrs()
+Modes = Modes[params['solver']['t_index_min']:params['solver']['t_index_max']]
+Corrs = Corrs[params['solver']['t_index_min']:params['solver']['t_index_max']]
+
+print('{:<10}{:>14}{:>14}{:>16}{:>16}{:>10}{:>12}'.format('window', 'qom (s)', 'batch (s)', 'qom (1/s)', 'batch (1/s)', 'speedup', 'max err'))
+for dim in params['window_dims']:
+    # per-step reference of qom
+    _start = time.perf_counter()
+    for _ in range(params['num_repeats']):
+        measures_qcm = func_qcm(Modes[:dim], Corrs[:dim], *params['solver']['indices'])
+    time_qcm = (time.perf_counter() - _start) / params['num_repeats']
+
+    # batched kernels
+    _start = time.perf_counter()
+    for _ in range(params['num_repeats']):
+        measures_batch = func_batch(Modes[:dim], Corrs[:dim], *params['solver']['indices'])
+    time_batch = (time.perf_counter() - _start) / params['num_repeats']
+
+    print('{:<10d}{:>14.2e}{:>14.2e}{:>16.3e}{:>16.3e}{:>10.1f}{:>12.2e}'.format(dim, time_qcm, time_batch, 3 * dim / time_qcm, 3 * dim / time_batch, time_qcm / time_batch, np.max(np.abs(measures_batch - measures_qcm))))
@@ -1,10 +1,10 @@
 # dependencies
+import numpy as np
 import os
 import sys
 
 # qom modules
 from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
@@ -74,33 +74,46 @@ params = {
     }
 }
 
-# function to obtain the mean optical occupancies
-def func_moo(system_params):
+# axes
+xs = np.linspace(params['looper']['X']['min'], params['looper']['X']['max'], params['looper']['X']['dim'])
+ys = np.array(params['looper']['Y']['val'])
+# initialize mean optical occupancies
+V = np.full((len(ys), len(xs), 3), np.nan, dtype=np.float_)
+intervals = list()
+for i, y in enumerate(ys):
     # initialize system
     system = EM_00(
-        params=system_params
+        params={
+            **params['system'],
+            params['looper']['Y']['var']: y
+        }
     )
-    # get mean optical occupancies
-    N_os = system.get_mean_optical_occupancies()
-    
-    return N_os
-
-# wrap looper
-looper = wrap_looper(
-    looper_name='XYLooper',
-    func=func_moo,
-    params=params['looper'],
-    params_system=params['system']
-)
+    # get branches of the mean optical occupancy and intervals of bistability
+    branches, _, _intervals = system.get_mean_optical_occupancy_branches(
+        val_min=params['looper']['X']['min'],
+        val_max=params['looper']['X']['max'],
+        var=params['looper']['X']['var'],
+        ds_max=1e-2
+    )
+    intervals.append(_intervals)
+    # interpolate the monotonic branches
+    _V = np.full((len(xs), max(3, len(branches))), np.nan, dtype=np.float_)
+    for j, branch in enumerate(branches):
+        _order = np.argsort(branch[:, 0])
+        _mask = (xs >= branch[_order[0], 0]) & (xs <= branch[_order[-1], 0])
+        _V[_mask, j] = np.interp(xs[_mask], branch[_order, 0], branch[_order, 1])
+    # descending order padded with NaN
+    V[i] = - np.sort(- _V, axis=-1)[:, :3]
+params['plotter']['vertical_spans'][0]['limits'] = tuple(intervals[3][0])
+params['plotter']['vertical_spans'][1]['limits'] = tuple(intervals[2][0])
 
 # plotter
 plotter = MPLPlotter(
     axes={},
     params=params['plotter']
 )
-V = looper.results['V']
 plotter.update(
-    vs=[[V[2][j][i] for j in range(len(V[2]))] for i in range(1, 3)] + [[V[3][j][i] for j in range(len(V[3]))] for i in range(1, 3)] + [[V[i][j][0] for j in range(len(V[i]))] for i in range(4)],
-    xs=looper.results['X'][0]
+    vs=[V[2][:, i] for i in range(1, 3)] + [V[3][:, i] for i in range(1, 3)] + [V[i][:, 0] for i in range(4)],
+    xs=xs
 )
 plotter.show()
\ No newline at end of file
@@ -1,16 +1,18 @@
 # dependencies
-import numpy as np
 import os 
 import sys
 
 # qom modules
 from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
-from qom.utils.solvers import get_func_quantum_correlation_measures
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.Unidirectional import Uni_00
+# import solver
+from solvers.deterministic import HLEIntegrator
+# import measures
+from utils.measures import get_synchronizations_phase
 
 # all parameters
 params = {
@@ -76,14 +78,24 @@ params = {
 
 # function to obtain quantum phase synchronization
 def func(system_params):
-    # get quantum correlation measures
-    Measures = get_func_quantum_correlation_measures(
-        SystemClass=Uni_00,
-        params=params['solver'],
-        steady_state=False
-    )(system_params)
+    # initialize system
+    system = Uni_00(
+        params=system_params
+    )
+
+    # initialize solver
+    hle_solver = HLEIntegrator(
+        system=system,
+        params=params['solver']
+    )
+    # get average quantum phase synchronization within the window without storing the trajectory
+    reductions = hle_solver.get_reductions(
+        func=lambda Modes, Corrs: get_synchronizations_phase(Modes, Corrs, *params['solver']['indices']),
+        reducers=['mean']
+    )
+
     # return average value
-    return np.mean(Measures.transpose()[0])
+    return reductions['mean']
 
 # loop and plot
 if __name__ == '__main__':
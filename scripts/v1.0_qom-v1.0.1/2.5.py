@@ -5,13 +5,15 @@ import sys
 
 # qom modules
 from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
-from qom.utils.solvers import get_func_quantum_correlation_measures
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.Unidirectional import Uni_00
+# import solver
+from solvers.deterministic import EnsembleIntegrator
+# import measures
+from utils.measures import get_Pearson_correlations, get_synchronizations_phase
 
 # all parameters
 params = {
@@ -94,30 +96,22 @@ params = {
     }
 }
 
-# function to obtain quantum phase synchronization and pearson correlation coefficient
-def func(system_params):
-    # get quantum correlation measures
-    Measures = get_func_quantum_correlation_measures(
-        SystemClass=Uni_00,
-        params=params['solver'],
-        steady_state=False
-    )(system_params)
-    # return average value
-    return np.mean(Measures, axis=0)
-
 if __name__ == '__main__':
-    # looper
-    looper = run_loopers_in_parallel(
-        looper_name='XLooper',
-        func=func,
+    # integrate all the detunings together
+    ensemble = EnsembleIntegrator(
+        SystemClass=Uni_00,
         params=params['looper'],
         params_system=params['system'],
-        plot=False
+        params_solver=params['solver']
     )
+    Modes, Corrs = ensemble.get_modes_corrs()
 
-    # extract values
-    xs = looper.axes['X']['val']
-    vs = np.transpose(looper.results['V'])
+    # extract average quantum phase synchronization and pearson correlation coefficient
+    xs = ensemble.axes['X']['val']
+    vs = [
+        np.mean(get_synchronizations_phase(Modes, Corrs, *params['solver']['indices']), axis=1),
+        np.mean(get_Pearson_correlations(Corrs, *params['solver']['indices']), axis=1)
+    ]
 
     # plotter
     plotter = MPLPlotter(
@@ -91,10 +91,15 @@ params = {
     }
 }
 
+# system reused by all the points of the looper
+system = BEC_10(
+    params=params['system']
+)
+
 # function to obtain the transmission
 def func(system_params):
-    # intialize system
-    system = BEC_10(
+    # rebind the swept parameters
+    system.rebind(
         params=system_params
     )
     _, _, c = system.get_ivc()
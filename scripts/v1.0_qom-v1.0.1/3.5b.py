@@ -5,7 +5,6 @@ import sys
 
 # qom modules
 from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
@@ -21,7 +20,7 @@ params = {
             'var'   : 'delta',
             'min'   : -4.0,
             'max'   : 4.0,
-            'dim'   : 800001
+            'dim'   : 8001
         },
         'Y'                 : {
             'var'   : 'L_p',
@@ -89,53 +88,23 @@ params = {
     }
 }
 
-# function to obtain the transmission
-def func_transmission(system_params):
+if __name__ == '__main__':
     # initialize system
     system = BEC_10(
-        params=system_params
-    )
-    # extract parameters
-    _, _, c = system.get_ivc()
-    # return transmission
-    return system.get_transmission(
-        c=c
+        params=params['system']
     )
-
-if __name__ == '__main__':
-    # looper
-    looper = run_loopers_in_parallel(
-        looper_name='XYZLooper',
-        func=func_transmission,
-        params=params['looper'],
-        params_system=params['system']
+    # axes
+    delta_norms = np.linspace(params['looper']['X']['min'], params['looper']['X']['max'], params['looper']['X']['dim'])
+    xs = np.linspace(params['looper']['Y']['min'], params['looper']['Y']['max'], params['looper']['Y']['dim'])
+    ys = params['looper']['Z']['val']
+    # get separations between the transmission peaks refined from a coarse spectrum
+    _, _, _, ddelta_norms = system.get_transmission_peaks_batch(
+        deltas=delta_norms,
+        axes={
+            'l'     : ys,
+            'L_p'   : xs
+        }
     )
-    delta_norms = looper.axes['X']['val']
-    xs = looper.axes['Y']['val']
-    ys = looper.axes['Z']['val']
-    vs = looper.results['V']
-
-    # calculate peak differences
-    ddelta_norms = list()
-    for i in range(len(vs)):
-        ddelta_norms_temp = list()
-        for j in range(len(vs[0])):
-            # for each transparency profile
-            Ts = vs[i][j]
-            dim = len(Ts)
-            k = int(dim / 2) + 1 if dim % 2 == 0 else int(dim / 2)
-            # locate change of derivative from positive to negative from center
-            idxs = list()
-            while k <= dim - 2 and len(idxs) < 2:
-                if Ts[k] - Ts[k - 1] >= 0 and Ts[k + 1] - Ts[k] <= 0:
-                    idxs.append(k)
-                if Ts[- k - 1] - Ts[- k] >= 0 and Ts[- k - 2] - Ts[- k - 1] <= 0:
-                    idxs.append(- k - 1)
-                k += 1
-            # update list with difference between peaks
-            ddelta_norms_temp.append(np.abs(delta_norms[idxs[-1]] - delta_norms[idxs[0]]))
-        # update main list
-        ddelta_norms.append(ddelta_norms_temp)
 
     # plotter
     plotter = MPLPlotter(axes={
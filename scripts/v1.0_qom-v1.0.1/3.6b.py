@@ -81,10 +81,15 @@ params = {
     }
 }
 
+# system reused by all the points of the looper
+system = BEC_10(
+    params=params['system']
+)
+
 # function to obtain the normalized transmission phase
 def func_transmission_phase_norm(system_params):
-    # initialize system
-    system = BEC_10(
+    # rebind the swept parameters
+    system.rebind(
         params=system_params
     )
     # extract parameters
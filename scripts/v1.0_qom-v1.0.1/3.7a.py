@@ -5,19 +5,19 @@ import sys
 
 # qom modules
 from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.BoseEinsteinCondensate import BEC_10
+# import storage
+from utils.grids import ChunkedGrid
 
 # all parameters
 params = {
     'looper': {
         'show_progress'     : True,
         'file_path_prefix'  : 'data/v1.0_qom-v1.0.1/3.7a',
-        'grad'              : True,
         'X'                 : {
             'var'   : 'delta',
             'min'   : -0.002,
@@ -90,10 +90,15 @@ params = {
     }
 }
 
-# function to obtain the normalized transmission phase
-def func_transmission_phase_norm(system_params):
-    # initialize system
-    system = BEC_10(
+# system reused by all the chunks of the grid
+system = BEC_10(
+    params=params['system']
+)
+
+# function to obtain the gradient of the normalized transmission phase over the probe detunings
+def func_transmission_phase_norm_grad(system_params):
+    # rebind the swept parameters
+    system.rebind(
         params=system_params
     )
     # extract parameters
@@ -106,20 +111,25 @@ def func_transmission_phase_norm(system_params):
     _, Omegas, _, _ = system.get_effective_values(
         c=c
     )
-    # return normalized value
-    return phi / (Omegas[0] + Omegas[1]) * 2
+    # return gradient of normalized value
+    return np.gradient(phi / (Omegas[0] + Omegas[1]) * 2, system_params['delta'])
 
 if __name__ == '__main__':
-    # looper
-    looper = run_loopers_in_parallel(
-        looper_name='XYZLooper',
-        func=func_transmission_phase_norm,
-        params=params['looper'],
+    # grid of gradients stored in single precision
+    grid = ChunkedGrid(
+        file_path_prefix=params['looper']['file_path_prefix'],
+        axes=params['looper'],
+        dtype='float32'
+    )
+    # fill the remaining chunks in parallel
+    grid.fill(
+        func=func_transmission_phase_norm_grad,
         params_system=params['system']
     )
-    xs = looper.axes['Y']['val']
-    ys = looper.axes['Z']['val']
-    vs = [[np.min(col) for col in row] for row in looper.results['V']]
+    xs = grid.get_axes()['Y']['val']
+    ys = grid.get_axes()['Z']['val']
+    # minimum gradients read lazily from the stored grid
+    vs = np.min(grid.get_values(), axis=-1)
 
     # plotter
     plotter = MPLPlotter(axes={
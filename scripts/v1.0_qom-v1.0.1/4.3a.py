@@ -11,6 +11,8 @@ from qom.ui.plotters import MPLPlotter
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.MiddleMembrane import MM_01
+# import solver
+from solvers.deterministic import HLEIntegrator
 
 # all parameters
 params = {
@@ -84,10 +86,13 @@ system = MM_01(
     params=params['system']
 )
 
-# get variances
-M_1 = HLESolver(
+# get variances from the exact propagation with constant drift matrix
+M_1 = HLEIntegrator(
     system=system,
-    params=params['solver']
+    params={
+        **params['solver'],
+        'ode_method'    : 'expm'
+    }
 ).get_corr_indices().transpose()[0]
 
 # plotter
@@ -4,9 +4,7 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
 from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
@@ -24,17 +22,6 @@ params = {
             'dim'   : 301
         }
     },
-    'solver': {
-        'show_progress' : False,
-        'cache'         : True,
-        'ode_method'    : 'vode',
-        'indices'       : [(2, 2), (3, 3)],
-        't_min'         : 0.0,
-        't_max'         : 1000.0,
-        't_dim'         : 10001,
-        't_index_min'   : 9371,
-        't_index_max'   : 10000
-    },
     'system': {
         'alphas'        : [2.0, 0.2, 0.2],
         'betas'         : [100.0, 25.0, 25.0],
@@ -80,118 +67,50 @@ params = {
     }
 }
 
-# function to calculate the ratio and variance
-def func_rat_var(system_params):
-    # update parameters
-    val = system_params['beta_pm_sum']
-    system_params['betas'][1] = val / 2.0
-    system_params['betas'][2] = val / 2.0
-
-    # initialize system
-    system = MM_01(
-        params=system_params
-    )
-
-    # get derived constants and controls
-    _, _, c = system.get_ivc()
-    
-    # get squeezing ratio
-    rat = system.get_params_ratio(
-        c=c
-    )
-
-    # get mechanical position variance
-    var = np.min(HLESolver(
-        system=system,
-        params=params['solver']
-    ).get_corr_indices()[:, 0])
-
-    # update results
-    return np.array([rat, var], dtype=np.float_)
-
-# function to calculate the ratio and variance
-def func_rat_n_beta(system_params):
-    # update parameters
-    val = system_params['beta_pm_sum']
-    system_params['betas'][1] = val / 2.0
-    system_params['betas'][2] = val / 2.0
-
-    # initialize system
-    system = MM_01(
-        params=system_params
-    )
-
-    # get derived constants and controls
-    _, _, c = system.get_ivc()
-    
-    # get squeezing ratio
-    rat = system.get_params_ratio(
-        c=c
-    )
-
+# function to calculate the phonon number in the Bogoliubov mode
+def func_n_beta(rats, Corrs):
     # get mechanical position and momentum variances
-    var_q, var_p = np.min(HLESolver(
-        system=system,
-        params=params['solver']
-    ).get_corr_indices(), axis=0)
+    var_q = Corrs[:, 2, 2]
+    var_p = Corrs[:, 3, 3]
 
     # calculate hyperbolic angles
-    r = np.arctanh(rat)
+    r = np.arctanh(rats)
     chr = np.cosh(r)
     shr = np.sinh(r)
 
     # get phonon number in the Bogoluibov mode
-    n_beta = (chr**2 + shr**2) * (var_q + var_p - 1) / 2.0 + shr**2 + chr * shr * (var_q - var_p)
-
-    # update results
-    return np.array([rat, n_beta], dtype=np.float_)
+    return (chr**2 + shr**2) * (var_q + var_p - 1) / 2.0 + shr**2 + chr * shr * (var_q - var_p)
 
 if __name__ == '__main__':
-    # variance with low thermal phonons
-    params['looper']['file_path_prefix'] = 'data/v1.0_qom-v1.0.1/4.4_var_n=10.0'
-    params['system']['ns'][1] = 10.0
-    looper = run_loopers_in_parallel(
-        looper_name='XLooper',
-        func=func_rat_var,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
+    # initialize system
+    system = MM_01(
+        params=params['system']
     )
-    rats, vars_0_rwa = np.transpose(looper.results['V'])
-    # variance with high thermal phonons
-    params['looper']['file_path_prefix'] = 'data/v1.0_qom-v1.0.1/4.4_var_n=1000.0'
-    params['system']['ns'][1] = 1000.0
-    looper = run_loopers_in_parallel(
-        looper_name='XLooper',
-        func=func_rat_var,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
+    # axes
+    beta_pm_sums = np.linspace(params['looper']['X']['min'], params['looper']['X']['max'], params['looper']['X']['dim'])
+    betas = [params['system']['betas'][0], beta_pm_sums / 2.0, beta_pm_sums / 2.0]
+
+    # get squeezing ratios
+    G_minus_norms, G_plus_norms, _, _ = system.get_params_G_norms_batch(
+        betas=betas
     )
-    _, vars_0_wrwa = np.transpose(looper.results['V'])
+    rats = (G_plus_norms - G_minus_norms) / (G_plus_norms + G_minus_norms)
 
-    # occupancy with low thermal phonons
-    params['looper']['file_path_prefix'] = 'data/v1.0_qom-v1.0.1/4.4_beta_n=10.0'
-    params['system']['ns'][1] = 10.0
-    looper = run_loopers_in_parallel(
-        looper_name='XLooper',
-        func=func_rat_n_beta,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
+    # low thermal phonons
+    Corrs_0, _ = system.get_corrs_steady_state_rwa_batch(
+        betas=betas,
+        ns=[params['system']['ns'][0], 10.0]
     )
-    _, n_betas_0 = np.transpose(looper.results['V'])
-    # occupancy with high thermal phonons
-    params['looper']['file_path_prefix'] = 'data/v1.0_qom-v1.0.1/4.4_beta_n=1000.0'
-    params['system']['ns'][1] = 1000.0
-    looper = run_loopers_in_parallel(
-        looper_name='XLooper',
-        func=func_rat_n_beta,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
+    vars_0_rwa = Corrs_0[:, 2, 2]
+    n_betas_0 = func_n_beta(rats, Corrs_0)
+
+    # high thermal phonons
+    Corrs_1, _ = system.get_corrs_steady_state_rwa_batch(
+        betas=betas,
+        ns=[params['system']['ns'][0], 1000.0]
     )
-    _, n_betas_1 = np.transpose(looper.results['V'])
+    vars_0_wrwa = Corrs_1[:, 2, 2]
+    n_betas_1 = func_n_beta(rats, Corrs_1)
 
     # plotter
     plotter = MPLPlotter(
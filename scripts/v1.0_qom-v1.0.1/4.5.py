@@ -4,9 +4,7 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
 from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
@@ -31,17 +29,6 @@ params = {
             'scale' : 'log'
         }
     },
-    'solver': {
-        'show_progress' : False,
-        'cache'         : True,
-        'ode_method'    : 'vode',
-        'indices'       : [(2, 2)],
-        't_min'         : 0.0,
-        't_max'         : 10000.0,
-        't_dim'         : 100001,
-        't_index_min'   : 99371,
-        't_index_max'   : 100001
-    },
     'system': {
         'alphas'        : [2.0, 0.2, 0.2],
         'betas'         : [100.0, 25.0, 25.0],
@@ -86,64 +73,39 @@ params = {
     }
 }
 
-# function to calculate the ratio and variances
-def func_rat_var(system_params):
-    # update parameters
-    val = system_params['beta_pm_sum']
-    system_params['betas'][1] = val / 2.0
-    system_params['betas'][2] = val / 2.0
-
+if __name__ == '__main__':
     # initialize system
     system = MM_01(
-        params=system_params
+        params=params['system']
     )
+    # axes
+    beta_pm_sums = np.linspace(params['looper']['X']['min'], params['looper']['X']['max'], params['looper']['X']['dim'])
+    xs = np.logspace(np.log10(params['looper']['Y']['min']), np.log10(params['looper']['Y']['max']), params['looper']['Y']['dim'])
+    betas = [params['system']['betas'][0], beta_pm_sums[np.newaxis, :] / 2.0, beta_pm_sums[np.newaxis, :] / 2.0]
 
-    # get derived constants and controls
-    _, _, c = system.get_ivc()
-    
-    # get squeezing ratio
-    rat = system.get_params_ratio(
-        c=c
+    # get squeezing ratios
+    G_minus_norms, G_plus_norms, _, _ = system.get_params_G_norms_batch(
+        betas=betas
     )
+    rats = np.ravel((G_plus_norms - G_minus_norms) / (G_plus_norms + G_minus_norms))
 
-    # get mechanical position variances
-    var = np.min(HLESolver(
-        system=system,
-        params=params['solver']
-    ).get_corr_indices(), axis=0)[0]
-
-    # update results
-    return np.array([rat, var], dtype=np.float_)
-
-if __name__ == '__main__':
     # low thermal phonons
-    params['looper']['file_path_prefix'] = 'data/v1.0_qom-v1.0.1/4.5_n=10.0'
-    params['system']['ns'][1] = 10.0
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_rat_var,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
+    Corrs, _ = system.get_corrs_steady_state_rwa_batch(
+        betas=betas,
+        kappa_norms=xs[:, np.newaxis],
+        ns=[params['system']['ns'][0], 10.0]
     )
-    xs = looper.axes['Y']['val']
-    _, vs_0 = np.min(looper.results['V'], axis=1).transpose()
-    _, _idxs_0 = np.argmin(looper.results['V'], axis=1).transpose()
-    vs_2 = np.transpose(looper.results['V'])[0, _idxs_0, 0]
+    vs_0 = np.nanmin(Corrs[:, :, 2, 2], axis=1)
+    vs_2 = rats[np.nanargmin(Corrs[:, :, 2, 2], axis=1)]
 
     # high thermal phonons
-    params['looper']['file_path_prefix'] = 'data/v1.0_qom-v1.0.1/4.5_n=1000.0'
-    params['system']['ns'][1] = 1000.0
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_rat_var,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
+    Corrs, _ = system.get_corrs_steady_state_rwa_batch(
+        betas=betas,
+        kappa_norms=xs[:, np.newaxis],
+        ns=[params['system']['ns'][0], 1000.0]
     )
-    _, vs_1 = np.min(looper.results['V'], axis=1).transpose()
-    _, _idxs_1 = np.argmin(looper.results['V'], axis=1).transpose()
-    vs_3 = np.transpose(looper.results['V'])[0, _idxs_1, 0]
+    vs_1 = np.nanmin(Corrs[:, :, 2, 2], axis=1)
+    vs_3 = rats[np.nanargmin(Corrs[:, :, 2, 2], axis=1)]
 
     # plotter
     plotter = MPLPlotter(
@@ -4,15 +4,14 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
-from qom.solvers.measure import QCMSolver
 from qom.ui.plotters import MPLPlotter
-from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
 # add path to local libraries
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.MiddleMembrane import MM_01
+# import measures
+from utils.measures import get_log_negativities
 
 # all parameters
 params = {
@@ -33,18 +32,6 @@ params = {
             'scale' : 'log'
         }
     },
-    'solver': {
-        'show_progress' : False,
-        'cache'         : True,
-        'ode_method'    : 'vode',
-        'measure_codes' : ['entan_ln'],
-        'indices'       : (0, 1),
-        't_min'         : 0.0,
-        't_max'         : 1000.0,
-        't_dim'         : 10001,
-        't_index_min'   : 9371,
-        't_index_max'   : 10001
-    },
     'system': {
         'alphas'        : [2.0, 0.2, 0.2],
         'betas'         : [100.0, 25.0, 25.0],
@@ -91,118 +78,33 @@ params = {
     }
 }
 
-# function to calculate the ratio and entanglement
-def func_rat_var(system_params):
-    # update parameters
-    val = system_params['beta_pm_sum']
-    system_params['betas'][1] = val / 2.0
-    system_params['betas'][2] = val / 2.0
-
-    # initialize system
-    system = MM_01(
-        params=system_params
-    )
-
-    # get derived constants and controls
-    _, _, c = system.get_ivc()
-    
-    # get squeezing ratio
-    rat = system.get_params_ratio(
-        c=c
-    )
-
-    # get mechanical position variance
-    var = np.mean(HLESolver(
-        system=system,
-        params=params['solver']
-    ).get_corrs()[:, 2, 2])
-
-    return np.array([rat, var])
-
-# function to calculate the ratio and entanglement
-def func_rat_entan_ln(system_params):
-    # update parameters
-    val = system_params['beta_pm_sum']
-    system_params['betas'][1] = val / 2.0
-    system_params['betas'][2] = val / 2.0
-
+if __name__ == '__main__':
     # initialize system
     system = MM_01(
-        params=system_params
-    )
-
-    # get derived constants and controls
-    _, _, c = system.get_ivc()
-    
-    # get squeezing ratio
-    rat = system.get_params_ratio(
-        c=c
+        params=params['system']
     )
+    # axes
+    beta_pm_sums = np.linspace(params['looper']['X']['min'], params['looper']['X']['max'], params['looper']['X']['dim'])
+    xs = np.logspace(np.log10(params['looper']['Y']['min']), np.log10(params['looper']['Y']['max']), params['looper']['Y']['dim'])
+    betas = [params['system']['betas'][0], beta_pm_sums[np.newaxis, :] / 2.0, beta_pm_sums[np.newaxis, :] / 2.0]
 
-    # get modes, correlations and times
-    Modes, Corrs = HLESolver(
-        system=system,
-        params=params['solver']
-    ).get_modes_corrs()
-    # get entanglement
-    eln = np.mean(QCMSolver(
-        Modes=Modes,
-        Corrs=Corrs,
-        params=params['solver']
-    ).get_measures(), axis=0)[0]
-
-    return np.array([rat, eln])
-
-if __name__ == '__main__':
-    # low kappa
-    params['looper']['file_path_prefix'] = 'data/v1.0_qom-v1.0.1/4.6_var_kappa=0.1'
-    params['system']['kappa_norm'] = 0.1
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_rat_var,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
-    )
-    xs = looper.axes['Y']['val']
-    vars_0 = np.min(looper.results['V'], axis=1).transpose()[1]
-
-    # high kappa
-    params['looper']['file_path_prefix'] = 'data/v1.0_qom-v1.0.1/4.6_var_kappa=1.0'
-    params['system']['kappa_norm'] = 1.0
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_rat_var,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
-    )
-    vars_1 = np.min(looper.results['V'], axis=1).transpose()[1]
-    
     # low kappa
-    params['looper']['file_path_prefix'] = 'data/v1.0_qom-v1.0.1/4.6_entan_kappa=0.1'
-    params['system']['kappa_norm'] = 0.1
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_rat_entan_ln,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
+    Corrs, _ = system.get_corrs_steady_state_rwa_batch(
+        betas=betas,
+        kappa_norms=0.1,
+        ns=[params['system']['ns'][0], xs[:, np.newaxis]]
     )
-    xs = looper.axes['Y']['val']
-    elns_0 = np.max(looper.results['V'], axis=1).transpose()[1]
+    vars_0 = np.nanmin(Corrs[:, :, 2, 2], axis=1)
+    elns_0 = np.nanmax(get_log_negativities(Corrs), axis=1)
 
     # high kappa
-    params['looper']['file_path_prefix'] = 'data/v1.0_qom-v1.0.1/4.6_entan_kappa=1.0'
-    params['system']['kappa_norm'] = 1.0
-    looper = run_loopers_in_parallel(
-        looper_name='XYLooper',
-        func=func_rat_entan_ln,
-        params=params['looper'],
-        params_system=params['system'],
-        plot=False
+    Corrs, _ = system.get_corrs_steady_state_rwa_batch(
+        betas=betas,
+        kappa_norms=1.0,
+        ns=[params['system']['ns'][0], xs[:, np.newaxis]]
     )
-    elns_1 = np.max(looper.results['V'], axis=1).transpose()[1]
+    vars_1 = np.nanmin(Corrs[:, :, 2, 2], axis=1)
+    elns_1 = np.nanmax(get_log_negativities(Corrs), axis=1)
 
     # plotter
     plotter = MPLPlotter(
@@ -4,8 +4,6 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
-from qom.solvers.measure import get_Wigner_distributions_single_mode
 from qom.ui import init_log
 from qom.ui.plotters import MPLPlotter
 
@@ -13,6 +11,10 @@ from qom.ui.plotters import MPLPlotter
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.OptoElectroMechanical import OEM_20
+# import solver
+from solvers.deterministic import HLEIntegrator
+# import measures
+from utils.measures import get_Wigner_distributions_single_mode
 
 # parameters
 params = {
@@ -76,17 +78,19 @@ system = OEM_20(
     params=params['system']
 )
 
-# get correlations and times
-hle_solver = HLESolver(
+# get correlations and times within the window
+hle_solver = HLEIntegrator(
     system=system,
     params=params['solver']
 )
-T = hle_solver.get_times()
-Corrs = hle_solver.get_corrs()
-# get Wigner distributions
+T = hle_solver.get_times()[params['solver']['t_index_min']:params['solver']['t_index_max']]
+Corrs = hle_solver.get_corrs()[params['solver']['t_index_min']:params['solver']['t_index_max']]
+# get Wigner distributions of all the frames on the shared grid
 Wigners = get_Wigner_distributions_single_mode(
-    Corrs=Corrs,
-    params=params['solver']
+    corrs=Corrs,
+    xs=params['solver']['wigner_xs'],
+    ys=params['solver']['wigner_ys'],
+    pos=params['solver']['indices'][0]
 )
 
 # plot squeezed Wigners
@@ -101,7 +105,7 @@ for i in [14, 91]:
         params=params['plotter']
     )
     plotter.update(
-        vs=Wigners[i, 0]
+        vs=Wigners[i]
     )
     plotter.show()
     plotter.close()
\ No newline at end of file
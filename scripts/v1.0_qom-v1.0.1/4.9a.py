@@ -4,8 +4,6 @@ import os
 import sys
 
 # qom modules
-from qom.solvers.deterministic import HLESolver
-from qom.solvers.measure import QCMSolver
 from qom.ui.plotters import MPLPlotter
 from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 
@@ -13,6 +11,12 @@ from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.OptoElectroMechanical import OEM_20
+# import solver
+from solvers.deterministic import HLEIntegrator
+# import measures
+from utils.measures import get_log_negativities
+# import cache
+from utils.caches import DiskCachedFunction
 
 # all parameters
 params = {
@@ -92,33 +96,37 @@ def func(system_params):
     )
 
     # initialize solver
-    hle_solver = HLESolver(
+    hle_solver = HLEIntegrator(
         system=system,
         params=params['solver']
     )
-    # get modes and correlations
-    Modes, Corrs = hle_solver.get_modes_corrs()
-    # get quantum correlation measures
-    Measures = QCMSolver(
-        Modes=Modes,
-        Corrs=Corrs,
-        params=params['solver']
-    ).get_measures()
+    # get extrema of the variance and the entanglement within the window without storing the trajectory
+    reductions = hle_solver.get_reductions(
+        func=lambda Modes, Corrs: np.transpose([Corrs[:, 2, 2], get_log_negativities(Corrs, *params['solver']['indices'])]),
+        reducers=['min', 'max']
+    )
     # extract maximum squeezing
-    m_0 = np.min(Corrs[:, 2, 2])
+    m_0 = reductions['min'][0]
     # extract maximum entanglement
-    m_1 = np.max(Measures[:, 0])
+    m_1 = reductions['max'][1]
 
     # return results as array
     return np.array([m_0, m_1], dtype=np.float_)
 
 if __name__ == '__main__':
+    # reuse the results of the points shared by the runs and the scripts
+    func_cached = DiskCachedFunction(
+        func=func,
+        SystemClass=OEM_20,
+        params_solver=params['solver']
+    )
+
     # without mechanical frequency modulation
     params['looper']['file_path_prefix'] = 'data/v1.0_qom-v1.0.1/4.9a_theta=0.0'
     params['system']['theta'] = 0.0
     looper_0 = run_loopers_in_parallel(
         looper_name='XLooper',
-        func=func,
+        func=func_cached,
         params=params['looper'],
         params_system=params['system'],
         plot=False
@@ -130,7 +138,7 @@ if __name__ == '__main__':
     params['system']['theta'] = 0.5
     looper_1 = run_loopers_in_parallel(
         looper_name='XLooper',
-        func=func,
+        func=func_cached,
         params=params['looper'],
         params_system=params['system'],
         plot=False
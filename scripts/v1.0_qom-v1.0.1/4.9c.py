@@ -13,6 +13,8 @@ from qom.utils.loopers import run_loopers_in_parallel, wrap_looper
 sys.path.append(os.path.abspath(os.path.join('.')))
 # import system
 from systems.OptoElectroMechanical import OEM_20
+# import cache
+from utils.caches import DiskCachedFunction
 
 # all parameters
 params = {
@@ -114,12 +116,19 @@ def func(system_params):
     return np.array([m_0, m_1], dtype=np.float_)
 
 if __name__ == '__main__':
+    # reuse the results of the points shared by the runs and the scripts
+    func_cached = DiskCachedFunction(
+        func=func,
+        SystemClass=OEM_20,
+        params_solver=params['solver']
+    )
+
     # without voltage modulation
     params['looper']['file_path_prefix'] = 'data/v1.0_qom-v1.0.1/4.9c_A_vs=[50.0, 0.0, 0.0]'
     params['system']['A_vs'] = [50.0, 0.0, 0.0]
     looper_0 = run_loopers_in_parallel(
         looper_name='XLooper',
-        func=func,
+        func=func_cached,
         params=params['looper'],
         params_system=params['system'],
         plot=False
@@ -131,7 +140,7 @@ if __name__ == '__main__':
     params['system']['A_vs'] = [50.0, 50.0, 50.0]
     looper_1 = run_loopers_in_parallel(
         looper_name='XLooper',
-        func=func,
+        func=func_cached,
         params=params['looper'],
         params_system=params['system'],
         plot=False
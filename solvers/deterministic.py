@@ -0,0 +1,1429 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module to solve the deterministic dynamics of the systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import fractions
+import numpy as np
+import scipy.integrate as si
+import scipy.linalg as sl
+import time
+
+# local modules
+from utils.matrices import get_packed, get_unpacked, PackedSymmetricMatrices
+from utils.polynomials import get_stabilities
+
+class HLEIntegrator():
+    r"""Class to integrate the classical modes and the quantum correlations of a system.
+
+    The state of the integration is the real vector :math:`[ \Re ( \alpha_{i} ), \Im ( \alpha_{i} ), V_{ij} ]` of the real and imaginary parts of the modes followed by the flattened correlation matrix, or by its upper triangle if the correlations are packed. If the system defines ``get_rates_modes_corrs(t, v, c)``, it is used as the right-hand side and ``get_jacobian_modes_corrs(t, v, c)`` is passed to the stiff integrators if available. Otherwise the rates are assembled from ``get_mode_rates`` and the drift and noise matrices, which are built from the templates of ``get_templates_A_D`` if available, or else from ``get_A`` and ``get_D``. With packed correlations, the rates of the upper triangle are obtained directly from the drift and noise matrices, or from the fused rates of the state filled from the packed elements.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system.
+    params : dict
+        Parameters for the solver. The solver parameters are:
+        ============    ====================================================
+        key             meaning
+        ============    ====================================================
+        conv_num        (*int*) number of periods recorded after the convergence to the asymptotic state. Default is :math:`1`.
+        conv_period     (*float*) period of the asymptotic orbit, for example :math:`2 \pi / \Omega`, or ``None`` for a fixed point, in which case the states are compared after every ``t_num_chunk`` times. Default is ``None``.
+        conv_tol        (*float*) tolerance of the change of the state over a period relative to the largest absolute value of the state. Default is :math:`10^{-6}`.
+        indices         (*list* or *tuple*) indices of the modes as a list or of the correlations as a list of tuples. Default is ``[0]``.
+        iv_corrs        (*list* or *numpy.ndarray*) initial values of the correlations, replacing those of the system. Default is ``None``.
+        iv_modes        (*list* or *numpy.ndarray*) initial values of the modes, replacing those of the system, for example its steady state modes. Default is ``None``.
+        ode_atol        (*float*) absolute tolerance of the integrator. Default is :math:`10^{-12}`.
+        ode_method      (*str*) method of integration. Options are ``'vode'``, ``'lsoda'``, ``'dopri5'`` and ``'dop853'`` for :class:`scipy.integrate.ode`, ``'BDF'``, ``'LSODA'``, ``'Radau'``, ``'RK45'`` and ``'DOP853'`` for :func:`scipy.integrate.solve_ivp` and ``'expm'`` for the exact propagation of the correlations with constant drift and noise matrices at a fixed point of the modes. Default is ``'vode'``.
+        ode_nsteps      (*int*) maximum number of internal steps between two times for the methods of :class:`scipy.integrate.ode`. Default is :math:`10^{5}`.
+        ode_rtol        (*float*) relative tolerance of the integrator. Default is :math:`10^{-6}`.
+        t_min           (*float*) minimum time. Default is :math:`0.0`.
+        t_max           (*float*) maximum time. Default is :math:`1000.0`.
+        t_dim           (*int*) number of points in time. Default is :math:`10001`.
+        t_index_max     (*int*) index of the time after the window of the reductions. Default is ``None`` for ``t_dim``.
+        t_index_min     (*int*) index of the first time in the window of the reductions. Default is :math:`0`.
+        t_num_chunk     (*int*) number of times integrated together before they are reduced. Default is :math:`1000`.
+        use_jacobian    (*bool*) option to use the analytic Jacobian of the system, if available. The ``'vode'`` integrator then switches to its BDF method, which pays off only for stiff systems. Default is ``False``.
+        use_packed      (*bool*) option to evolve and store only the upper triangles of the symmetric correlations, in which case ``Corrs`` is an instance of :class:`utils.matrices.PackedSymmetricMatrices` unpacked only at the indexed times. Default is ``False``.
+        use_templates   (*bool*) option to use the templates of the drift and noise matrices of the system, if available. Default is ``True``.
+        ============    ====================================================
+    """
+
+    # default parameters of the solver
+    solver_defaults = {
+        'conv_num'      : 1,
+        'conv_period'   : None,
+        'conv_tol'      : 1e-6,
+        'indices'       : [0],
+        'iv_corrs'      : None,
+        'iv_modes'      : None,
+        'ode_atol'      : 1e-12,
+        'ode_method'    : 'vode',
+        'ode_nsteps'    : 100000,
+        'ode_rtol'      : 1e-6,
+        't_min'         : 0.0,
+        't_max'         : 1000.0,
+        't_dim'         : 10001,
+        't_index_max'   : None,
+        't_index_min'   : 0,
+        't_num_chunk'   : 1000,
+        'use_jacobian'  : False,
+        'use_packed'    : False,
+        'use_templates' : True
+    }
+
+    # methods of scipy.integrate.ode
+    methods_ode = ['vode', 'lsoda', 'dopri5', 'dop853']
+    # methods of scipy.integrate.solve_ivp
+    methods_ivp = ['BDF', 'LSODA', 'Radau', 'RK45', 'DOP853']
+    # methods of scipy.integrate.solve_ivp accepting a Jacobian
+    methods_ivp_jac = ['BDF', 'LSODA', 'Radau']
+    # methods of exact propagation
+    methods_exact = ['expm']
+
+    def __init__(self, system, params={}):
+        """Class constructor for HLEIntegrator."""
+
+        # set attributes
+        self.system = system
+        self.params = dict()
+        for key in self.solver_defaults:
+            self.params[key] = params.get(key, self.solver_defaults[key])
+
+        # validate method
+        assert self.params['ode_method'] in self.methods_ode + self.methods_ivp + self.methods_exact, "Parameter ``'ode_method'`` should be one of {}".format(self.methods_ode + self.methods_ivp + self.methods_exact)
+
+        # times
+        self.T = np.linspace(self.params['t_min'], self.params['t_max'], self.params['t_dim'])
+
+        # initialize results
+        self.Modes = None
+        self.Corrs = None
+        self.stats = dict()
+        self.t_final = None
+        self.v_final = None
+
+    def get_corr_indices(self):
+        """Method to obtain the correlations at the indices given in ``params``.
+
+        Returns
+        -------
+        corrs : numpy.ndarray
+            Correlations with shape ``(t_dim, len(indices))``.
+        """
+
+        # get correlations
+        Corrs = self.get_corrs()
+
+        return np.transpose([Corrs[:, idx[0], idx[1]] for idx in self.params['indices']])
+
+    def get_corrs(self):
+        """Method to obtain the quantum correlations.
+
+        Returns
+        -------
+        Corrs : numpy.ndarray or :class:`utils.matrices.PackedSymmetricMatrices`
+            Quantum correlations with shape ``(t_dim, 2 * num_modes, 2 * num_modes)``.
+        """
+
+        return self.get_modes_corrs()[1]
+
+    def get_func_A_D(self, c):
+        """Method to obtain the function for the drift and noise matrices of the system.
+
+        If the system defines ``get_templates_A_D(c)`` and the templates are enabled, the noise matrix and the constant entries of the drift matrix are obtained once and only the variable entries of the drift matrix are updated in each call. The returned matrices are then reused between the calls.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+
+        Returns
+        -------
+        func_A_D : callable
+            Drift and noise matrices formatted as ``func_A_D(modes, corrs, t)``.
+        """
+
+        # templates of the drift and noise matrices
+        if self.params['use_templates'] and getattr(self.system, 'get_templates_A_D', None) is not None:
+            A, (rows, cols), func_A, D = self.system.get_templates_A_D(
+                c=c
+            )
+            A = np.array(A, dtype=np.float_)
+            # flat view of the drift matrix
+            A_flat = np.reshape(A, -1)
+            idxs_flat = np.asarray(rows) * np.shape(A)[1] + np.asarray(cols)
+            def func_A_D(modes, corrs, t):
+                # update the variable entries only
+                A_flat[idxs_flat] = func_A(modes, t)
+                return A, D
+        # drift and noise matrices of the system
+        else:
+            func_A_D = lambda modes, corrs, t: (self.system.get_A(modes, c, t), self.system.get_D(modes, corrs, c, t))
+
+        return func_A_D
+
+    def get_func_rates(self, c):
+        """Method to obtain the right-hand side and the Jacobian of the real-valued system of equations.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+
+        Returns
+        -------
+        func_rates : callable
+            Rates formatted as ``func_rates(t, v)``.
+        func_jac : callable or None
+            Jacobian formatted as ``func_jac(t, v)``, or ``None`` if unavailable or disabled.
+        """
+
+        # extract frequently used variables
+        n = self.system.num_modes
+        dim = 2 * n
+        is_packed = self.params['use_packed']
+        # indices of the upper triangle of the correlations
+        rows, cols = np.triu_indices(dim)
+
+        # map from the packed to the full state
+        if is_packed:
+            # positions of the packed elements and of their transposes
+            idxs_upper = np.concatenate((np.arange(dim), dim + rows * dim + cols))
+            idxs_lower = np.concatenate((np.arange(dim), dim + cols * dim + rows))
+            is_off_diagonal = np.concatenate((np.zeros(dim, dtype=np.bool_), rows != cols))
+
+            def get_v_full(v):
+                v_full = np.empty(dim + dim**2, dtype=np.float_)
+                v_full[idxs_upper] = v
+                v_full[idxs_lower] = v
+                return v_full
+
+        # fused rates of the system
+        if getattr(self.system, 'get_rates_modes_corrs', None) is not None:
+            if is_packed:
+                func_rates = lambda t, v: self.system.get_rates_modes_corrs(t, get_v_full(v), c)[idxs_upper]
+            else:
+                func_rates = lambda t, v: self.system.get_rates_modes_corrs(t, v, c)
+        # rates from the modes, drift and noise matrices
+        else:
+            func_A_D = self.get_func_A_D(
+                c=c
+            )
+            def func_rates(t, v):
+                modes = v[:n] + 1.0j * v[n:dim]
+                if is_packed:
+                    corrs = np.empty((dim, dim), dtype=np.float_)
+                    corrs[rows, cols] = v[dim:]
+                    corrs[cols, rows] = v[dim:]
+                else:
+                    corrs = np.reshape(v[dim:], (dim, dim))
+                mode_rates = self.system.get_mode_rates(modes, c, t)
+                A, D = func_A_D(modes, corrs, t)
+                AV = A.dot(corrs)
+                # only the upper triangle of the symmetric rates
+                if is_packed:
+                    corr_rates = AV[rows, cols] + AV[cols, rows] + D[rows, cols]
+                else:
+                    corr_rates = np.ravel(AV + np.transpose(AV) + D)
+                return np.concatenate((np.real(mode_rates), np.imag(mode_rates), corr_rates))
+
+        # analytic Jacobian of the system
+        func_jac = None
+        if self.params['use_jacobian'] and getattr(self.system, 'get_jacobian_modes_corrs', None) is not None:
+            if is_packed:
+                def func_jac(t, v):
+                    J = self.system.get_jacobian_modes_corrs(t, get_v_full(v), c)[idxs_upper]
+                    # each off-diagonal element enters both triangles
+                    return J[:, idxs_upper] + J[:, idxs_lower] * is_off_diagonal
+            else:
+                func_jac = lambda t, v: self.system.get_jacobian_modes_corrs(t, v, c)
+
+        return func_rates, func_jac
+
+    def get_ivc(self):
+        """Method to obtain the real-valued initial values and the derived constants and controls.
+
+        Returns
+        -------
+        v_0 : numpy.ndarray
+            Real-valued initial values.
+        c : numpy.ndarray
+            Derived constants and controls.
+        """
+
+        # get initial values and constants of the system
+        iv_modes, iv_corrs, c = self.system.get_ivc()
+        iv_modes = iv_modes if self.params['iv_modes'] is None else np.asarray(self.params['iv_modes'], dtype=np.complex_)
+        iv_corrs = iv_corrs if self.params['iv_corrs'] is None else np.asarray(self.params['iv_corrs'], dtype=np.float_)
+
+        # real-valued initial values
+        v_0 = np.concatenate((np.real(iv_modes), np.imag(iv_modes), get_packed(np.asarray(iv_corrs)) if self.params['use_packed'] else np.ravel(iv_corrs))).astype(np.float_)
+
+        return v_0, c
+
+    def get_mode_indices(self):
+        """Method to obtain the modes at the indices given in ``params``.
+
+        Returns
+        -------
+        modes : numpy.ndarray
+            Modes with shape ``(t_dim, len(indices))``.
+        """
+
+        # get modes
+        Modes = self.get_modes()
+
+        return Modes[:, self.params['indices']]
+
+    def get_modes(self):
+        """Method to obtain the classical modes.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(t_dim, num_modes)``.
+        """
+
+        return self.get_modes_corrs()[0]
+
+    def get_modes_corrs(self):
+        """Method to obtain the classical modes and the quantum correlations.
+
+        The results are evaluated on the first call and reused afterwards. The numbers of evaluations of the rates and the Jacobian and the wall time are stored in ``stats``.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(t_dim, num_modes)``.
+        Corrs : numpy.ndarray or :class:`utils.matrices.PackedSymmetricMatrices`
+            Quantum correlations with shape ``(t_dim, 2 * num_modes, 2 * num_modes)``.
+        """
+
+        # reuse results
+        if self.Modes is not None:
+            return self.Modes, self.Corrs
+
+        # extract frequently used variables
+        n = self.system.num_modes
+        dim = 2 * n
+
+        # get initial values and constants
+        v_0, c = self.get_ivc()
+
+        # integrate
+        self.stats = dict()
+        vs = self.get_vs(
+            v_0=v_0,
+            c=c
+        )
+
+        # extract modes and correlations
+        self.Modes = vs[:, :n] + 1.0j * vs[:, n:dim]
+        self.Corrs = PackedSymmetricMatrices(vs[:, dim:]) if self.params['use_packed'] else np.reshape(vs[:, dim:], (len(self.T), dim, dim))
+
+        return self.Modes, self.Corrs
+
+    def get_modes_corrs_asymptotic(self):
+        """Method to obtain the classical modes and the quantum correlations after the convergence to a fixed point or a periodic orbit.
+
+        The states are compared at the ends of successive periods of ``conv_period`` while integrating over the times of the solver, and the integration stops after recording ``conv_num`` periods at the times of the solver once the change is within ``conv_tol``. Without convergence before ``t_max``, the full trajectory is returned. The time of convergence, the time saved, the convergence flag and the numbers of evaluations of the rates and the Jacobian and the wall time are stored in ``stats``.
+
+        Returns
+        -------
+        T : numpy.ndarray
+            Times of the recorded states.
+        Modes : numpy.ndarray
+            Classical modes with shape ``(len(T), num_modes)``.
+        Corrs : numpy.ndarray or :class:`utils.matrices.PackedSymmetricMatrices`
+            Quantum correlations with shape ``(len(T), 2 * num_modes, 2 * num_modes)``.
+        """
+
+        # extract frequently used variables
+        n = self.system.num_modes
+        dim = 2 * n
+        T = self.T
+        dt = T[1] - T[0]
+        P = self.params['conv_period'] if self.params['conv_period'] is not None else self.params['t_num_chunk'] * dt
+        num_record = int(np.ceil(self.params['conv_num'] * P / dt - 1e-9))
+
+        # get initial values and constants
+        v_0, c = self.get_ivc()
+        self.stats = dict()
+
+        # initialize values at the times of the solver
+        vs = np.zeros((len(T), len(v_0)), dtype=np.float_)
+        vs[0] = v_0
+
+        # integrate over successive periods including the times of the solver
+        t = T[0]
+        i_0 = 1
+        is_converged = False
+        while t < T[-1]:
+            t_P = min(t + P, T[-1])
+            i_P = int(np.searchsorted(T, t_P + 1e-9 * dt, side='right'))
+            vs_P = self.get_vs(
+                v_0=v_0,
+                c=c,
+                T=np.concatenate(([t], T[i_0:i_P], [t_P]))
+            )
+            vs[i_0:i_P] = vs_P[1:-1]
+            is_converged = t_P == t + P and np.max(np.abs(vs_P[-1] - v_0)) <= self.params['conv_tol'] * max(1.0, np.max(np.abs(vs_P[-1])))
+            v_0 = vs_P[-1]
+            t = t_P
+            i_0 = i_P
+            if is_converged:
+                break
+
+        # record the periods after convergence
+        if is_converged:
+            i_record = min(i_0 + num_record, len(T))
+            if i_record > i_0:
+                vs[i_0:i_record] = self.get_vs(
+                    v_0=v_0,
+                    c=c,
+                    T=np.concatenate(([t], T[i_0:i_record]))
+                )[1:]
+            T_record = T[i_0:i_record] if i_record > i_0 else T[i_0 - 1:i_0]
+            vs = vs[i_0:i_record] if i_record > i_0 else vs[i_0 - 1:i_0]
+        # full trajectory without convergence
+        else:
+            T_record = T
+
+        # extract modes and correlations
+        Modes = vs[:, :n] + 1.0j * vs[:, n:dim]
+        Corrs = PackedSymmetricMatrices(vs[:, dim:]) if self.params['use_packed'] else np.reshape(vs[:, dim:], (len(T_record), dim, dim))
+
+        # update stats
+        self.stats.update({
+            'is_converged'  : is_converged,
+            't_converged'   : t if is_converged else np.NaN,
+            't_saved'       : T[-1] - T_record[-1]
+        })
+
+        return T_record, Modes, Corrs
+
+    def get_reductions(self, func=None, reducers=['mean'], t_indices=[]):
+        """Method to obtain the reductions of the values at the times in the window without storing the trajectory.
+
+        The times are integrated in chunks of ``t_num_chunk`` and the values at the times of each chunk within the window are reduced into running accumulators before the chunk is discarded. The numbers of evaluations of the rates and the Jacobian and the wall time are stored in ``stats``.
+
+        Parameters
+        ----------
+        func : callable, optional
+            Function returning the values for a chunk of times, formatted as ``func(Modes, Corrs)``, where ``Modes`` and ``Corrs`` have shapes ``(num_times, num_modes)`` and ``(num_times, 2 * num_modes, 2 * num_modes)`` and the values have shape ``(num_times, ...)``. Default is the correlations at the indices given in ``params`` if they are tuples and the modes otherwise.
+        reducers : list, optional
+            Reductions over the window. Options are ``'mean'``, ``'min'``, ``'max'``, ``'argmin'`` and ``'argmax'``, where the latter two give the indices of the times. Default is ``['mean']``.
+        t_indices : list, optional
+            Indices of the times at which the values are retained, each in the range ``[0, t_dim)``. Default is ``[]``.
+
+        Returns
+        -------
+        reductions : dict
+            Reduced values with shape ``(...)`` for each reducer, along with the values at the retained times with shape ``(len(t_indices), ...)`` for the key ``'values'`` if ``t_indices`` is not empty.
+        """
+
+        # validate reducers
+        for reducer in reducers:
+            assert reducer in ['mean', 'min', 'max', 'argmin', 'argmax'], "Reducer ``'{}'`` should be one of ``'mean'``, ``'min'``, ``'max'``, ``'argmin'`` and ``'argmax'``".format(reducer)
+
+        # extract frequently used variables
+        n = self.system.num_modes
+        dim = 2 * n
+        i_min = self.params['t_index_min']
+        i_max = len(self.T) if self.params['t_index_max'] is None else self.params['t_index_max']
+        t_indices = list(t_indices)
+
+        # validate window and retained times
+        if len(reducers) > 0:
+            assert 0 <= i_min < i_max <= len(self.T), "Parameters ``'t_index_min'`` and ``'t_index_max'`` should satisfy ``0 <= t_index_min < t_index_max <= t_dim`` for a non-empty window, got {} and {} with ``t_dim`` {}".format(i_min, i_max, len(self.T))
+        for i in t_indices:
+            assert 0 <= i < len(self.T), "Indices ``t_indices`` should lie in ``[0, t_dim)``, got {} with ``t_dim`` {}".format(i, len(self.T))
+
+        # default values
+        if func is None:
+            indices = self.params['indices']
+            if all(type(idx) is tuple for idx in indices):
+                func = lambda Modes, Corrs: np.transpose([Corrs[:, idx[0], idx[1]] for idx in indices])
+            else:
+                func = lambda Modes, Corrs: Modes[:, indices]
+
+        # get initial values and constants
+        v_0, c = self.get_ivc()
+
+        # initialize accumulators
+        self.stats = dict()
+        accumulators = {
+            'count' : 0,
+            'values': dict()
+        }
+
+        # function to reduce the values at the new times
+        def reduce(vs, idxs):
+            # times in the window or retained
+            is_window = (idxs >= i_min) & (idxs < i_max)
+            is_selected = is_window | np.isin(idxs, t_indices)
+            if not np.any(is_selected):
+                return
+            vs = vs[is_selected]
+            is_window = is_window[is_selected]
+            idxs = idxs[is_selected]
+
+            # values at the selected times
+            Modes = vs[:, :n] + 1.0j * vs[:, n:dim]
+            Corrs = get_unpacked(vs[:, dim:]) if self.params['use_packed'] else np.reshape(vs[:, dim:], (-1, dim, dim))
+            values = np.asarray(func(Modes, Corrs))
+
+            # retain values
+            for k in np.flatnonzero(np.isin(idxs, t_indices)):
+                accumulators['values'][idxs[k]] = values[k]
+
+            if not np.any(is_window):
+                return
+
+            # update accumulators
+            values = values[is_window]
+            idxs = idxs[is_window]
+            accumulators['count'] += len(idxs)
+            if 'mean' in reducers:
+                accumulators['sum'] = accumulators.get('sum', 0.0) + np.sum(values, axis=0)
+            for key, func_arg, func_cmp in [('min', np.argmin, np.less), ('max', np.argmax, np.greater)]:
+                if key in reducers or 'arg' + key in reducers:
+                    ks = func_arg(values, axis=0)
+                    extrema = np.take_along_axis(values, ks[np.newaxis], axis=0)[0]
+                    if key not in accumulators:
+                        accumulators[key] = extrema
+                        accumulators['arg' + key] = idxs[ks]
+                    else:
+                        is_updated = func_cmp(extrema, accumulators[key])
+                        accumulators[key] = np.where(is_updated, extrema, accumulators[key])
+                        accumulators['arg' + key] = np.where(is_updated, idxs[ks], accumulators['arg' + key])
+
+        # integrate in chunks up to the last required time
+        i_end = max([i_max] + [i + 1 for i in t_indices])
+        reduce(v_0[np.newaxis, :], np.arange(1))
+        for i_start in range(0, i_end - 1, self.params['t_num_chunk']):
+            i_stop = min(i_start + self.params['t_num_chunk'], i_end - 1)
+            vs = self.get_vs(
+                v_0=v_0,
+                c=c,
+                T=self.T[i_start:i_stop + 1]
+            )[1:]
+            v_0 = vs[-1]
+            reduce(vs, np.arange(i_start + 1, i_stop + 1))
+
+        # finalize reductions
+        reductions = dict()
+        for reducer in reducers:
+            reductions[reducer] = accumulators['sum'] / accumulators['count'] if reducer == 'mean' else accumulators[reducer]
+        if len(t_indices) > 0:
+            reductions['values'] = np.array([accumulators['values'][i] for i in t_indices])
+
+        return reductions
+
+    def get_times(self):
+        """Method to obtain the times.
+
+        Returns
+        -------
+        T : numpy.ndarray
+            Times.
+        """
+
+        return self.T
+
+    def get_vs(self, v_0, c, T=None):
+        """Method to integrate the real-valued system of equations over the times.
+
+        The last time and the values at the last time are stored in ``t_final`` and ``v_final`` to continue the integration.
+
+        Parameters
+        ----------
+        v_0 : numpy.ndarray
+            Initial values.
+        c : numpy.ndarray
+            Derived constants and controls.
+        T : numpy.ndarray, optional
+            Times starting with the time of the initial values. Default is the times of the solver.
+
+        Returns
+        -------
+        vs : numpy.ndarray
+            Values at all times with shape ``(len(T), len(v_0))``.
+        """
+
+        # extract frequently used variables
+        T = self.T if T is None else T
+
+        # exact propagation
+        if self.params['ode_method'] in self.methods_exact:
+            vs = self.get_vs_expm(
+                v_0=v_0,
+                c=c,
+                T=T
+            )
+        # integration
+        else:
+            # get functions
+            func_rates, func_jac = self.get_func_rates(
+                c=c
+            )
+
+            vs = self.get_vs_func(
+                func_rates=func_rates,
+                func_jac=func_jac,
+                v_0=v_0,
+                T=T
+            )
+
+        # update final state
+        self.t_final = T[-1]
+        self.v_final = vs[-1]
+
+        return vs
+
+    def get_vs_expm(self, v_0, c, T):
+        r"""Method to propagate the correlations exactly over a uniform set of times with constant drift and noise matrices.
+
+        The modes should be at a fixed point where the drift matrix :math:`A` and the noise matrix :math:`D` are constant. The correlations then follow :math:`V ( t + \Delta t ) = \Phi V ( t ) \Phi^{T} + Q` with :math:`\Phi = e^{A \Delta t}` and :math:`Q = \int_{0}^{\Delta t} e^{A s} D e^{A^{T} s} ds`, both obtained once from the exponential of a block matrix. The wall time is added to ``stats``.
+
+        Parameters
+        ----------
+        v_0 : numpy.ndarray
+            Initial values.
+        c : numpy.ndarray
+            Derived constants and controls.
+        T : numpy.ndarray
+            Uniformly spaced times starting with the time of the initial values.
+
+        Returns
+        -------
+        vs : numpy.ndarray
+            Values at all times with shape ``(len(T), len(v_0))``.
+        """
+
+        # extract frequently used variables
+        n = self.system.num_modes
+        dim = 2 * n
+        modes = v_0[:n] + 1.0j * v_0[n:dim]
+        corrs = get_unpacked(v_0[dim:]) if self.params['use_packed'] else np.reshape(v_0[dim:], (dim, dim))
+
+        # start timer
+        _start = time.perf_counter()
+
+        # validate fixed point
+        mode_rates = self.system.get_mode_rates(modes, c, T[0])
+        assert np.allclose(mode_rates, 0.0, rtol=0.0, atol=self.params['ode_rtol'] * max(1.0, np.max(np.abs(modes)))), "Method ``'expm'`` requires the initial modes to be at a fixed point"
+
+        # constant drift and noise matrices
+        A = np.array(self.system.get_A(modes, c, T[0]), dtype=np.float_)
+        D = np.array(self.system.get_D(modes, corrs, c, T[0]), dtype=np.float_)
+        for t in [T[1], T[-1]] if len(T) > 1 else []:
+            assert np.allclose(self.system.get_A(modes, c, t), A) and np.allclose(self.system.get_D(modes, corrs, c, t), D), "Method ``'expm'`` requires constant drift and noise matrices"
+
+        # initialize values
+        vs = np.zeros((len(T), len(v_0)), dtype=np.float_)
+        vs[:, :dim] = v_0[:dim]
+        Corrs = np.zeros((len(T), dim, dim), dtype=np.float_)
+        Corrs[0] = corrs
+
+        if len(T) > 1:
+            # validate times
+            dt = T[1] - T[0]
+            assert np.allclose(np.diff(T), dt), "Method ``'expm'`` requires uniformly spaced times"
+
+            # propagator and accumulated noise from the exponential of the block matrix
+            M = np.zeros((2 * dim, 2 * dim), dtype=np.float_)
+            M[:dim, :dim] = - A
+            M[:dim, dim:] = D
+            M[dim:, dim:] = np.transpose(A)
+            F = sl.expm(M * dt)
+            Phi = np.transpose(F[dim:, dim:])
+            Q = Phi.dot(F[:dim, dim:])
+            Q = (Q + np.transpose(Q)) / 2.0
+
+            # propagate over the times
+            Phi_T = np.transpose(Phi)
+            for i in range(1, len(T)):
+                Corrs[i] = Phi.dot(Corrs[i - 1]).dot(Phi_T) + Q
+        vs[:, dim:] = get_packed(Corrs) if self.params['use_packed'] else np.reshape(Corrs, (len(T), dim**2))
+
+        # update stats
+        self.stats['time'] = self.stats.get('time', 0.0) + time.perf_counter() - _start
+
+        return vs
+
+    def get_vs_func(self, func_rates, func_jac, v_0, T):
+        """Method to integrate a real-valued system of equations over a set of times.
+
+        The numbers of evaluations of the rates and the Jacobian and the wall time are added to ``stats``.
+
+        Parameters
+        ----------
+        func_rates : callable
+            Rates formatted as ``func_rates(t, v)``.
+        func_jac : callable or None
+            Jacobian formatted as ``func_jac(t, v)``.
+        v_0 : numpy.ndarray
+            Initial values.
+        T : numpy.ndarray
+            Times starting with the time of the initial values.
+
+        Returns
+        -------
+        vs : numpy.ndarray
+            Values at all times with shape ``(len(T), len(v_0))``.
+        """
+
+        # extract frequently used variables
+        method = self.params['ode_method']
+
+        # functions with counters
+        counts = {
+            'nfev'  : 0,
+            'njev'  : 0
+        }
+        def func(t, v):
+            counts['nfev'] += 1
+            return func_rates(t, v)
+        def jac(t, v):
+            counts['njev'] += 1
+            return func_jac(t, v)
+
+        # start timer
+        _start = time.perf_counter()
+
+        # scipy.integrate.ode
+        if method in self.methods_ode:
+            # initialize integrator
+            integrator = si.ode(func, jac if func_jac is not None else None)
+            kwargs = {
+                'atol'  : self.params['ode_atol'],
+                'rtol'  : self.params['ode_rtol'],
+                'nsteps': self.params['ode_nsteps']
+            }
+            if method == 'vode':
+                kwargs['method'] = 'bdf' if func_jac is not None else 'adams'
+            integrator.set_integrator(method, **kwargs)
+            integrator.set_initial_value(v_0, T[0])
+
+            # integrate over the times
+            vs = np.zeros((len(T), len(v_0)), dtype=np.float_)
+            vs[0] = v_0
+            for i in range(1, len(T)):
+                vs[i] = integrator.integrate(T[i])
+                assert integrator.successful(), 'Integration failed at t = {} with return code {}'.format(T[i], integrator.get_return_code())
+        # scipy.integrate.solve_ivp
+        else:
+            result = si.solve_ivp(
+                fun=func,
+                t_span=(T[0], T[-1]),
+                y0=v_0,
+                method=method,
+                t_eval=T,
+                atol=self.params['ode_atol'],
+                rtol=self.params['ode_rtol'],
+                **({'jac': jac} if func_jac is not None and method in self.methods_ivp_jac else {})
+            )
+            assert result.success, 'Integration failed: {}'.format(result.message)
+            vs = np.transpose(result.y)
+
+        # update stats
+        self.stats['nfev'] = self.stats.get('nfev', 0) + counts['nfev']
+        self.stats['njev'] = self.stats.get('njev', 0) + counts['njev']
+        self.stats['time'] = self.stats.get('time', 0.0) + time.perf_counter() - _start
+
+        return vs
+
+class FloquetSolver(HLEIntegrator):
+    r"""Class to obtain the asymptotic periodic modes and correlations of a periodically modulated system.
+
+    The modulation frequencies are taken from the parameters ``'Omega_norm'``, ``'Omega_norms'`` or ``'Omegas'`` of the system, and the rates of the modes and the drift matrix are checked to repeat over their common period. The periodic orbit of the modes is obtained by Newton iterations on the map over this period, starting after a few periods of transient dynamics. The monodromy matrix :math:`\Phi` of the drift matrix and the correlations :math:`Q` accumulated from zero over one period along this orbit then give the periodic correlations at the start of the period from the discrete Lyapunov equation :math:`V = \Phi V \Phi^{T} + Q`. A final integration over one period evaluates the modes and the correlations at the phases of the requested times and checks that both return to their values at the start of the period. The methods of :class:`HLEIntegrator` are inherited, so that the solver can replace the integration over the full duration.
+
+    Parameters
+    ----------
+    system : :class:`qom.systems.BaseSystem`
+        Instance of the system.
+    params : dict
+        Parameters for the solver. Along with the parameters of :class:`HLEIntegrator`, the solver parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        max_denominator     (*int*) maximum denominator of the ratios of the modulation frequencies, beyond which no common period exists. Default is :math:`1000`.
+        newton_max_iter     (*int*) maximum number of Newton iterations for the periodic orbit of the modes. Default is :math:`20`.
+        newton_tol          (*float*) tolerance of the residual of the periodic orbit relative to the norm of the modes. Default is :math:`10^{-9}`.
+        t_transient         (*int*) number of periods integrated before the Newton iterations. Default is :math:`10`.
+        ================    ====================================================
+    """
+
+    # default parameters of the solver
+    solver_defaults = {
+        **HLEIntegrator.solver_defaults,
+        'max_denominator'   : 1000,
+        'newton_max_iter'   : 20,
+        'newton_tol'        : 1e-9,
+        't_transient'       : 10
+    }
+
+    # parameters of the systems containing the modulation frequencies
+    keys_Omegas = ['Omega_norm', 'Omega_norms', 'Omegas']
+
+    def __init__(self, system, params={}):
+        """Class constructor for FloquetSolver."""
+
+        # initialize super class
+        super().__init__(
+            system=system,
+            params=params
+        )
+
+        # initialize results
+        self.period = self.get_period()
+        self.multipliers = None
+
+    def get_func_mode_rates(self, c):
+        """Method to obtain the rates of change of the real and imaginary parts of the modes without the correlations.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+
+        Returns
+        -------
+        func_rates : callable
+            Rates formatted as ``func_rates(t, x)``, where ``x`` contains the real parts of the modes followed by their imaginary parts.
+        """
+
+        # extract frequently used variables
+        n = self.system.num_modes
+
+        def func_rates(t, x):
+            mode_rates = self.system.get_mode_rates(x[:n] + 1.0j * x[n:], c, t)
+            return np.concatenate((np.real(mode_rates), np.imag(mode_rates)))
+
+        return func_rates
+
+    def get_modes_corrs(self):
+        """Method to obtain the asymptotic periodic modes and correlations at the times of the solver.
+
+        The results are evaluated on the first call and reused afterwards. The numbers of evaluations of the rates and the Jacobian, the wall time, the number of Newton iterations and the residual of the periodic orbit are stored in ``stats``. The Floquet multipliers of the correlations are stored in ``multipliers``, and the correlations are set to ``NaN`` if any of them lies on or outside the unit circle, in which case only the modes are integrated over the period.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(t_dim, num_modes)``.
+        Corrs : numpy.ndarray or :class:`utils.matrices.PackedSymmetricMatrices`
+            Quantum correlations with shape ``(t_dim, 2 * num_modes, 2 * num_modes)``.
+        """
+
+        # reuse results
+        if self.Modes is not None:
+            return self.Modes, self.Corrs
+
+        # validate period
+        assert np.isfinite(self.period), "Modulation frequencies {} should have a common period".format(self.get_Omegas())
+
+        # extract frequently used variables
+        n = self.system.num_modes
+        dim = 2 * n
+        P = self.period
+
+        # get initial values and constants
+        iv_modes, _, c = self.system.get_ivc()
+        iv_modes = iv_modes if self.params['iv_modes'] is None else np.asarray(self.params['iv_modes'], dtype=np.complex_)
+        self.stats = dict()
+
+        # validate that the rates repeat over the period
+        for t in np.linspace(0.0, P, 5, endpoint=False) + P / 7.0:
+            assert np.allclose(self.system.get_mode_rates(iv_modes, c, t + P), self.system.get_mode_rates(iv_modes, c, t)) and np.allclose(self.system.get_A(iv_modes, c, t + P), self.system.get_A(iv_modes, c, t)), "Rates of the system should repeat over the common period {} of the modulation frequencies {}".format(P, self.get_Omegas())
+
+        # periodic orbit of the modes
+        x = self.get_modes_periodic(
+            x_0=np.concatenate((np.real(iv_modes), np.imag(iv_modes))).astype(np.float_),
+            c=c
+        )
+
+        # monodromy matrix and correlations accumulated over one period
+        func_A_D = self.get_func_A_D(
+            c=c
+        )
+        def func_rates(t, v):
+            modes = v[:n] + 1.0j * v[n:dim]
+            Phi = np.reshape(v[dim:dim + dim**2], (dim, dim))
+            corrs = np.reshape(v[dim + dim**2:], (dim, dim))
+            mode_rates = self.system.get_mode_rates(modes, c, t)
+            A, D = func_A_D(modes, corrs, t)
+            return np.concatenate((np.real(mode_rates), np.imag(mode_rates), np.ravel(A.dot(Phi)), np.ravel(A.dot(corrs) + corrs.dot(np.transpose(A)) + D)))
+        v_P = self.get_vs_func(
+            func_rates=func_rates,
+            func_jac=None,
+            v_0=np.concatenate((x, np.ravel(np.eye(dim, dtype=np.float_)), np.zeros(dim**2, dtype=np.float_))),
+            T=np.array([0.0, P])
+        )[-1]
+        Phi = np.reshape(v_P[dim:dim + dim**2], (dim, dim))
+        Q = np.reshape(v_P[dim + dim**2:], (dim, dim))
+
+        # periodic correlations at the start of the period
+        self.multipliers = np.linalg.eigvals(Phi)
+        if np.max(np.abs(self.multipliers)) < 1.0:
+            corrs_0 = sl.solve_discrete_lyapunov(Phi, Q)
+            corrs_0 = (corrs_0 + np.transpose(corrs_0)) / 2.0
+        else:
+            corrs_0 = np.full((dim, dim), np.NaN, dtype=np.float_)
+
+        # evaluate over one period at the phases of the times
+        phases, idxs = np.unique(np.mod(self.T, P), return_inverse=True)
+        is_shifted = phases[0] > 0.0
+        T = np.concatenate(([0.0] if is_shifted else [], phases, [P]))
+        is_stable = np.all(np.isfinite(corrs_0))
+        if is_stable:
+            v_0 = np.concatenate((x, get_packed(corrs_0) if self.params['use_packed'] else np.ravel(corrs_0)))
+            vs = self.get_vs(
+                v_0=v_0,
+                c=c,
+                T=T
+            )
+        # modes only for unstable correlations
+        else:
+            v_0 = x
+            vs = self.get_vs_func(
+                func_rates=self.get_func_mode_rates(
+                    c=c
+                ),
+                func_jac=None,
+                v_0=v_0,
+                T=T
+            )
+
+        # validate that the orbit closes over the period
+        self.stats['closure_residual'] = np.linalg.norm(vs[-1] - v_0) / (1.0 + np.linalg.norm(v_0))
+        assert self.stats['closure_residual'] <= np.sqrt(self.params['ode_rtol']), "Orbit should close over the period {} with relative residual {}".format(P, self.stats['closure_residual'])
+        vs = vs[int(is_shifted):-1][idxs]
+
+        # unstable correlations
+        if not is_stable:
+            vs = np.concatenate((vs, np.full((len(vs), dim * (dim + 1) // 2 if self.params['use_packed'] else dim**2), np.NaN, dtype=np.float_)), axis=1)
+
+        # extract modes and correlations
+        self.Modes = vs[:, :n] + 1.0j * vs[:, n:dim]
+        self.Corrs = PackedSymmetricMatrices(vs[:, dim:]) if self.params['use_packed'] else np.reshape(vs[:, dim:], (len(self.T), dim, dim))
+
+        return self.Modes, self.Corrs
+
+    def get_modes_periodic(self, x_0, c):
+        """Method to obtain the real-valued modes at the start of their periodic orbit.
+
+        The Jacobian of the map over one period is obtained by finite differences.
+
+        Parameters
+        ----------
+        x_0 : numpy.ndarray
+            Initial values of the real and imaginary parts of the modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+
+        Returns
+        -------
+        x : numpy.ndarray
+            Real and imaginary parts of the modes at the start of the periodic orbit.
+        """
+
+        # extract frequently used variables
+        n = self.system.num_modes
+        P = self.period
+
+        # rates of the modes
+        func_rates = self.get_func_mode_rates(
+            c=c
+        )
+        # map over one period
+        func_map = lambda x: self.get_vs_func(
+            func_rates=func_rates,
+            func_jac=None,
+            v_0=x,
+            T=np.array([0.0, P])
+        )[-1]
+
+        # transient dynamics
+        x = self.get_vs_func(
+            func_rates=func_rates,
+            func_jac=None,
+            v_0=x_0,
+            T=np.arange(self.params['t_transient'] + 1) * P
+        )[-1]
+
+        # Newton iterations
+        for i in range(self.params['newton_max_iter']):
+            x_P = func_map(x)
+            residual = x_P - x
+            self.stats['newton_iter'] = i
+            self.stats['newton_residual'] = np.linalg.norm(residual)
+            if self.stats['newton_residual'] <= self.params['newton_tol'] * (1.0 + np.linalg.norm(x)):
+                break
+
+            # Jacobian of the map by finite differences
+            hs = 1e-7 * (1.0 + np.abs(x))
+            M = np.transpose([(func_map(x + hs[j] * np.eye(2 * n)[j]) - x_P) / hs[j] for j in range(2 * n)])
+
+            # update modes
+            x = x + np.linalg.lstsq(M - np.eye(2 * n), - residual, rcond=None)[0]
+
+        # validate convergence
+        assert self.stats['newton_residual'] <= self.params['newton_tol'] * (1.0 + np.linalg.norm(x)), "Periodic orbit of the modes should converge within {} Newton iterations, residual is {}".format(self.params['newton_max_iter'], self.stats['newton_residual'])
+
+        return x
+
+    def get_Omegas(self):
+        """Method to obtain the modulation frequencies of the system.
+
+        Returns
+        -------
+        Omegas : list
+            Frequencies in the parameters ``'Omega_norm'``, ``'Omega_norms'`` and ``'Omegas'`` of the system.
+        """
+
+        # extract frequencies
+        Omegas = list()
+        for key in self.keys_Omegas:
+            if key in self.system.params:
+                Omegas += [float(Omega) for Omega in np.ravel(self.system.params[key])]
+
+        # validate frequencies
+        assert len(Omegas) > 0, "System should have the modulation frequencies in one of the parameters {}".format(self.keys_Omegas)
+
+        return Omegas
+
+    def get_period(self):
+        """Method to obtain the common period of the modulation frequencies of the system.
+
+        The ratios of the frequencies to the first non-zero frequency are approximated by fractions with denominators up to ``max_denominator``.
+
+        Returns
+        -------
+        period : float
+            Common period, or ``numpy.inf`` if the frequencies are incommensurate.
+        """
+
+        # extract frequently used variables
+        Omegas = [np.abs(Omega) for Omega in self.get_Omegas() if Omega != 0.0]
+        if len(Omegas) == 0:
+            return np.inf
+
+        # rational ratios of the frequencies
+        ratios = [fractions.Fraction(Omega / Omegas[0]).limit_denominator(self.params['max_denominator']) for Omega in Omegas]
+        if np.any([np.abs(float(ratio) - Omega / Omegas[0]) > 1e-12 * Omega / Omegas[0] for ratio, Omega in zip(ratios, Omegas)]):
+            return np.inf
+
+        # fundamental frequency as a fraction of the first frequency
+        lcm = np.lcm.reduce([ratio.denominator for ratio in ratios])
+        gcd = np.gcd.reduce([ratio.numerator * lcm // ratio.denominator for ratio in ratios])
+
+        return 2.0 * np.pi * lcm / gcd / Omegas[0]
+
+class ContinuationSweeper():
+    r"""Class to sweep a parameter of a system in order by warm-starting each integration from the final state of the previous one.
+
+    The first value is integrated from the initial values of the system over the times of the solver. Each subsequent value is integrated from the final modes and correlations of the previous value, continuing the time, over a settling duration of ``warm_t_settle`` followed by the window of times from ``t_index_min`` to ``t_index_max`` of the solver. The stabilities of the steady states are obtained by the Routh-Hurwitz criterion from the coefficients of the characteristic equation given by ``get_coeffs_A`` of the system, or else from those of its drift matrix. A change in the number or the stabilities of the steady states between two values marks a bifurcation, across which the integration is started cold, as it is in the absence of a stable steady state. Within the windows of multistability, the warm starts follow the branch of the previous value. The system is initialized once and the swept parameter is rebound for the subsequent values.
+
+    Parameters
+    ----------
+    SystemClass : class
+        Class of the system.
+    func : callable
+        Function returning the values for an instance of :class:`HLEIntegrator`, formatted as ``func(solver)``, for example using its method ``get_reductions``.
+    params : dict
+        Parameters for the sweep. The sweep parameters are:
+        ================    ====================================================
+        key                 meaning
+        ================    ====================================================
+        use_stability       (*bool*) option to start cold across the changes in the stabilities of the steady states, for systems with the method ``get_modes_steady_state``. Default is ``True``.
+        warm_t_settle       (*float*) duration of the settling before the window of times for the warm starts. Default is :math:`100.0`.
+        X                   (*dict*) axis with keys ``'var'`` and ``'idx'`` for the name and the index of the parameter, and ``'min'``, ``'max'`` and ``'dim'`` or ``'val'`` for its values. Default is ``{}``.
+        ================    ====================================================
+    params_system : dict
+        Parameters for the system.
+    params_solver : dict
+        Parameters for :class:`HLEIntegrator`.
+    """
+
+    # default parameters of the sweep
+    sweep_defaults = {
+        'use_stability' : True,
+        'warm_t_settle' : 100.0,
+        'X'             : {}
+    }
+
+    def __init__(self, SystemClass, func, params={}, params_system={}, params_solver={}):
+        """Class constructor for ContinuationSweeper."""
+
+        # set attributes
+        self.SystemClass = SystemClass
+        self.func = func
+        self.params = dict()
+        for key in self.sweep_defaults:
+            self.params[key] = params.get(key, self.sweep_defaults[key])
+        self.params_system = params_system
+        self.params_solver = {**HLEIntegrator.solver_defaults, **params_solver}
+
+        # axis
+        axis = self.params['X']
+        self.axes = {
+            'X': {
+                'var'   : axis['var'],
+                'idx'   : axis.get('idx', None),
+                'val'   : np.array(axis['val'], dtype=np.float_) if 'val' in axis else np.linspace(axis['min'], axis['max'], axis['dim'])
+            }
+        }
+
+        # initialize results
+        self.results = None
+        self.stats = dict()
+
+    def get_results(self):
+        """Method to obtain the values at all the values of the parameter.
+
+        The results are evaluated on the first call and reused afterwards. The warm starts and the wall time are stored in ``stats``.
+
+        Returns
+        -------
+        V : numpy.ndarray
+            Values with shape ``(dim, ...)``.
+        """
+
+        # reuse results
+        if self.results is not None:
+            return self.results['V']
+
+        # extract frequently used variables
+        axis = self.axes['X']
+        T = np.linspace(self.params_solver['t_min'], self.params_solver['t_max'], self.params_solver['t_dim'])
+        dt = T[1] - T[0]
+        i_min = self.params_solver['t_index_min']
+        i_max = len(T) if self.params_solver['t_index_max'] is None else self.params_solver['t_index_max']
+        num_settle = int(np.round(self.params['warm_t_settle'] / dt))
+
+        # initialize values
+        _start = time.perf_counter()
+        V = list()
+        is_warm = np.zeros(len(axis['val']), dtype=np.bool_)
+        system = None
+        solver = None
+        stabilities_prev = None
+
+        for i, x in enumerate(axis['val']):
+            # update parameter
+            system_params = dict(self.params_system)
+            if axis['idx'] is None:
+                system_params[axis['var']] = x
+            else:
+                system_params[axis['var']] = list(system_params[axis['var']])
+                system_params[axis['var']][axis['idx']] = x
+            if system is None:
+                system = self.SystemClass(
+                    params=system_params
+                )
+            else:
+                system.rebind(
+                    params={axis['var']: system_params[axis['var']]}
+                )
+
+            # check bifurcations
+            stabilities = self.get_stabilities_steady_state(
+                system=system
+            ) if self.params['use_stability'] else None
+            is_warm[i] = solver is not None and solver.t_final is not None and np.all(np.isfinite(solver.v_final)) and ((stabilities is None and stabilities_prev is None) or (stabilities is not None and stabilities_prev is not None and np.any(stabilities) and np.array_equal(stabilities, stabilities_prev)))
+            stabilities_prev = stabilities
+
+            # warm start from the final state
+            params_solver = self.params_solver
+            if is_warm[i]:
+                n = system.num_modes
+                dim = 2 * n
+                v = solver.v_final
+                params_solver = {
+                    **self.params_solver,
+                    'iv_modes'      : v[:n] + 1.0j * v[n:dim],
+                    'iv_corrs'      : get_unpacked(v[dim:]) if self.params_solver['use_packed'] else np.reshape(v[dim:], (dim, dim)),
+                    't_min'         : solver.t_final,
+                    't_max'         : solver.t_final + (num_settle + i_max - i_min - 1) * dt,
+                    't_dim'         : num_settle + i_max - i_min,
+                    't_index_min'   : num_settle,
+                    't_index_max'   : None
+                }
+
+            # get values
+            solver = HLEIntegrator(
+                system=system,
+                params=params_solver
+            )
+            V.append(self.func(solver))
+
+        # update results
+        self.results = {
+            'V' : np.array(V)
+        }
+        self.stats = {
+            'is_warm'   : is_warm,
+            'time'      : time.perf_counter() - _start
+        }
+
+        return self.results['V']
+
+    def get_stabilities_steady_state(self, system):
+        """Method to obtain the sorted Routh-Hurwitz stabilities of the steady states of a system.
+
+        Parameters
+        ----------
+        system : :class:`qom.systems.BaseSystem`
+            Instance of the system.
+
+        Returns
+        -------
+        stabilities : numpy.ndarray
+            Sorted stabilities of the steady states, or ``None`` if the system does not have the method ``get_modes_steady_state``.
+        """
+
+        # validate system
+        if getattr(system, 'get_modes_steady_state', None) is None:
+            return None
+
+        # extract frequently used variables
+        _, _, c = system.get_ivc()
+        t = self.params_solver['t_min']
+
+        # coefficients of the characteristic equation for each steady state
+        Modes = np.reshape(system.get_modes_steady_state(
+            c=c
+        ), (-1, system.num_modes))
+        coeffs = [system.get_coeffs_A(modes, c, t) if getattr(system, 'get_coeffs_A', None) is not None else np.poly(system.get_A(modes, c, t)) for modes in Modes]
+
+        return np.sort(get_stabilities(np.real(np.array(coeffs, dtype=np.complex_))))
+
+class EnsembleIntegrator():
+    r"""Class to integrate the classical modes and the quantum correlations of a system for all the values of a parameter together.
+
+    The system is rebound to each of the ``K`` values of the axis and its parameters are stacked into arrays with leading dimension ``K``, which are passed to the methods ``get_mode_rates_ensemble``, ``get_A_ensemble`` and ``get_D_ensemble`` of the system. The real-valued states of all the members are stacked into a single state of size ``K * num_vars``, which is advanced by one integrator of :class:`HLEIntegrator` with a shared step size, so that the number of calls of the rates is nearly independent of ``K``. The error is controlled by the norm of the stacked state. The times are integrated in chunks of ``t_num_chunk`` and only the values within the window are stored.
+
+    Parameters
+    ----------
+    SystemClass : class
+        Class of the system.
+    params : dict
+        Parameters for the ensemble. The ensemble parameters are:
+        ============    ====================================================
+        key             meaning
+        ============    ====================================================
+        X               (*dict*) axis with keys ``'var'`` and ``'idx'`` for the name and the index of the parameter, and ``'min'``, ``'max'`` and ``'dim'`` or ``'val'`` for its values. Default is ``{}``.
+        ============    ====================================================
+    params_system : dict
+        Parameters for the system.
+    params_solver : dict
+        Parameters for :class:`HLEIntegrator`. The Jacobian and the packed correlations are not used, and the method ``'expm'`` is not supported.
+    """
+
+    # default parameters of the ensemble
+    ensemble_defaults = {
+        'X' : {}
+    }
+
+    def __init__(self, SystemClass, params={}, params_system={}, params_solver={}):
+        """Class constructor for EnsembleIntegrator."""
+
+        # set attributes
+        self.SystemClass = SystemClass
+        self.params = dict()
+        for key in self.ensemble_defaults:
+            self.params[key] = params.get(key, self.ensemble_defaults[key])
+        self.params_system = params_system
+        self.params_solver = {**HLEIntegrator.solver_defaults, **params_solver, 'use_jacobian': False, 'use_packed': False}
+
+        # validate method
+        assert self.params_solver['ode_method'] in HLEIntegrator.methods_ode + HLEIntegrator.methods_ivp, "Parameter ``'ode_method'`` should be one of {}".format(HLEIntegrator.methods_ode + HLEIntegrator.methods_ivp)
+
+        # axis
+        axis = self.params['X']
+        self.axes = {
+            'X': {
+                'var'   : axis['var'],
+                'idx'   : axis.get('idx', None),
+                'val'   : np.array(axis['val'], dtype=np.float_) if 'val' in axis else np.linspace(axis['min'], axis['max'], axis['dim'])
+            }
+        }
+
+        # times
+        self.T = np.linspace(self.params_solver['t_min'], self.params_solver['t_max'], self.params_solver['t_dim'])
+
+        # initialize results
+        self.system = None
+        self.Modes = None
+        self.Corrs = None
+        self.stats = dict()
+
+    def get_func_rates(self, c):
+        """Method to obtain the rates of the stacked real-valued systems of equations of the members.
+
+        Parameters
+        ----------
+        c : dict
+            Stacked parameters of the members.
+
+        Returns
+        -------
+        func_rates : callable
+            Rates of the stacked state with shape ``(K * num_vars, )``, formatted as ``func_rates(t, v)``.
+        """
+
+        # extract frequently used variables
+        system = self.system
+        n = system.num_modes
+        dim = 2 * n
+        K = len(self.axes['X']['val'])
+        ts = np.zeros(K, dtype=np.float_)
+
+        def func_rates(t, v):
+            # modes and correlations of the members
+            vs = np.reshape(v, (K, -1))
+            modes = vs[:, :n] + 1.0j * vs[:, n:dim]
+            corrs = np.reshape(vs[:, dim:], (K, dim, dim))
+            ts.fill(t)
+
+            # rates of the modes, drift and noise matrices
+            mode_rates = system.get_mode_rates_ensemble(modes, c, ts)
+            A = system.get_A_ensemble(modes, c, ts)
+            D = system.get_D_ensemble(modes, corrs, c, ts)
+
+            # symmetric correlations satisfy V A^T = ( A V )^T
+            AV = np.matmul(A, corrs)
+            corr_rates = AV + np.swapaxes(AV, 1, 2) + D
+
+            return np.ravel(np.concatenate((np.real(mode_rates), np.imag(mode_rates), np.reshape(corr_rates, (K, dim**2))), axis=1))
+
+        return func_rates
+
+    def get_ivc(self):
+        """Method to obtain the stacked real-valued initial values and parameters of the members.
+
+        The system is initialized with the parameters of the first value and rebound to the remaining ones.
+
+        Returns
+        -------
+        v_0 : numpy.ndarray
+            Stacked real-valued initial values with shape ``(K * num_vars, )``.
+        c : dict
+            Parameters of the members as arrays with leading dimension ``K``.
+        """
+
+        # extract frequently used variables
+        axis = self.axes['X']
+        system_params = dict(self.params_system)
+
+        vs_0 = list()
+        values = list()
+        for x in axis['val']:
+            # update parameter
+            if axis['idx'] is None:
+                system_params[axis['var']] = x
+            else:
+                system_params[axis['var']] = list(system_params[axis['var']])
+                system_params[axis['var']][axis['idx']] = x
+            if self.system is None:
+                self.system = self.SystemClass(
+                    params=system_params
+                )
+            else:
+                self.system.rebind(
+                    params={axis['var']: system_params[axis['var']]}
+                )
+            values.append(self.system.params.values())
+
+            # initial values of the member
+            iv_modes, iv_corrs, _ = self.system.get_ivc()
+            iv_modes = iv_modes if self.params_solver['iv_modes'] is None else np.asarray(self.params_solver['iv_modes'], dtype=np.complex_)
+            iv_corrs = iv_corrs if self.params_solver['iv_corrs'] is None else np.asarray(self.params_solver['iv_corrs'], dtype=np.float_)
+            vs_0.append(np.concatenate((np.real(iv_modes), np.imag(iv_modes), np.ravel(iv_corrs))))
+
+        # stack parameters
+        c = {key: np.array([vals[i] for vals in values]) for i, key in enumerate(self.system.params)}
+
+        return np.ravel(np.array(vs_0, dtype=np.float_)), c
+
+    def get_modes_corrs(self):
+        """Method to obtain the classical modes and the quantum correlations of all the members within the window of times.
+
+        The results are evaluated on the first call and reused afterwards. The numbers of evaluations of the rates and the wall time are stored in ``stats``.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Classical modes with shape ``(K, t_index_max - t_index_min, num_modes)``.
+        Corrs : numpy.ndarray
+            Quantum correlations with shape ``(K, t_index_max - t_index_min, 2 * num_modes, 2 * num_modes)``.
+        """
+
+        # reuse results
+        if self.Modes is not None:
+            return self.Modes, self.Corrs
+
+        # extract frequently used variables
+        K = len(self.axes['X']['val'])
+        i_min = self.params_solver['t_index_min']
+        i_max = len(self.T) if self.params_solver['t_index_max'] is None else self.params_solver['t_index_max']
+
+        # get initial values and parameters
+        v_0, c = self.get_ivc()
+        n = self.system.num_modes
+        dim = 2 * n
+
+        # integrator of the stacked state
+        solver = HLEIntegrator(
+            system=self.system,
+            params=self.params_solver
+        )
+        func_rates = self.get_func_rates(
+            c=c
+        )
+
+        # integrate in chunks and store the values within the window
+        vs = np.zeros((max(i_max - i_min, 0), len(v_0)), dtype=np.float_)
+        if i_min == 0 and i_max > 0:
+            vs[0] = v_0
+        for i_start in range(0, i_max - 1, self.params_solver['t_num_chunk']):
+            i_stop = min(i_start + self.params_solver['t_num_chunk'], i_max - 1)
+            vs_chunk = solver.get_vs_func(
+                func_rates=func_rates,
+                func_jac=None,
+                v_0=v_0,
+                T=self.T[i_start:i_stop + 1]
+            )[1:]
+            v_0 = vs_chunk[-1]
+            i_0 = max(i_start + 1, i_min)
+            if i_stop >= i_0:
+                vs[i_0 - i_min:i_stop + 1 - i_min] = vs_chunk[i_0 - i_start - 1:]
+
+        # extract modes and correlations of the members
+        vs = np.swapaxes(np.reshape(vs, (len(vs), K, -1)), 0, 1)
+        self.Modes = vs[:, :, :n] + 1.0j * vs[:, :, n:dim]
+        self.Corrs = np.reshape(vs[:, :, dim:], (K, len(vs[0]), dim, dim))
+
+        # update stats
+        self.stats = solver.stats
+
+        return self.Modes, self.Corrs
+
+    def get_times(self):
+        """Method to obtain the times within the window.
+
+        Returns
+        -------
+        T : numpy.ndarray
+            Times from ``t_index_min`` to ``t_index_max``.
+        """
+
+        return self.T[self.params_solver['t_index_min']:self.params_solver['t_index_max']]
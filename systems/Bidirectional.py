@@ -6,7 +6,7 @@
 __authors__ = ["Sampreet Kalita"]
 __toolbox__ = 'qom-v1.0.1'
 __created__ = "2020-06-03"
-__updated__ = "2024-01-09"
+__updated__ = "2026-10-18"
 
 # dependencies
 import numpy as np
@@ -14,7 +14,10 @@ import numpy as np
 # qom modules
 from qom.systems import BaseSystem
 
-class Bi_00(BaseSystem):
+# local modules
+from utils.params import RebindableSystem
+
+class Bi_00(RebindableSystem, BaseSystem):
     r"""Class to simulate two simple bidirectionally-coupled QOM systems.
 
     Parameters
@@ -112,6 +115,57 @@ class Bi_00(BaseSystem):
 
         return self.A
     
+    def get_A_ensemble(self, modes, params, t):
+        """Method to obtain the drift matrices of an ensemble of systems.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes with shape ``(K, 4)``.
+        params : dict
+            Parameters of the systems as arrays with leading dimension ``K``.
+        t : numpy.ndarray
+            Times of the systems with shape ``(K, )``.
+        
+        Returns
+        -------
+        A : numpy.ndarray
+            Drift matrices with shape ``(K, 8, 8)``.
+        """
+        
+        # extract frequently used variables
+        alphas = modes[:, ::2]
+        betas = modes[:, 1::2]
+
+        # effective values
+        omega_ms = [params['omega_mL'], params['omega_mL'] + params['delta']]
+        Deltas = [params['Delta_0_sign'] * omega_ms[i] + 2.0 * params['g_0s'][:, i] * np.real(betas[:, i]) for i in range(2)]
+        gs = [params['g_0s'][:, i] * alphas[:, i] for i in range(2)]
+
+        # initialize drift matrices
+        A = np.zeros((len(modes), 8, 8), dtype=np.float_)
+        for i in range(2):
+            # X quadratures
+            A[:, 4*i + 0, 4*i + 0] = - params['kappas'][:, i]
+            A[:, 4*i + 0, 4*i + 1] = - Deltas[i]
+            A[:, 4*i + 0, 4*i + 2] = - 2.0 * np.imag(gs[i])
+            A[:, 4*i + 0, 4*(1 - i) + 1] = - params['lambda']
+            # Y quadratures
+            A[:, 4*i + 1, 4*i + 0] = Deltas[i]
+            A[:, 4*i + 1, 4*i + 1] = - params['kappas'][:, i]
+            A[:, 4*i + 1, 4*i + 2] = 2.0 * np.real(gs[i])
+            A[:, 4*i + 1, 4*(1 - i) + 0] = params['lambda']
+            # Q quadratures
+            A[:, 4*i + 2, 4*i + 2] = - params['gammas'][:, i]
+            A[:, 4*i + 2, 4*i + 3] = omega_ms[i]
+            # P quadratures
+            A[:, 4*i + 3, 4*i + 0] = 2.0 * np.real(gs[i])
+            A[:, 4*i + 3, 4*i + 1] = 2.0 * np.imag(gs[i])
+            A[:, 4*i + 3, 4*i + 2] = - omega_ms[i]
+            A[:, 4*i + 3, 4*i + 3] = - params['gammas'][:, i]
+
+        return A
+
     def get_D(self, modes, corrs, c, t):
         """Method to obtain the noise matrix.
         
@@ -143,6 +197,38 @@ class Bi_00(BaseSystem):
 
         return self.D
 
+    def get_D_ensemble(self, modes, corrs, params, t):
+        """Method to obtain the noise matrices of an ensemble of systems.
+        
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes with shape ``(K, 4)``.
+        corrs : numpy.ndarray
+            Quantum correlations with shape ``(K, 8, 8)``.
+        params : dict
+            Parameters of the systems as arrays with leading dimension ``K``.
+        t : numpy.ndarray
+            Times of the systems with shape ``(K, )``.
+        
+        Returns
+        -------
+        D : numpy.ndarray
+            Noise matrices with shape ``(K, 8, 8)``.
+        """
+        
+        # initialize noise matrices
+        D = np.zeros((len(modes), 8, 8), dtype=np.float_)
+        for i in range(2):
+            # optical modes
+            D[:, 4*i + 0, 4*i + 0] = params['kappas'][:, i]
+            D[:, 4*i + 1, 4*i + 1] = params['kappas'][:, i]
+            # mechanical modes
+            D[:, 4*i + 2, 4*i + 2] = params['gammas'][:, i] * (2.0 * params['n_ths'][:, i] + 1.0)
+            D[:, 4*i + 3, 4*i + 3] = params['gammas'][:, i] * (2.0 * params['n_ths'][:, i] + 1.0)
+
+        return D
+
     def get_ivc(self):
         """Method to obtain the initial values of the modes, correlations and derived constants and controls.
         
@@ -204,4 +290,104 @@ class Bi_00(BaseSystem):
         # mechanical modes
         dbeta_dts = [1.0j * gs[i] * np.conjugate(alphas[i]) + (- self.params['gammas'][i] - 1.0j * omega_ms[i]) * betas[i] for i in range(2)]
 
-        return np.array([dalpha_dts[0], dbeta_dts[0], dalpha_dts[1], dbeta_dts[1]], dtype=np.complex_)
\ No newline at end of file
+        return np.array([dalpha_dts[0], dbeta_dts[0], dalpha_dts[1], dbeta_dts[1]], dtype=np.complex_)
+
+    def get_mode_rates_ensemble(self, modes, params, t):
+        """Method to obtain the rates of change of the modes of an ensemble of systems.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes with shape ``(K, 4)``.
+        params : dict
+            Parameters of the systems as arrays with leading dimension ``K``.
+        t : numpy.ndarray
+            Times of the systems with shape ``(K, )``.
+        
+        Returns
+        -------
+        mode_rates : numpy.ndarray
+            Rates of change of the modes with shape ``(K, 4)``.
+        """
+        
+        # extract frequently used variables
+        alphas = modes[:, ::2]
+        betas = modes[:, 1::2]
+
+        # effective values
+        omega_ms = [params['omega_mL'], params['omega_mL'] + params['delta']]
+        Deltas = [params['Delta_0_sign'] * omega_ms[i] + 2.0 * params['g_0s'][:, i] * np.real(betas[:, i]) for i in range(2)]
+        gs = [params['g_0s'][:, i] * alphas[:, i] for i in range(2)]
+
+        # calculate mode rates
+        mode_rates = np.empty((len(modes), 4), dtype=np.complex_)
+        for i in range(2):
+            # optical modes
+            mode_rates[:, 2*i] = (- params['kappas'][:, i] + 1.0j * Deltas[i]) * alphas[:, i] + 1.0j * params['lambda'] * alphas[:, 1 - i] + params['A_l']
+            # mechanical modes
+            mode_rates[:, 2*i + 1] = 1.0j * gs[i] * np.conjugate(alphas[:, i]) + (- params['gammas'][:, i] - 1.0j * omega_ms[i]) * betas[:, i]
+
+        return mode_rates
+
+    def get_templates_A_D(self, c):
+        """Method to obtain the templates of the drift and noise matrices.
+
+        The drift matrix is split into its entries independent of the modes and the time, and a function for the remaining entries. The noise matrix is independent of the modes, the correlations and the time.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        A_0 : numpy.ndarray
+            Drift matrix with the constant entries.
+        idxs_A : tuple
+            Rows and columns of the variable entries of the drift matrix.
+        func_A : callable
+            Variable entries of the drift matrix, formatted as ``func_A(modes, t)``.
+        D : numpy.ndarray
+            Noise matrix.
+        """
+        
+        # extract frequently used variables
+        g_0s = np.array(self.params['g_0s'], dtype=np.float_)
+        omega_ms = [self.params['omega_mL'], self.params['omega_mL'] + self.params['delta']]
+        Delta_0s = self.params['Delta_0_sign'] * np.array(omega_ms, dtype=np.float_)
+
+        # constant entries of the drift matrix
+        A_0 = np.zeros(self.dim_corrs, dtype=np.float_)
+        for i in range(2):
+            # X quadratures
+            A_0[4*i + 0][4*i + 0] = - self.params['kappas'][i]
+            A_0[4*i + 0][4*(1 - i) + 1] = - self.params['lambda']
+            # Y quadratures
+            A_0[4*i + 1][4*i + 1] = - self.params['kappas'][i]
+            A_0[4*i + 1][4*(1 - i) + 0] = self.params['lambda']
+            # Q quadratures
+            A_0[4*i + 2][4*i + 2] = - self.params['gammas'][i]
+            A_0[4*i + 2][4*i + 3] = omega_ms[i]
+            # P quadratures
+            A_0[4*i + 3][4*i + 2] = - omega_ms[i]
+            A_0[4*i + 3][4*i + 3] = - self.params['gammas'][i]
+
+        # positions of the variable entries in the X, Y and P quadratures of each mode
+        idxs_A = (np.array([0, 0, 1, 1, 3, 3, 4, 4, 5, 5, 7, 7]), np.array([1, 2, 0, 2, 0, 1, 5, 6, 4, 6, 4, 5]))
+
+        # variable entries of the drift matrix
+        def func_A(modes, t):
+            # effective values
+            Deltas = Delta_0s + 2.0 * g_0s * np.real(modes[1::2])
+            gs = g_0s * modes[::2]
+            return np.ravel(np.transpose([- Deltas, - 2.0 * np.imag(gs), Deltas, 2.0 * np.real(gs), 2.0 * np.real(gs), 2.0 * np.imag(gs)]))
+
+        # constant noise matrix
+        D = np.array(self.get_D(
+            modes=None,
+            corrs=None,
+            c=c,
+            t=None
+        ))
+
+        return A_0, idxs_A, func_A, D
\ No newline at end of file
@@ -6,17 +6,22 @@
 __authors__ = ["Sampreet Kalita"]
 __toolbox__ = 'qom-v1.0.1'
 __created__ = "2020-12-21"
-__updated__ = "2024-01-18"
+__updated__ = "2026-10-18"
 
 # dependencies
-from sympy import Symbol
+from sympy import I, lambdify, Poly, Symbol, symbols
 import numpy as np
 import scipy.constants as sc
 
 # qom modules
 from qom.systems import BaseSystem
 
-class BEC_10(BaseSystem):
+# local modules
+from utils.caches import get_key, LRUCache
+from utils.params import RebindableSystem
+from utils.polynomials import get_real_roots, get_roots, get_stabilities
+
+class BEC_10(RebindableSystem, BaseSystem):
     r"""Class to simulate a BEC-OM system with a weak probe laser and a strong control laser containing OAM.
 
     Parameters
@@ -83,6 +88,22 @@ class BEC_10(BaseSystem):
         't_P_lc_norm'   : 'none'
     }
 
+    # compiled coefficients of the polynomial in probe detuning
+    _func_coeffs_deltas = None
+
+    # caches of the quantities independent of the probe detuning shared by all instances
+    caches = {
+        'constants'         : LRUCache(size=128),
+        'effective_values'  : LRUCache(size=128),
+        'N_os'              : LRUCache(size=128),
+        'modes_steady_state': LRUCache(size=128)
+    }
+
+    # parameters on which the derived quantities of each instance depend
+    derived_dependencies = {
+        'params_key': [key for key in system_defaults if key not in ['delta', 't_line']]
+    }
+
     def __init__(self, params, cb_update=None):
         """Class constructor for BEC_10."""
         
@@ -95,6 +116,13 @@ class BEC_10(BaseSystem):
             cb_update=cb_update
         )
 
+    @classmethod
+    def clear_caches(cls):
+        """Method to clear the cached quantities independent of the probe detuning and reset their counters."""
+
+        for key in cls.caches:
+            cls.caches[key].clear()
+
     def get_A(self, modes, c, t=None):
         """Method to obtain the drift matrix.
 
@@ -113,6 +141,32 @@ class BEC_10(BaseSystem):
             Drift matrix.
         """
 
+        # update drift matrix
+        self.A[:] = self.get_A_batch(
+            modes=modes,
+            c=c
+        )
+
+        return self.A
+
+    def get_A_batch(self, modes, c):
+        """Method to obtain the drift matrices for a batch of modes and constants.
+
+        The constants can be arrays, which are broadcasted with the leading dimensions of the modes.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes with shape ``(..., num_modes)``.
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        A : numpy.ndarray
+            Drift matrices with shape ``(..., 2 * num_modes, 2 * num_modes)``.
+        """
+
         # extract frequently used variables
         Delta_tilde = c[0]
         G = c[4]
@@ -121,40 +175,41 @@ class BEC_10(BaseSystem):
         gamma_o = c[7]
         N = c[9]
         omegas = [c[10], c[11]]
-        alpha = modes[0]
-        betas = [modes[1], modes[2]]
+        alpha, beta_c, beta_d = np.moveaxis(np.asarray(modes), -1, 0)
         temp = 2 * g_tilde * N
 
         # derived frequencies
-        Delta = Delta_tilde - 2 * G * np.real(np.sum(betas))
-        
+        Delta = Delta_tilde - 2 * G * np.real(beta_c + beta_d)
+
+        # initialize drift matrices
+        A = np.zeros(np.broadcast(alpha, Delta, gamma_m, omegas[0], omegas[1]).shape + (2 * self.num_modes, 2 * self.num_modes), dtype=np.float_)
         # optical mode
-        self.A[0][0] = - gamma_o / 2
-        self.A[0][1] = - Delta
-        self.A[0][2] = np.sqrt(2) * G * np.imag(alpha)
-        self.A[0][4] = np.sqrt(2) * G * np.imag(alpha)
-        self.A[1][0] = Delta
-        self.A[1][1] = - gamma_o / 2
-        self.A[1][2] = - np.sqrt(2) * G * np.real(alpha)
-        self.A[1][4] = - np.sqrt(2) * G * np.real(alpha)
+        A[..., 0, 0] = - gamma_o / 2
+        A[..., 0, 1] = - Delta
+        A[..., 0, 2] = np.sqrt(2) * G * np.imag(alpha)
+        A[..., 0, 4] = np.sqrt(2) * G * np.imag(alpha)
+        A[..., 1, 0] = Delta
+        A[..., 1, 1] = - gamma_o / 2
+        A[..., 1, 2] = - np.sqrt(2) * G * np.real(alpha)
+        A[..., 1, 4] = - np.sqrt(2) * G * np.real(alpha)
         # first mechanical mode
-        self.A[2][3] = omegas[0] + 2 * temp
-        self.A[2][5] = - temp
-        self.A[3][0] = - np.sqrt(2) * G * np.real(alpha)
-        self.A[3][1] = - np.sqrt(2) * G * np.imag(alpha)
-        self.A[3][2] = - omegas[0] + 2 * temp
-        self.A[3][3] = - gamma_m
-        self.A[3][4] = - temp
+        A[..., 2, 3] = omegas[0] + 2 * temp
+        A[..., 2, 5] = - temp
+        A[..., 3, 0] = - np.sqrt(2) * G * np.real(alpha)
+        A[..., 3, 1] = - np.sqrt(2) * G * np.imag(alpha)
+        A[..., 3, 2] = - omegas[0] + 2 * temp
+        A[..., 3, 3] = - gamma_m
+        A[..., 3, 4] = - temp
         # second mechanical mode
-        self.A[4][3] = - temp
-        self.A[4][5] = omegas[1] + 2 * temp
-        self.A[5][0] = - np.sqrt(2) * G * np.real(alpha)
-        self.A[5][1] = - np.sqrt(2) * G * np.imag(alpha)
-        self.A[5][2] = - temp
-        self.A[5][4] = - omegas[1] + 2 * temp
-        self.A[5][5] = - gamma_m
+        A[..., 4, 3] = - temp
+        A[..., 4, 5] = omegas[1] + 2 * temp
+        A[..., 5, 0] = - np.sqrt(2) * G * np.real(alpha)
+        A[..., 5, 1] = - np.sqrt(2) * G * np.imag(alpha)
+        A[..., 5, 2] = - temp
+        A[..., 5, 4] = - omegas[1] + 2 * temp
+        A[..., 5, 5] = - gamma_m
 
-        return self.A
+        return A
 
     def get_absorption(self, c):
         """Method to obtain the absorption.
@@ -187,6 +242,18 @@ class BEC_10(BaseSystem):
 
         return absorp
 
+    @classmethod
+    def get_caches_info(cls):
+        """Method to obtain the counters of the cached quantities.
+
+        Returns
+        -------
+        info : dict
+            Number of hits, misses, stored results and maximum size for each cache.
+        """
+
+        return {key: cls.caches[key].get_info() for key in cls.caches}
+
     def get_coeffs_A(self, modes, c, t=None):
         """Method to obtain the coefficients of the characteristic equation of the drift matrix.
 
@@ -201,56 +268,120 @@ class BEC_10(BaseSystem):
 
         Returns
         -------
-        coeffs : list
+        coeffs : numpy.ndarray
             Coefficients of the characteristic equation of the drift matrix.
         """
 
+        return self.get_coeffs_A_batch(
+            modes=modes,
+            c=c
+        )
+
+    def get_coeffs_A_batch(self, modes, c):
+        """Method to obtain the coefficients of the characteristic equation of the drift matrix for a batch of modes and constants.
+
+        The constants can be arrays, which are broadcasted with the leading dimensions of the modes.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes with shape ``(..., num_modes)``.
+        c : numpy.ndarray
+            Derived constants and controls.
+
+        Returns
+        -------
+        coeffs : numpy.ndarray
+            Coefficients of the characteristic equation of the drift matrix in descending powers with shape ``(..., 2 * num_modes + 1)``.
+        """
+
         # extract frequently used variables
         Delta_tilde = c[0]
         G = c[4]
+        g_tilde = c[5]
         gamma_m = c[6]
         gamma_o = c[7]
-        t_oss_method = self.params['t_oss_method']
-        alpha = modes[0]
+        N = c[9]
+        omegas = [c[10], c[11]]
+        alpha, beta_c, beta_d = np.moveaxis(np.asarray(modes), -1, 0)
+        temp = 2 * g_tilde * N
 
-        # get effective values
-        A_mathcal, Omegas, omega_tildes, C = self.get_effective_values(
-            c=c
-        )
-        # calculate mean optical occupancy
+        # derived frequencies
+        Delta = Delta_tilde - 2 * G * np.real(beta_c + beta_d)
+        # mean optical occupancy
         N_o = np.real(np.conjugate(alpha) * alpha)
-        # calculate effiective detuning
-        Delta = Delta_tilde + (C * N_o if 'cubic' in t_oss_method else 0)
 
         # frequently used expressions
-        A_2 = A_mathcal**2 + Omegas[0]**2 * Omegas[1]**2
         D_2 = Delta**2 + gamma_o**2 / 4
-        D_N = 2 * Delta * G**2 * N_o * (omega_tildes[0] + omega_tildes[1])
-        O_2 = Omegas[0]**2 + Omegas[1]**2
+        O_2 = omegas[0]**2 + omegas[1]**2 - 10 * temp**2
+        B_p = (omegas[0] + 2 * temp) * (omegas[1] + 2 * temp) - temp**2
+        B_m = (omegas[0] - 2 * temp) * (omegas[1] - 2 * temp) - temp**2
+        B_2 = B_p * B_m
+        D_N = 2 * Delta * G**2 * N_o
 
         # coefficients
-        coeffs = list()
+        coeffs = np.zeros(np.shape(Delta * gamma_m * omegas[0] * omegas[1]) + (2 * self.num_modes + 1, ), dtype=np.float_)
         # a_0
-        coeffs.append(1)
+        coeffs[..., 0] = 1
         # a_1
-        coeffs.append(2 * gamma_m + gamma_o)
+        coeffs[..., 1] = 2 * gamma_m + gamma_o
         # a_2
-        coeffs.append(D_2 + O_2 + gamma_m**2 + 2 * gamma_m * gamma_o)
+        coeffs[..., 2] = D_2 + O_2 + gamma_m**2 + 2 * gamma_m * gamma_o
         # a_3
-        coeffs.append(2 * D_2 * gamma_m + O_2 * (gamma_m + gamma_o) + gamma_m**2 * gamma_o)
+        coeffs[..., 3] = 2 * D_2 * gamma_m + O_2 * (gamma_m + gamma_o) + gamma_m**2 * gamma_o
         # a_4
-        coeffs.append(A_2 + D_2 * (O_2 + gamma_m**2) + D_N + O_2 * gamma_m * gamma_o)
+        coeffs[..., 4] = B_2 + D_2 * (O_2 + gamma_m**2) + D_N * (omegas[0] + omegas[1] + 2 * temp) + O_2 * gamma_m * gamma_o
         # a_5
-        coeffs.append(A_2 * gamma_o + D_2 * O_2 * gamma_m + D_N * gamma_m)
+        coeffs[..., 5] = B_2 * gamma_o + D_2 * O_2 * gamma_m + D_N * (omegas[0] + omegas[1] + 2 * temp) * gamma_m
         # a_6
-        coeffs.append(A_2 * D_2 + np.sqrt(A_2) * D_N)
-        # # alternate expression
-        # coeffs.append(A_2 * D_2 + 2 * A_mathcal * Delta * G**2 * N_o * (omega_tildes[0] - omega_tildes[1]) + 2 * Delta * G**2 * N_o * (Omegas[0]**2 * omega_tildes[1] + Omegas[1]**2 * omega_tildes[0]))
+        coeffs[..., 6] = B_2 * D_2 + D_N * (omegas[0] + omegas[1] - 6 * temp) * B_p
 
         return coeffs
     
+    def get_coeffs_deltas(self, c, N_o=None):
+        """Method to obtain the coefficients of the polynomial in probe detuning for the denominator of the output amplitudes.
+
+        The values of the constants can be arrays of equal shapes, in which case the coefficients are evaluated for each set of constants.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        N_o : float or numpy.ndarray, optional
+            Mean optical occupancy. If ``None``, the first mean optical occupancy of the system is used.
+
+        Returns
+        -------
+        coeffs : numpy.ndarray
+            Coefficients of the polynomial in descending powers of the probe detuning with shape ``(..., 7)``.
+        """
+
+        # extract frequently used variables
+        Delta_tilde = c[0]
+        G = c[4]
+        gamma_m = c[6]
+        gamma_o = c[7]
+
+        # get effective values
+        A_mathcal, Omegas, omega_tildes, C = self.get_effective_values(
+            c=c
+        )
+        # get mean optical occupancy
+        if N_o is None:
+            N_o = self.get_mean_optical_occupancies()[0]
+        # calculate effective detuning
+        Delta = Delta_tilde + C * N_o
+
+        # evaluate compiled coefficients
+        coeffs = self.get_func_coeffs_deltas()(A_mathcal, Omegas[0], Omegas[1], omega_tildes[0], omega_tildes[1], Delta, G, gamma_m, gamma_o, N_o)
+        coeffs = np.broadcast_arrays(*[np.asarray(coeff, dtype=np.complex_) for coeff in coeffs])
+
+        return np.stack(coeffs, axis=-1)
+
     def get_coeffs_N_o(self, c):
         """Method to obtain coefficients of the polynomial in mean optical occupancy.
+
+        The values of the constants can be arrays, in which case the coefficients are evaluated for each set of constants.
         
         Parameters
         ----------
@@ -260,7 +391,7 @@ class BEC_10(BaseSystem):
         Returns 
         -------
         coeffs : numpy.ndarray
-            Coefficients of the polynomial in mean optical occupancy.
+            Coefficients of the polynomial in mean optical occupancy with shape ``(..., 4)``.
         """
 
         # frequently used variables
@@ -269,14 +400,127 @@ class BEC_10(BaseSystem):
         )
         
         # get coefficients
-        coeffs = np.zeros(2 * self.num_modes, dtype=np.float_)
-        coeffs[0] = 4.0 * C**2
-        coeffs[1] = 8.0 * C * Delta_0_norm
-        coeffs[2] = 4.0 * Delta_0_norm**2 + kappa_norm**2
-        coeffs[3] = - 4.0 * np.real(np.conjugate(A_l_norm) * A_l_norm)
+        coeffs = np.zeros(np.broadcast(A_l_norm, Delta_0_norm, kappa_norm, C).shape + (4, ), dtype=np.float_)
+        coeffs[..., 0] = 4.0 * C**2
+        coeffs[..., 1] = 8.0 * C * Delta_0_norm
+        coeffs[..., 2] = 4.0 * Delta_0_norm**2 + kappa_norm**2
+        coeffs[..., 3] = - 4.0 * np.real(np.conjugate(A_l_norm) * A_l_norm)
 
         return coeffs
 
+    def get_constants(self):
+        """Method to obtain the derived constants independent of the probe detuning.
+
+        The values are cached by ``get_ivc`` for each set of parameters other than the probe detuning.
+
+        Returns
+        -------
+        c : list
+            Derived constants with ``None`` in place of the probe detuning and the probe laser amplitude.
+        selector : dict
+            Values available for the normalization and offset of the detunings.
+        omega_lc : float
+            Frequency of the control laser.
+        P_lc : float
+            Power of the control laser.
+        """
+
+        # extract frequently used variables
+        Delta_tilde = self.params['Delta_tilde']
+        G = self.params['G']
+        g_tilde_norm = self.params['g_tilde_norm']
+        gamma_m = self.params['gamma_m']
+        gamma_o = self.params['gamma_o']
+        k = self.params['k']
+        L_p = self.params['L_p']
+        l = self.params['l']
+        lambda_lc = self.params['lambda_lc']
+        m = self.params['m']
+        mu = self.params['mu']
+        N = self.params['N']
+        P_lc = self.params['P_lc']
+        R = self.params['R']
+        t_Delta_norm = self.params['t_Delta_norm']
+        t_Delta_offset = self.params['t_Delta_offset']
+        t_P_lc_norm = self.params['t_P_lc_norm']
+
+        # moment of inertia
+        I = m * sc.physical_constants['atomic mass constant'][0] * R**2
+
+        # atomic interaction strengths
+        g_tilde = g_tilde_norm * sc.hbar / 4 / I / N
+
+        # frequently used variable
+        temp = 2 * g_tilde * N
+
+        # first sidemode
+        omega_c = sc.hbar * (L_p + 2 * l)**2 / 2 / I
+        omega_c_tilde = omega_c + temp
+        Omega_c = np.sqrt((omega_c + 2 * temp)**2 - temp**2)
+        # second sidemode
+        omega_d = sc.hbar * (L_p - 2 * l)**2 / 2 / I
+        omega_d_tilde = omega_d + temp
+        Omega_d = np.sqrt((omega_d + 2 * temp)**2 - temp**2)
+        
+        # frequently used variables
+        A_mathcal = temp * (omega_c - omega_d)
+        A_2 = A_mathcal**2 + Omega_c**2 * Omega_d**2
+        C = G**2 * (omega_c_tilde + omega_d_tilde) / np.sqrt(A_2)
+
+        # critical detuning
+        Delta_tilde_cr = - np.sqrt(3) * gamma_o / 2
+        # frequency of the control laser
+        omega_lc = 2 * np.pi * sc.c / lambda_lc
+        # critical power of the control laser
+        P_cr = gamma_o**2 * sc.hbar * omega_lc / 3 / np.sqrt(3) / C / mu
+
+        # mean and difference of frequencies
+        Omega_m = (Omega_c + Omega_d) / 2
+        Omega_n = (Omega_c - Omega_d) * k
+
+        # selector for detuning and offset
+        _selector = {
+            'cr': Delta_tilde_cr,
+            'gamma_m': gamma_m,
+            'gamma_o': gamma_o,
+            'Omega_c': Omega_c,
+            '-Omega_c': -Omega_c,
+            'Omega_d': Omega_d,
+            '-Omega_d': -Omega_d,
+            'Omega_m': Omega_m,
+            '-Omega_m': -Omega_m,
+            'Omega_n': Omega_n,
+            '-Omega_n': -Omega_n
+        }
+        # laser detuning
+        Delta_tilde = Delta_tilde * np.abs(_selector.get(t_Delta_norm, 1.0)) + _selector.get(t_Delta_offset, 0.0)
+        
+        # selector for control power
+        _selector_P_lc = {
+            'cr': P_cr
+        }
+        # power of the control laser
+        P_lc = P_lc * _selector_P_lc.get(t_P_lc_norm, 1.0)
+        # amplitude of the control laser
+        eta_lc = np.sqrt(mu * gamma_o * P_lc / sc.hbar / omega_lc)
+
+        # constant parameters with placeholders for the probe detuning and the probe laser amplitude
+        c = [Delta_tilde, None] + \
+            [eta_lc, None] + \
+            [G, g_tilde] + \
+            [gamma_m, gamma_o] + \
+            [mu, N] + \
+            [omega_c, omega_d]
+
+        # # display parameter values
+        # logger.debug('G={}, g_tilde_norm={}, gamma_m={}, gamma_o={}, L_p={}, l={}, lamnda_lc={}, m={}, mu={}, N={}\n'.format(G, g_tilde_norm, gamma_m, gamma_o, L_p, l, lambda_lc, m, mu, N))
+        # # display critical values values
+        # logger.debug('omega_lc={}, Delta_tilde_cr={}, P_cr={}, Omegas={}, Delta_tilde={}, C={}\n'.format(omega_lc, Delta_tilde_cr, P_cr, [Omega_c, Omega_d], Delta_tilde, C))
+        # # display condition for weak perturbations
+        # logger.debug('hbar L_p^2 / 2 I + 2 g_tilde N={}, g_a^2 / Delta_a={}, 4 g_tilde N={}\n'.format(sc.hbar * L_p**2 / 2 / I + 2 * g_tilde * N, 2 * np.sqrt(2) * params[4] / np.sqrt(params[9]), 4 * g_tilde * N))
+
+        return c, _selector, omega_lc, P_lc
+
     def get_cooperativity(self, c):
         """Method to obtain the cooperativity.
         
@@ -364,60 +608,60 @@ class BEC_10(BaseSystem):
             Complex roots of probe detuning.
         """
 
-        # extract frequently used variables
-        Delta_tilde = c[0]
-        G = c[4]
-        gamma_m = c[6]
-        gamma_o = c[7]
-
-        # get effective values
-        A_mathcal, Omegas, omega_tildes, C = self.get_effective_values(
+        # get coefficients
+        coeffs = self.get_coeffs_deltas(
             c=c
         )
-        # calculate mean optical occupancy
-        N_o, _ = self.get_mean_optical_occupancies()
-        N_o = N_o[0]
-        # calculate effiective detuning
-        Delta = Delta_tilde + C * N_o
-
-        # probe detuning
-        delta = Symbol('delta', complex=True)
-        # effective values
-        Gamma_m = gamma_o / 2 - 1j * (Delta + delta)
-        Gamma_p = gamma_o / 2 + 1j * (Delta - delta)
-        chis =  [1 / (Omegas[i]**2 - 1j * delta * gamma_m - delta**2) for i in range(2)]
-        # Lambda
-        _num = A_mathcal * chis[0] * chis[1] * (omega_tildes[0] - omega_tildes[1])
-        _num += sum([chis[i] * omega_tildes[i] for i in range(2)])
-        _den = A_mathcal**2 * chis[0] * chis[1] + 1
-        Lambda = _num / _den
-
-        # equation for delta
-        eqtn_delta = Gamma_m * Gamma_p + 2 * Delta * G**2 * Lambda * N_o
-        eqtn_delta *= _den / chis[0] / chis[1]
-        eqtn_delta = eqtn_delta.factor().expand()
-
-        # solve for delta
-        coeff_1 = eqtn_delta.coeff(delta)
-        coeff_2 = eqtn_delta.coeff(delta**2)
-        coeff_3 = eqtn_delta.coeff(delta**3)
-        coeff_4 = eqtn_delta.coeff(delta**4)
-        coeff_5 = eqtn_delta.coeff(delta**5)
-        coeff_6 = eqtn_delta.coeff(delta**6)
-        coeff_0 = eqtn_delta - coeff_6 * delta**6 - coeff_5 * delta**5 - coeff_4 * delta**4 - coeff_3 * delta**3 - coeff_2 * delta**2 - coeff_1 * delta
-        coeff_0 = coeff_0.expand()
-        # list of coefficients
-        coeffs = [coeff_6, coeff_5, coeff_4, coeff_3, coeff_2, coeff_1, coeff_0]
-
-        # convert to numpy constants
-        for i in range(len(coeffs)):
-            coeffs[i] = np.complex(np.real(coeffs[i]), np.imag(coeffs[i]))
 
         # convert to list
         deltas = np.roots(coeffs).tolist()
 
         return deltas
 
+    def get_deltas_batch(self, axes):
+        """Method to obtain the complex solutions of the denominator of the output amplitudes over a grid of system parameters.
+
+        The coefficients are evaluated for each point of the grid and all the polynomials are solved together using their companion matrices.
+
+        Parameters
+        ----------
+        axes : dict
+            Values of the system parameters to broadcast, formatted as ``{'L_p': [0, 1, 2], 'l': [18, 20]}``. Each key adds an axis in the given order.
+
+        Returns
+        -------
+        deltas : numpy.ndarray
+            Complex roots of probe detuning with shape ``(*dims_axes, 6)``.
+        """
+
+        # extract frequently used variables
+        keys = list(axes.keys())
+        shape = tuple(len(axes[key]) for key in keys)
+
+        # initialize coefficients
+        coeffs = np.zeros(shape + (7, ), dtype=np.complex_)
+
+        # backup parameters
+        params_backup = {key: self.params[key] for key in keys}
+
+        try:
+            # for each point in the broadcast axes
+            for idxs in np.ndindex(*shape):
+                # update parameters
+                for i in range(len(keys)):
+                    self.params[keys[i]] = axes[keys[i]][idxs[i]]
+
+                # get coefficients
+                _, _, c = self.get_ivc()
+                coeffs[idxs] = self.get_coeffs_deltas(
+                    c=c
+                )
+        finally:
+            # restore parameters
+            self.params.update(params_backup)
+
+        return get_roots(coeffs)
+
     def get_dispersion(self, c):
         """Method to obtain the dispersion.
         
@@ -475,25 +719,69 @@ class BEC_10(BaseSystem):
         N = c[9]
         omegas = [c[10], c[11]]
         temp = 2 * g_tilde * N
-        
-        # first element
-        A_mathcal = temp * (omegas[0] - omegas[1])
-        # second element
-        Omega_c = np.sqrt((omegas[0] + 2 * temp)**2 - temp**2)
-        Omega_d = np.sqrt((omegas[1] + 2 * temp)**2 - temp**2)
-        Omegas = [Omega_c, Omega_d]
-        # third element
-        omega_c_tilde = omegas[0] + temp
-        omega_d_tilde = omegas[1] + temp
-        omega_tildes = [omega_c_tilde, omega_d_tilde]
-        # fourth element
-        A_2 = A_mathcal**2 + Omega_c**2 * Omega_d**2
-        C = G**2 * (omega_c_tilde + omega_d_tilde) / np.sqrt(A_2)
-        # # alternate expression
-        # C = G**2 * (A_mathcal * (omega_c_tilde - omega_d_tilde) + Omega_c**2 * omega_d_tilde + Omega_d**2 * omega_c_tilde) / A2
 
-        return A_mathcal, Omegas, omega_tildes, C
+        # function to calculate the values
+        def func():
+            # first element
+            A_mathcal = temp * (omegas[0] - omegas[1])
+            # second element
+            Omega_c = np.sqrt((omegas[0] + 2 * temp)**2 - temp**2)
+            Omega_d = np.sqrt((omegas[1] + 2 * temp)**2 - temp**2)
+            # third element
+            omega_c_tilde = omegas[0] + temp
+            omega_d_tilde = omegas[1] + temp
+            # fourth element
+            A_2 = A_mathcal**2 + Omega_c**2 * Omega_d**2
+            C = G**2 * (omega_c_tilde + omega_d_tilde) / np.sqrt(A_2)
+            # # alternate expression
+            # C = G**2 * (A_mathcal * (omega_c_tilde - omega_d_tilde) + Omega_c**2 * omega_d_tilde + Omega_d**2 * omega_c_tilde) / A2
+
+            return A_mathcal, Omega_c, Omega_d, omega_c_tilde, omega_d_tilde, C
+
+        # get cached values
+        A_mathcal, Omega_c, Omega_d, omega_c_tilde, omega_d_tilde, C = self.caches['effective_values'].get(
+            key=get_key(G, g_tilde, N, omegas),
+            func=func
+        )
+
+        return A_mathcal, [Omega_c, Omega_d], [omega_c_tilde, omega_d_tilde], C
     
+    @classmethod
+    def get_func_coeffs_deltas(cls):
+        r"""Method to obtain the compiled function for the coefficients of the polynomial in probe detuning.
+
+        The polynomial :math:`\Gamma_{-} \Gamma_{+} + 2 \Delta G^{2} \Lambda N_{o}`, multiplied by the denominator of :math:`\Lambda`, is expanded symbolically only once and its coefficients are compiled to a vectorized function.
+
+        Returns
+        -------
+        func_coeffs_deltas : callable
+            Function formatted as ``func_coeffs_deltas(A_mathcal, Omega_c, Omega_d, omega_c_tilde, omega_d_tilde, Delta, G, gamma_m, gamma_o, N_o)``, returning the coefficients in descending powers of the probe detuning.
+        """
+
+        # derive once
+        if cls._func_coeffs_deltas is None:
+            # parameters
+            params = symbols('A_mathcal Omega_c Omega_d omega_c_tilde omega_d_tilde Delta G gamma_m gamma_o N_o', real=True)
+            A_mathcal, Omega_c, Omega_d, omega_c_tilde, omega_d_tilde, Delta, G, gamma_m, gamma_o, N_o = params
+            # probe detuning
+            delta = Symbol('delta', complex=True)
+            # effective values
+            Gamma_m = gamma_o / 2 - I * (Delta + delta)
+            Gamma_p = gamma_o / 2 + I * (Delta - delta)
+            chi_invs = [Omega**2 - I * delta * gamma_m - delta**2 for Omega in [Omega_c, Omega_d]]
+            # Lambda times its denominator
+            _num = A_mathcal * (omega_c_tilde - omega_d_tilde) + chi_invs[1] * omega_c_tilde + chi_invs[0] * omega_d_tilde
+            _den = A_mathcal**2 + chi_invs[0] * chi_invs[1]
+
+            # equation for delta
+            eqtn_delta = Gamma_m * Gamma_p * _den + 2 * Delta * G**2 * _num * N_o
+
+            # compile coefficients
+            coeffs = Poly(eqtn_delta.expand(), delta).all_coeffs()
+            cls._func_coeffs_deltas = lambdify(params, coeffs, modules='numpy')
+
+        return cls._func_coeffs_deltas
+
     def get_fwhm_norm_resonance(self, c):
         """Method to obtain the normalized FWHM at resonance using the analytical expression.
         
@@ -559,89 +847,22 @@ class BEC_10(BaseSystem):
         """
 
         # extract frequently used variables
-        Delta_tilde = self.params['Delta_tilde']
         delta = self.params['delta']
-        G = self.params['G']
-        g_tilde_norm = self.params['g_tilde_norm']
-        gamma_m = self.params['gamma_m']
-        gamma_o = self.params['gamma_o']
-        k = self.params['k']
-        L_p = self.params['L_p']
-        l = self.params['l']
-        lambda_lc = self.params['lambda_lc']
-        m = self.params['m']
-        mu = self.params['mu']
-        N = self.params['N']
-        P_lc = self.params['P_lc']
         P_lp_norm = self.params['P_lp_norm']
-        R = self.params['R']
-        t_Delta_norm = self.params['t_Delta_norm']
-        t_Delta_offset = self.params['t_Delta_offset']
         t_delta_norm = self.params['t_delta_norm']
         t_delta_offset = self.params['t_delta_offset']
-        t_P_lc_norm = self.params['t_P_lc_norm']
-
-        # moment of inertia
-        I = m * sc.physical_constants['atomic mass constant'][0] * R**2
-
-        # atomic interaction strengths
-        g_tilde = g_tilde_norm * sc.hbar / 4 / I / N
-
-        # frequently used variable
-        temp = 2 * g_tilde * N
-
-        # first sidemode
-        omega_c = sc.hbar * (L_p + 2 * l)**2 / 2 / I
-        omega_c_tilde = omega_c + temp
-        Omega_c = np.sqrt((omega_c + 2 * temp)**2 - temp**2)
-        # second sidemode
-        omega_d = sc.hbar * (L_p - 2 * l)**2 / 2 / I
-        omega_d_tilde = omega_d + temp
-        Omega_d = np.sqrt((omega_d + 2 * temp)**2 - temp**2)
-        
-        # frequently used variables
-        A_mathcal = temp * (omega_c - omega_d)
-        A_2 = A_mathcal**2 + Omega_c**2 * Omega_d**2
-        C = G**2 * (omega_c_tilde + omega_d_tilde) / np.sqrt(A_2)
-
-        # critical detuning
-        Delta_tilde_cr = - np.sqrt(3) * gamma_o / 2
-        # frequency of the control laser
-        omega_lc = 2 * np.pi * sc.c / lambda_lc
-        # critical power of the control laser
-        P_cr = gamma_o**2 * sc.hbar * omega_lc / 3 / np.sqrt(3) / C / mu
 
-        # mean and difference of frequencies
-        Omega_m = (Omega_c + Omega_d) / 2
-        Omega_n = (Omega_c - Omega_d) * k
+        # get cached constants independent of the probe detuning
+        c, _selector, omega_lc, P_lc = self.caches['constants'].get(
+            key=self.get_params_key(),
+            func=self.get_constants
+        )
+        Delta_tilde = c[0]
+        gamma_o = c[7]
+        mu = c[8]
 
-        # selector for detuning and offset
-        _selector = {
-            'cr': Delta_tilde_cr,
-            'gamma_m': gamma_m,
-            'gamma_o': gamma_o,
-            'Omega_c': Omega_c,
-            '-Omega_c': -Omega_c,
-            'Omega_d': Omega_d,
-            '-Omega_d': -Omega_d,
-            'Omega_m': Omega_m,
-            '-Omega_m': -Omega_m,
-            'Omega_n': Omega_n,
-            '-Omega_n': -Omega_n
-        }
-        # laser detuning
-        Delta_tilde = Delta_tilde * np.abs(_selector.get(t_Delta_norm, 1.0)) + _selector.get(t_Delta_offset, 0.0)
         # probe detuning
         delta = delta * np.abs(_selector.get(t_delta_norm, 1.0)) + _selector.get(t_delta_offset, Delta_tilde if t_delta_offset == 'Delta' else 0.0)
-        
-        # selector for control power
-        _selector_P_lc = {
-            'cr': P_cr
-        }
-        # power of the control laser
-        P_lc = P_lc * _selector_P_lc.get(t_P_lc_norm, 1.0)
-        # amplitude of the control laser
-        eta_lc = np.sqrt(mu * gamma_o * P_lc / sc.hbar / omega_lc)
 
         # power of the probe laser
         P_lp = P_lp_norm * P_lc
@@ -663,19 +884,9 @@ class BEC_10(BaseSystem):
         iv_corrs[5][5] = 0.5
         
         # constant parameters
-        c = [Delta_tilde, delta] + \
-            [eta_lc, eta_lp] + \
-            [G, g_tilde] + \
-            [gamma_m, gamma_o] + \
-            [mu, N] + \
-            [omega_c, omega_d]
-
-        # # display parameter values
-        # logger.debug('G={}, g_tilde_norm={}, gamma_m={}, gamma_o={}, L_p={}, l={}, lamnda_lc={}, m={}, mu={}, N={}\n'.format(G, g_tilde_norm, gamma_m, gamma_o, L_p, l, lambda_lc, m, mu, N))
-        # # display critical values values
-        # logger.debug('omega_lc={}, Delta_tilde_cr={}, P_cr={}, Omegas={}, Delta_tilde={}, C={}\n'.format(omega_lc, Delta_tilde_cr, P_cr, [Omega_c, Omega_d], Delta_tilde, C))
-        # # display condition for weak perturbations
-        # logger.debug('hbar L_p^2 / 2 I + 2 g_tilde N={}, g_a^2 / Delta_a={}, 4 g_tilde N={}\n'.format(sc.hbar * L_p**2 / 2 / I + 2 * g_tilde * N, 2 * np.sqrt(2) * params[4] / np.sqrt(params[9]), 4 * g_tilde * N))
+        c = list(c)
+        c[1] = delta
+        c[3] = eta_lp
 
         return iv_modes, iv_corrs, c
 
@@ -703,6 +914,25 @@ class BEC_10(BaseSystem):
 
         return lieftimes
 
+    def get_mean_optical_occupancies(self):
+        """Method to obtain the mean optical occupancies.
+
+        The occupancies are cached for each set of parameters other than the probe detuning.
+
+        Returns
+        -------
+        N_os : numpy.ndarray
+            Mean optical occupancies.
+        """
+
+        # get cached occupancies
+        N_os = self.caches['N_os'].get(
+            key=self.get_params_key(),
+            func=super().get_mean_optical_occupancies
+        )
+
+        return np.copy(N_os)
+
     def get_mode_rates(self, modes, c, t=None):
         """Method to obtain the rates of change of the modes.
 
@@ -765,6 +995,8 @@ class BEC_10(BaseSystem):
         
     def get_modes_steady_state(self, c):
         """Method to obtain the steady state modes.
+
+        The modes are cached for each set of parameters other than the probe detuning.
         
         Parameters
         ----------
@@ -777,12 +1009,46 @@ class BEC_10(BaseSystem):
             Steady state modes.
         """
 
+        # function to calculate the modes
+        def func():
+            return self.get_modes_steady_state_batch(
+                c=c,
+                N_os=self.get_mean_optical_occupancies()
+            )
+
+        # get cached modes
+        Modes = self.caches['modes_steady_state'].get(
+            key=get_key(self.get_params_key(), c[0], c[2], c[4:]),
+            func=func
+        )
+
+        return np.copy(Modes)
+
+    def get_modes_steady_state_batch(self, c, N_os):
+        """Method to obtain the steady state modes for a batch of mean optical occupancies and constants.
+
+        The constants can be arrays, which are broadcasted with the leading dimensions of the mean optical occupancies.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        N_os : numpy.ndarray
+            Mean optical occupancies with shape ``(..., num_N_os)``.
+
+        Returns 
+        -------
+        Modes : numpy.ndarray
+            Steady state modes with shape ``(..., num_N_os, num_modes)``.
+        """
+
         # extract frequently used variables
         Delta_tilde = c[0]
         eta_lc = c[2]
         G = c[4]
         gamma_o = c[7]
         t_oss_method = self.params['t_oss_method']
+        N_os = np.asarray(N_os, dtype=np.float_)
 
         # get effective values
         A_mathcal, Omegas, omega_tildes, C = self.get_effective_values(
@@ -793,25 +1059,15 @@ class BEC_10(BaseSystem):
         A2 = A_mathcal**2 + Omegas[0]**2 * Omegas[1]**2
         A2_sqrt = np.sqrt(A2)
 
-        # initialize lists
-        Modes = list()
-
-        # get mean optical occupancies
-        N_os = self.get_mean_optical_occupancies()
-        # for each mean optical occupancy
-        for N_o in N_os:
-            # calculate mode amplitudes
-            alpha = eta_lc / (gamma_o / 2 - 1j * (Delta_tilde + (C * N_o if 'cubic' in t_oss_method else 0)))
-            q_c = - G * omega_tildes[1] * N_o / A2_sqrt
-            q_d = - G * omega_tildes[0] * N_o / A2_sqrt
-            # # alternate expressions
-            # q_c = - G * (Omegas[1]**2 * omega_tildes[0] - A_mathcal * omega_tildes[1]) * N_o / A2
-            # q_d = - G * (Omegas[0]**2 * omega_tildes[1] + A_mathcal * omega_tildes[0]) * N_o / A2
-
-            # append to list
-            Modes.append([alpha, q_c, q_d])
+        # calculate mode amplitudes
+        alpha = eta_lc / (gamma_o / 2 - 1j * (Delta_tilde + (C * N_os if 'cubic' in t_oss_method else 0)))
+        q_c = - G * omega_tildes[1] * N_os / A2_sqrt
+        q_d = - G * omega_tildes[0] * N_os / A2_sqrt
+        # # alternate expressions
+        # q_c = - G * (Omegas[1]**2 * omega_tildes[0] - A_mathcal * omega_tildes[1]) * N_os / A2
+        # q_d = - G * (Omegas[0]**2 * omega_tildes[1] + A_mathcal * omega_tildes[0]) * N_os / A2
 
-        return np.array(Modes, dtype=np.complex_)
+        return np.stack(np.broadcast_arrays(alpha, q_c, q_d), axis=-1).astype(np.complex_)
 
     def get_N_o_norms(self, params):
         """Method to obtain the mean optical occupancy per oscillation.
@@ -835,6 +1091,22 @@ class BEC_10(BaseSystem):
 
         return N_o_norms
 
+    def get_params_key(self):
+        """Method to obtain the key of the parameters independent of the probe detuning.
+
+        The key is retained by the instance until any of these parameters changes.
+
+        Returns
+        -------
+        key : tuple
+            Hashable key of all parameters except ``delta`` and ``t_line``.
+        """
+
+        return self.get_derived(
+            name='params_key',
+            func=lambda: get_key({key: self.params[key] for key in self.params if key not in ['delta', 't_line']})
+        )
+
     def get_params_steady_state(self, c):
         r"""Method to obtain the parameters required to calculate the optical steady states.
         
@@ -931,6 +1203,136 @@ class BEC_10(BaseSystem):
         
         return [S_sn, S_rp, S_th]
 
+    def get_stability_zones_batch(self, axes):
+        """Method to obtain the stability zones of the steady states over a grid of system parameters.
+
+        The constants, the mean optical occupancies and the steady states are evaluated for all the points of the grid together. The coefficients of the characteristic equations of the drift matrices at all the steady states are then obtained from ``get_coeffs_A_batch`` and the Routh-Hurwitz criterion is evaluated for all of them together.
+
+        Parameters
+        ----------
+        axes : dict
+            Values of the system parameters to broadcast, formatted as ``{'L_p': [0, 1, 2], 'l': [18, 20]}``. Each key adds an axis in the given order.
+
+        Returns
+        -------
+        zones : numpy.ndarray
+            Numbers of stable steady states with shape ``(*dims_axes, )``, which are :math:`0` for unstable, :math:`1` for monostable and larger for multistable points.
+        stabilities : numpy.ndarray
+            Stabilities of the steady states in descending order of the mean optical occupancies, padded with ``False``, with shape ``(*dims_axes, 3)``.
+        """
+
+        # extract frequently used variables
+        keys = list(axes.keys())
+        grids = np.meshgrid(*[np.asarray(axes[key]) for key in keys], indexing='ij')
+
+        # backup parameters
+        params_backup = {key: self.params[key] for key in keys}
+
+        try:
+            # update parameters to the grids
+            for key, grid in zip(keys, grids):
+                self.params[key] = grid
+
+            # get constants for all the points
+            c, _, _, _ = self.get_constants()
+        finally:
+            # restore parameters
+            self.params.update(params_backup)
+
+        # get mean optical occupancies
+        N_os = get_real_roots(self.get_coeffs_N_o(
+            c=c
+        ))
+        is_valid = ~ np.isnan(N_os)
+
+        # get steady states with the constants broadcasted over the occupancies
+        c = [None if value is None else np.asarray(value)[..., np.newaxis] for value in c]
+        Modes = self.get_modes_steady_state_batch(
+            c=c,
+            N_os=np.where(is_valid, N_os, 0.0)
+        )
+
+        # get coefficients of the characteristic polynomials of the drift matrices
+        coeffs = self.get_coeffs_A_batch(
+            modes=Modes,
+            c=c
+        )
+
+        # get stabilities
+        stabilities = get_stabilities(coeffs) & is_valid
+
+        return np.sum(stabilities, axis=-1), stabilities
+
+    def get_templates_A_D(self, c):
+        """Method to obtain the templates of the drift and noise matrices.
+
+        The drift matrix is split into its entries independent of the modes, and a function for the remaining entries. The noise matrix is independent of the modes, the correlations and the time.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        A_0 : numpy.ndarray
+            Drift matrix with the constant entries.
+        idxs_A : tuple
+            Rows and columns of the variable entries of the drift matrix.
+        func_A : callable
+            Variable entries of the drift matrix, formatted as ``func_A(modes, t)``.
+        D : numpy.ndarray
+            Noise matrix.
+        """
+
+        # extract frequently used variables
+        Delta_tilde = c[0]
+        G = c[4]
+        g_tilde = c[5]
+        gamma_m = c[6]
+        gamma_o = c[7]
+        N = c[9]
+        omegas = [c[10], c[11]]
+        temp = 2 * g_tilde * N
+
+        # constant entries of the drift matrix
+        A_0 = np.zeros(self.dim_corrs, dtype=np.float_)
+        # optical mode
+        A_0[0][0] = - gamma_o / 2
+        A_0[1][1] = - gamma_o / 2
+        # first mechanical mode
+        A_0[2][3] = omegas[0] + 2 * temp
+        A_0[2][5] = - temp
+        A_0[3][2] = - omegas[0] + 2 * temp
+        A_0[3][3] = - gamma_m
+        A_0[3][4] = - temp
+        # second mechanical mode
+        A_0[4][3] = - temp
+        A_0[4][5] = omegas[1] + 2 * temp
+        A_0[5][2] = - temp
+        A_0[5][4] = - omegas[1] + 2 * temp
+        A_0[5][5] = - gamma_m
+
+        # positions of the variable entries in the optical and mechanical modes
+        idxs_A = (np.array([0, 0, 0, 1, 1, 1, 3, 3, 5, 5]), np.array([1, 2, 4, 0, 2, 4, 0, 1, 0, 1]))
+
+        # variable entries of the drift matrix
+        def func_A(modes, t):
+            # derived frequencies
+            Delta = Delta_tilde - 2 * G * np.real(modes[1] + modes[2])
+            G_alpha = np.sqrt(2) * G * modes[0]
+            return np.array([- Delta, np.imag(G_alpha), np.imag(G_alpha), Delta, - np.real(G_alpha), - np.real(G_alpha), - np.real(G_alpha), - np.imag(G_alpha), - np.real(G_alpha), - np.imag(G_alpha)], dtype=np.float_)
+
+        # constant noise matrix
+        D = np.array(self.get_D(
+            modes=None,
+            corrs=None,
+            c=c,
+            t=None
+        ))
+
+        return A_0, idxs_A, func_A, D
+
     def get_transmission(self, c):
         """Method to obtain the transmission.
         
@@ -1046,6 +1448,116 @@ class BEC_10(BaseSystem):
 
         return t_s, t_as
 
+    def get_transmission_peaks_batch(self, deltas, axes=None, num_peaks=2, tol=1e-10):
+        """Method to obtain the positions and separations of the transmission peaks nearest to the centre of a coarse spectrum.
+
+        The local maxima of the transmission on the coarse grid of probe detunings are bracketed by their neighbouring points and those nearest to the centre of the grid are refined together by a golden-section search, reusing the constants derived for each point of the broadcast axes.
+
+        Parameters
+        ----------
+        deltas : numpy.ndarray
+            Coarse grid of probe detunings with normalization and offset determined by the values of ``t_delta_norm`` and ``t_delta_offset``.
+        axes : dict, optional
+            Values of other system parameters to broadcast against, formatted as ``{'L_p': [0, 1, 2], 'l': [18, 20]}``. Each key adds a leading axis in the given order.
+        num_peaks : int, optional
+            Maximum number of peaks nearest to the centre. Default is :math:`2`.
+        tol : float, optional
+            Tolerance of the positions of the peaks. Default is :math:`10^{-10}`.
+
+        Returns
+        -------
+        peaks : numpy.ndarray
+            Positions of the peaks in ascending order padded with ``NaN``, with shape ``(*dims_axes, num_peaks)``.
+        Ts : numpy.ndarray
+            Transmissions at the peaks with shape ``(*dims_axes, num_peaks)``.
+        fwhms : numpy.ndarray
+            Normalized FWHMs at resonance with shape ``(*dims_axes)``.
+        separations : numpy.ndarray
+            Separations between the outermost peaks with shape ``(*dims_axes)``, which are zero for single peaks.
+        """
+
+        # extract frequently used variables
+        deltas = np.asarray(deltas, dtype=np.float_)
+        axes = dict() if axes is None else axes
+        keys = list(axes.keys())
+        shape = tuple(len(axes[key]) for key in keys)
+        ratio = (np.sqrt(5.0) - 1.0) / 2.0
+
+        # initialize arrays
+        peaks = np.full(shape + (num_peaks, ), np.NaN, dtype=np.float_)
+        Ts = np.full(shape + (num_peaks, ), np.NaN, dtype=np.float_)
+        fwhms = np.zeros(shape, dtype=np.float_)
+
+        # backup parameters
+        params_backup = {key: self.params[key] for key in keys + ['delta']}
+
+        # function to calculate the transmissions
+        def func(_deltas):
+            self.params['delta'] = _deltas
+            _, _, c = self.get_ivc()
+            # anti-Stokes field
+            if self.params['t_line'] == 'as':
+                _, _t = self.get_transmission_coeffs(
+                    c=c
+                )
+            # Stokes field
+            else:
+                _t, _ = self.get_transmission_coeffs(
+                    c=c
+                )
+            return np.real(np.conjugate(_t) * _t), c
+
+        try:
+            # for each point in the broadcast axes
+            for idxs in np.ndindex(*shape):
+                # update parameters
+                for i in range(len(keys)):
+                    self.params[keys[i]] = axes[keys[i]][idxs[i]]
+
+                # get coarse transmissions
+                _Ts, c = func(deltas)
+                fwhms[idxs] = self.get_fwhm_norm_resonance(
+                    c=c
+                )
+
+                # local maxima nearest to the centre
+                ks = np.flatnonzero((_Ts[1:-1] >= _Ts[:-2]) & (_Ts[1:-1] >= _Ts[2:])) + 1
+                ks = ks[np.argsort(np.abs(ks - (len(deltas) - 1) / 2.0), kind='stable')][:num_peaks]
+                if len(ks) == 0:
+                    continue
+
+                # golden-section search within the brackets
+                a = deltas[ks - 1]
+                b = deltas[ks + 1]
+                x_1 = b - ratio * (b - a)
+                x_2 = a + ratio * (b - a)
+                T_1, _ = func(x_1)
+                T_2, _ = func(x_2)
+                while np.max(b - a) > tol * (1.0 + np.max(np.abs(deltas))):
+                    is_left = T_1 >= T_2
+                    # shrink brackets
+                    a = np.where(is_left, a, x_1)
+                    b = np.where(is_left, x_2, b)
+                    x_new = np.where(is_left, b - ratio * (b - a), a + ratio * (b - a))
+                    T_new, _ = func(x_new)
+                    # update interior points
+                    x_1, x_2 = np.where(is_left, x_new, x_2), np.where(is_left, x_1, x_new)
+                    T_1, T_2 = np.where(is_left, T_new, T_2), np.where(is_left, T_1, T_new)
+
+                # update arrays
+                _peaks = np.where(T_1 >= T_2, x_1, x_2)
+                _order = np.argsort(_peaks)
+                peaks[idxs][:len(ks)] = _peaks[_order]
+                Ts[idxs][:len(ks)] = np.maximum(T_1, T_2)[_order]
+        finally:
+            # restore parameters
+            self.params.update(params_backup)
+
+        # separations between the outermost peaks
+        separations = np.nan_to_num(np.nanmax(peaks, axis=-1) - np.nanmin(peaks, axis=-1)) if num_peaks > 0 else np.zeros(shape, dtype=np.float_)
+
+        return peaks, Ts, fwhms, separations
+
     def get_transmission_phase(self, c):
         """Method to obtain the phase of transmission phase.
         
@@ -1099,4 +1611,77 @@ class BEC_10(BaseSystem):
         # calculate transmission
         T = (C_mathcal / (1 + C_mathcal))**2
 
-        return T
\ No newline at end of file
+        return T
+
+    def get_transmission_spectra(self, deltas, axes=None):
+        """Method to obtain the transmission, dispersion, absorption and transmission phase for an array of probe detunings.
+
+        The constants are derived once for each point of the broadcast axes with the probe detuning as an array, so that the steady state and the effective values are reused for the complete spectrum.
+
+        Parameters
+        ----------
+        deltas : numpy.ndarray
+            Probe detunings with normalization and offset determined by the values of ``t_delta_norm`` and ``t_delta_offset``.
+        axes : dict, optional
+            Values of other system parameters to broadcast against, formatted as ``{'L_p': [0, 1, 2], 'l': [18, 20]}``. Each key adds a leading axis in the given order.
+
+        Returns
+        -------
+        Ts : numpy.ndarray
+            Transmissions with shape ``(*dims_axes, len(deltas))``.
+        dispers : numpy.ndarray
+            Dispersions with shape ``(*dims_axes, len(deltas))``.
+        absorps : numpy.ndarray
+            Absorptions with shape ``(*dims_axes, len(deltas))``.
+        phis : numpy.ndarray
+            Transmission phases with shape ``(*dims_axes, len(deltas))``.
+        """
+
+        # extract frequently used variables
+        deltas = np.asarray(deltas, dtype=np.float_)
+        axes = dict() if axes is None else axes
+        keys = list(axes.keys())
+        shape = tuple(len(axes[key]) for key in keys)
+
+        # initialize arrays
+        Ts = np.zeros(shape + deltas.shape, dtype=np.float_)
+        dispers = np.zeros(shape + deltas.shape, dtype=np.float_)
+        absorps = np.zeros(shape + deltas.shape, dtype=np.float_)
+        phis = np.zeros(shape + deltas.shape, dtype=np.float_)
+
+        # backup parameters
+        params_backup = {key: self.params[key] for key in keys + ['delta']}
+
+        try:
+            # for each point in the broadcast axes
+            for idxs in np.ndindex(*shape):
+                # update parameters
+                for i in range(len(keys)):
+                    self.params[keys[i]] = axes[keys[i]][idxs[i]]
+                self.params['delta'] = deltas
+
+                # get constants with the array of probe detunings
+                _, _, c = self.get_ivc()
+
+                # get transmission coefficient
+                # anti-Stokes field
+                if self.params['t_line'] == 'as':
+                    _, _t = self.get_transmission_coeffs(
+                        c=c
+                    )
+                # Stokes field
+                else:
+                    _t, _ = self.get_transmission_coeffs(
+                        c=c
+                    )
+
+                # update arrays
+                Ts[idxs] = np.real(np.conjugate(_t) * _t)
+                dispers[idxs] = np.imag(1 - _t)
+                absorps[idxs] = np.real(1 - _t)
+                phis[idxs] = np.angle(_t)
+        finally:
+            # restore parameters
+            self.params.update(params_backup)
+
+        return Ts, dispers, absorps, phis
\ No newline at end of file
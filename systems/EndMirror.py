@@ -6,7 +6,7 @@
 __authors__ = ["Sampreet Kalita"]
 __toolbox__ = 'qom-v1.0.1'
 __created__ = "2021-01-01"
-__updated__ = "2024-01-09"
+__updated__ = "2026-10-18"
 
 # dependencies
 import numpy as np
@@ -15,7 +15,120 @@ import scipy.constants as sc
 # qom modules
 from qom.systems import BaseSystem
 
-class EM_00(BaseSystem):
+# local modules
+from utils.continuation import get_pseudo_arclength_continuation
+from utils.matrices import get_jacobian_corrs
+from utils.params import RebindableSystem
+from utils.polynomials import get_real_roots
+
+def get_drift_matrices(params, alpha_r, alpha_i, beta_r):
+    """Function to obtain the drift matrices of the end-mirror systems.
+
+    The modes and the parameters can be arrays, in which case the matrices are evaluated for each set of values.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters of the systems containing ``'Delta_0_norm'``, ``'g_0_norm'``, ``'gamma_norm'`` and ``'kappa_norm'``.
+    alpha_r : float or numpy.ndarray
+        Real parts of the optical modes.
+    alpha_i : float or numpy.ndarray
+        Imaginary parts of the optical modes.
+    beta_r : float or numpy.ndarray
+        Real parts of the mechanical modes.
+
+    Returns
+    -------
+    A : numpy.ndarray
+        Drift matrices with shape ``(..., 4, 4)``.
+    """
+
+    # extract frequently used variables
+    kappa_norm = params['kappa_norm']
+    gamma_norm = params['gamma_norm']
+    g_0_norm = params['g_0_norm']
+
+    # effective values
+    Delta_norm = params['Delta_0_norm'] + 2.0 * g_0_norm * beta_r
+
+    # initialize drift matrices
+    A = np.zeros(getattr(alpha_r * alpha_i * Delta_norm * kappa_norm * gamma_norm, 'shape', ()) + (4, 4), dtype=np.float_)
+    # X quadratures
+    A[..., 0, 0] = - kappa_norm / 2.0
+    A[..., 0, 1] = - Delta_norm
+    A[..., 0, 2] = - 2.0 * g_0_norm * alpha_i
+    # Y quadratures
+    A[..., 1, 0] = Delta_norm
+    A[..., 1, 1] = - kappa_norm / 2.0
+    A[..., 1, 2] = 2.0 * g_0_norm * alpha_r
+    # Q quadratures
+    A[..., 2, 2] = - gamma_norm / 2.0
+    A[..., 2, 3] = 1.0
+    # P quadratures
+    A[..., 3, 0] = 2.0 * g_0_norm * alpha_r
+    A[..., 3, 1] = 2.0 * g_0_norm * alpha_i
+    A[..., 3, 2] = - 1.0
+    A[..., 3, 3] = - gamma_norm / 2.0
+
+    return A
+
+def get_jacobian_rates(params, v):
+    """Function to obtain the Jacobian of the rates of change of the real-valued modes and correlations of the end-mirror systems.
+
+    The drive of the optical mode is independent of the modes and the correlations, so that the Jacobian is shared by the systems with and without modulations.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters of the system containing ``'Delta_0_norm'``, ``'g_0_norm'``, ``'gamma_norm'`` and ``'kappa_norm'``.
+    v : numpy.ndarray
+        Real parts of the modes, imaginary parts of the modes and flattened correlations.
+
+    Returns
+    -------
+    J : numpy.ndarray
+        Jacobian of the rates of change.
+    """
+
+    # extract frequently used variables
+    g_0_norm = params['g_0_norm']
+    alpha_r, beta_r, alpha_i, beta_i = v[:4]
+
+    # drift matrix
+    A = get_drift_matrices(
+        params=params,
+        alpha_r=alpha_r,
+        alpha_i=alpha_i,
+        beta_r=beta_r
+    )
+
+    # derivatives of the drift matrix with respect to the real-valued modes
+    dAs = np.zeros((4, 4, 4), dtype=np.float_)
+    dAs[0][1][2] = 2.0 * g_0_norm
+    dAs[0][3][0] = 2.0 * g_0_norm
+    dAs[1][0][1] = - 2.0 * g_0_norm
+    dAs[1][1][0] = 2.0 * g_0_norm
+    dAs[2][0][2] = - 2.0 * g_0_norm
+    dAs[2][3][1] = 2.0 * g_0_norm
+
+    # Jacobian of the modes
+    J = np.zeros((20, 20), dtype=np.float_)
+    J[:4, :4] = [
+        [A[0, 0], A[0, 2], A[0, 1], 0.0],
+        [0.0, A[2, 2], 0.0, 1.0],
+        [A[1, 0], A[1, 2], A[1, 1], 0.0],
+        [A[3, 0], A[3, 2], A[3, 1], A[3, 3]]
+    ]
+    # Jacobian of the correlations
+    J[4:, :4], J[4:, 4:] = get_jacobian_corrs(
+        A=A,
+        corrs=np.reshape(v[4:], (4, 4)),
+        dAs=dAs
+    )
+
+    return J
+
+class EM_00(RebindableSystem, BaseSystem):
     r"""Class to simulate an optomechanical system with a moveable end-mirror.
     
     Parameters
@@ -84,29 +197,93 @@ class EM_00(BaseSystem):
         # extract frequently used variables
         alpha, beta = modes
 
-        # effective values
-        Delta_norm = self.params['Delta_0_norm'] + 2 * self.params['g_0_norm'] * np.real(beta)
-        g_norm = self.params['g_0_norm'] * alpha
-
-        # X quadratures
-        self.A[0][0] = - self.params['kappa_norm'] / 2.0
-        self.A[0][1] = - Delta_norm
-        self.A[0][2] = - 2.0 * np.imag(g_norm)
-        # Y quadratures
-        self.A[1][0] = Delta_norm
-        self.A[1][1] = - self.params['kappa_norm'] / 2.0
-        self.A[1][2] = 2.0 * np.real(g_norm)
-        # Q quadratures
-        self.A[2][2] = - self.params['gamma_norm'] / 2.0
-        self.A[2][3] = 1.0
-        # P quadratures
-        self.A[3][0] = 2.0 * np.real(g_norm)
-        self.A[3][1] = 2.0 * np.imag(g_norm)
-        self.A[3][2] = - 1.0
-        self.A[3][3] = - self.params['gamma_norm'] / 2.0
+        # drift matrix
+        self.A[:] = get_drift_matrices(
+            params=self.params,
+            alpha_r=np.real(alpha),
+            alpha_i=np.imag(alpha),
+            beta_r=np.real(beta)
+        )
 
         return self.A
     
+    def get_A_ensemble(self, modes, params, t):
+        """Method to obtain the drift matrices of an ensemble of systems.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes with shape ``(K, 2)``.
+        params : dict
+            Parameters of the systems as arrays with leading dimension ``K``.
+        t : numpy.ndarray
+            Times of the systems with shape ``(K, )``.
+        
+        Returns
+        -------
+        A : numpy.ndarray
+            Drift matrices with shape ``(K, 4, 4)``.
+        """
+
+        # extract frequently used variables
+        alpha = modes[:, 0]
+        beta = modes[:, 1]
+
+        # drift matrices
+        A = get_drift_matrices(
+            params=params,
+            alpha_r=np.real(alpha),
+            alpha_i=np.imag(alpha),
+            beta_r=np.real(beta)
+        )
+
+        return A
+
+    def get_bistable_intervals(self, Delta_0_norms, g_0_norms=None, A_l_norms=None):
+        """Method to obtain the intervals of bistability along a sweep of the laser detuning.
+
+        The parameters are broadcast together and the sweep is taken along the last axis.
+
+        Parameters
+        ----------
+        Delta_0_norms : numpy.ndarray
+            Normalized detunings of the laser along the last axis.
+        g_0_norms : numpy.ndarray, optional
+            Normalized optomechanical coupling strengths, for example with shape ``(m, 1)``. Default is the value in ``params``.
+        A_l_norms : numpy.ndarray, optional
+            Normalized amplitudes of the laser. Default is the value in ``params``.
+
+        Returns
+        -------
+        intervals : numpy.ndarray
+            First and last bistable detunings of each interval padded with ``NaN``, with shape ``(..., num_intervals, 2)``.
+        """
+
+        # get bistable points
+        _, is_bistable = self.get_mean_optical_occupancies_batch(
+            Delta_0_norms=Delta_0_norms,
+            g_0_norms=g_0_norms,
+            A_l_norms=A_l_norms
+        )
+        Delta_0_norms = np.broadcast_to(Delta_0_norms, is_bistable.shape)
+
+        # locate rising and falling edges
+        _pads = [(0, 0)] * (is_bistable.ndim - 1) + [(1, 1)]
+        edges = np.diff(np.pad(is_bistable.astype(np.int8), _pads), axis=-1)
+        num_intervals = np.max(np.count_nonzero(edges == 1, axis=-1), initial=0)
+
+        # initialize intervals
+        intervals = np.full(is_bistable.shape[:-1] + (num_intervals, 2), np.nan, dtype=np.float_)
+
+        # for each sweep
+        for idxs in np.ndindex(*is_bistable.shape[:-1]):
+            starts = np.flatnonzero(edges[idxs] == 1)
+            stops = np.flatnonzero(edges[idxs] == -1) - 1
+            intervals[idxs][:len(starts), 0] = Delta_0_norms[idxs][starts]
+            intervals[idxs][:len(stops), 1] = Delta_0_norms[idxs][stops]
+
+        return intervals
+
     def get_coeffs_N_o(self, c):
         """Method to obtain coefficients of the polynomial in mean optical occupancy.
         
@@ -166,6 +343,40 @@ class EM_00(BaseSystem):
 
         return self.D
 
+    def get_D_ensemble(self, modes, corrs, params, t):
+        """Method to obtain the noise matrices of an ensemble of systems.
+        
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes with shape ``(K, 2)``.
+        corrs : numpy.ndarray
+            Quantum correlations with shape ``(K, 4, 4)``.
+        params : dict
+            Parameters of the systems as arrays with leading dimension ``K``.
+        t : numpy.ndarray
+            Times of the systems with shape ``(K, )``.
+        
+        Returns
+        -------
+        D : numpy.ndarray
+            Noise matrices with shape ``(K, 4, 4)``.
+        """
+
+        # thermal phonon numbers
+        T_norm = np.asarray(params['T_norm'], dtype=np.float_)
+        with np.errstate(divide='ignore', over='ignore'):
+            n_th = np.where(T_norm == 0.0, 0.0, 1.0 / (np.exp(sc.hbar / sc.k / T_norm) - 1.0))
+
+        # update noise matrices
+        D = np.zeros((len(modes), 4, 4), dtype=np.float_)
+        D[:, 0, 0] = params['kappa_norm'] / 2.0
+        D[:, 1, 1] = params['kappa_norm'] / 2.0
+        D[:, 2, 2] = params['gamma_norm'] * (n_th + 0.5)
+        D[:, 3, 3] = params['gamma_norm'] * (n_th + 0.5)
+
+        return D
+
     def get_ivc(self):
         """Method to obtain the initial values of the modes, correlations and derived constants and controls.
         
@@ -194,6 +405,156 @@ class EM_00(BaseSystem):
 
         return iv_modes, iv_corrs, None
 
+    def get_jacobian_modes_corrs(self, t, v, c):
+        """Method to obtain the Jacobian of the rates of change of the real-valued modes and correlations.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+        v : numpy.ndarray
+            Real parts of the modes, imaginary parts of the modes and flattened correlations.
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        J : numpy.ndarray
+            Jacobian of the rates of change.
+        """
+
+        return get_jacobian_rates(
+            params=self.params,
+            v=v
+        )
+
+    def get_mean_optical_occupancies_batch(self, Delta_0_norms=None, g_0_norms=None, A_l_norms=None):
+        """Method to obtain the mean optical occupancies for arrays of parameters.
+
+        The cubic polynomials in mean optical occupancy are solved together using their companion matrices.
+
+        Parameters
+        ----------
+        Delta_0_norms : numpy.ndarray, optional
+            Normalized detunings of the laser. Default is the value in ``params``.
+        g_0_norms : numpy.ndarray, optional
+            Normalized optomechanical coupling strengths. Default is the value in ``params``.
+        A_l_norms : numpy.ndarray, optional
+            Normalized amplitudes of the laser. Default is the value in ``params``.
+
+        Returns
+        -------
+        N_os : numpy.ndarray
+            Real mean optical occupancies in descending order padded with ``NaN``, with shape ``(..., 3)``.
+        is_bistable : numpy.ndarray
+            Boolean mask of the points with three real mean optical occupancies.
+        """
+
+        # frequently used variables
+        A_l_norm, Delta_0_norm, _, kappa_norm, C = self.get_params_steady_state_batch(
+            Delta_0_norms=Delta_0_norms,
+            g_0_norms=g_0_norms,
+            A_l_norms=A_l_norms
+        )
+
+        # get coefficients
+        coeffs = np.zeros(np.shape(C) + (2 * self.num_modes, ), dtype=np.float_)
+        coeffs[..., 0] = 4.0 * C**2
+        coeffs[..., 1] = 8.0 * C * Delta_0_norm
+        coeffs[..., 2] = 4.0 * Delta_0_norm**2 + kappa_norm**2
+        coeffs[..., 3] = - 4.0 * np.real(np.conjugate(A_l_norm) * A_l_norm)
+
+        # get real roots
+        N_os = get_real_roots(coeffs)
+
+        return N_os, np.count_nonzero(~ np.isnan(N_os), axis=-1) == 3
+
+    def get_mean_optical_occupancy_branches(self, val_min, val_max, var='Delta_0_norm', ds_max=1e-1):
+        """Method to obtain the branches of the mean optical occupancy along a parameter by pseudo-arclength continuation.
+
+        The curves of the real roots of the polynomial in mean optical occupancy are traced from each real root at the minimum value of the parameter, with the occupancy scaled by its value for the resonant empty cavity and the parameter scaled by the width of the interval. The curves are split into branches at their turning points, which are the saddle-node bifurcations of the steady states, and the intervals of bistability are those covered by three branches.
+
+        Parameters
+        ----------
+        val_min : float
+            Minimum value of the parameter.
+        val_max : float
+            Maximum value of the parameter.
+        var : str, optional
+            Name of the parameter. Default is ``'Delta_0_norm'``.
+        ds_max : float, optional
+            Maximum step size of the continuation in the scaled variables. Default is :math:`10^{-1}`.
+
+        Returns
+        -------
+        branches : list
+            Values of the parameter and the mean optical occupancies along each branch, with shapes ``(num_points, 2)``.
+        turning_points : numpy.ndarray
+            Values of the parameter and the mean optical occupancies at the turning points, with shape ``(num_turning, 2)``.
+        intervals : numpy.ndarray
+            First and last values of the parameter of each interval of bistability, with shape ``(num_intervals, 2)``.
+        """
+
+        # extract frequently used variables
+        val_backup = self.params[var]
+        scales = [4.0 * np.abs(self.params['A_l_norm'])**2 / self.params['kappa_norm']**2, val_max - val_min]
+
+        # function to calculate the residuals of the polynomial
+        def func(x, p):
+            self.params[var] = p
+            return np.polyval(self.get_coeffs_N_o(
+                c=self.get_ivc()[2]
+            ), x[0])
+
+        # get mean optical occupancies at the minimum value
+        self.params[var] = val_min
+        N_os = get_real_roots(self.get_coeffs_N_o(
+            c=self.get_ivc()[2]
+        ))
+
+        # trace the curves from the roots not already on a curve
+        curves = list()
+        for N_o in N_os[~ np.isnan(N_os)]:
+            if np.any([np.abs(curve[-1, 0] - val_min) <= 1e-12 * scales[1] and np.abs(curve[-1, 1] - N_o) <= 1e-6 * scales[0] for curve, _ in curves]):
+                continue
+            ys, idxs_turning, _ = get_pseudo_arclength_continuation(
+                func=func,
+                x_0=[N_o],
+                p_0=val_min,
+                p_min=val_min,
+                p_max=val_max,
+                scales=scales,
+                ds_max=ds_max
+            )
+            curves.append((ys[:, ::-1], idxs_turning))
+
+        # restore parameter
+        self.params[var] = val_backup
+
+        # split the curves at the turning points
+        branches = list()
+        turning_points = list()
+        for curve, idxs_turning in curves:
+            idxs = [0] + list(idxs_turning) + [len(curve) - 1]
+            for j in range(len(idxs) - 1):
+                branches.append(curve[idxs[j]:idxs[j + 1] + 1])
+            turning_points += list(curve[idxs_turning])
+        turning_points = np.reshape(turning_points, (-1, 2))
+
+        # count the branches between the turning points
+        vals = np.unique(np.concatenate(([val_min, val_max], turning_points[:, 0])))
+        counts = np.array([np.sum([np.min(branch[:, 0]) <= val <= np.max(branch[:, 0]) for branch in branches]) for val in (vals[:-1] + vals[1:]) / 2.0])
+
+        # merge the bistable segments
+        intervals = list()
+        for j in np.flatnonzero(counts >= 3):
+            if len(intervals) > 0 and intervals[-1][1] == vals[j]:
+                intervals[-1][1] = vals[j + 1]
+            else:
+                intervals.append([vals[j], vals[j + 1]])
+
+        return branches, turning_points, np.reshape(intervals, (-1, 2))
+
     def get_mode_rates(self, modes, c, t):
         """Method to obtain the rates of change of the modes.
 
@@ -225,6 +586,39 @@ class EM_00(BaseSystem):
 
         return np.array([dalpha_dt, dbeta_dt], dtype=np.complex_)
 
+    def get_mode_rates_ensemble(self, modes, params, t):
+        """Method to obtain the rates of change of the modes of an ensemble of systems.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes with shape ``(K, 2)``.
+        params : dict
+            Parameters of the systems as arrays with leading dimension ``K``.
+        t : numpy.ndarray
+            Times of the systems with shape ``(K, )``.
+        
+        Returns
+        -------
+        mode_rates : numpy.ndarray
+            Rates of change of the modes with shape ``(K, 2)``.
+        """
+
+        # extract frequently used variables
+        alpha = modes[:, 0]
+        beta = modes[:, 1]
+
+        # effective values
+        Delta_norm = params['Delta_0_norm'] + 2 * params['g_0_norm'] * np.real(beta)
+        g_norm = params['g_0_norm'] * alpha
+
+        # calculate mode rates
+        mode_rates = np.empty((len(modes), 2), dtype=np.complex_)
+        mode_rates[:, 0] = - params['kappa_norm'] / 2 * alpha + 1.0j * Delta_norm * alpha + params['A_l_norm']
+        mode_rates[:, 1] = 1.0j * g_norm * np.conjugate(alpha) - params['gamma_norm'] / 2.0 * beta - 1.0j * beta
+
+        return mode_rates
+
     def get_modes_steady_state(self, c):
         """Method to obtain the steady state modes.
         
@@ -258,6 +652,52 @@ class EM_00(BaseSystem):
 
         return Modes
 
+    def get_modes_steady_state_batch(self, Delta_0_norms=None, g_0_norms=None, A_l_norms=None):
+        """Method to obtain the steady state modes for arrays of parameters.
+
+        Parameters
+        ----------
+        Delta_0_norms : numpy.ndarray, optional
+            Normalized detunings of the laser. Default is the value in ``params``.
+        g_0_norms : numpy.ndarray, optional
+            Normalized optomechanical coupling strengths. Default is the value in ``params``.
+        A_l_norms : numpy.ndarray, optional
+            Normalized amplitudes of the laser. Default is the value in ``params``.
+
+        Returns
+        -------
+        Modes : numpy.ndarray
+            Steady state modes for each real mean optical occupancy padded with ``NaN``, with shape ``(..., 3, num_modes)``.
+        """
+
+        # frequently used variables
+        A_l_norm, Delta_0_norm, g_0_norm, kappa_norm, C = self.get_params_steady_state_batch(
+            Delta_0_norms=Delta_0_norms,
+            g_0_norms=g_0_norms,
+            A_l_norms=A_l_norms
+        )
+
+        # get mean optical occupancies
+        N_os, _ = self.get_mean_optical_occupancies_batch(
+            Delta_0_norms=Delta_0_norms,
+            g_0_norms=g_0_norms,
+            A_l_norms=A_l_norms
+        )
+
+        # expand parameters along the roots
+        A_l_norm = np.expand_dims(A_l_norm, -1)
+        Delta_0_norm = np.expand_dims(Delta_0_norm, -1)
+        g_0_norm = np.expand_dims(g_0_norm, -1)
+        C = np.expand_dims(C, -1)
+
+        # calculate mode amplitudes ignoring the padded occupancies
+        Modes = np.zeros(np.shape(N_os) + (self.num_modes, ), dtype=np.complex_)
+        with np.errstate(invalid='ignore'):
+            Modes[..., 0] = A_l_norm / (kappa_norm / 2.0 - 1.0j * (Delta_0_norm + C * N_os))
+            Modes[..., 1] = 1.0j * g_0_norm * N_os * (self.params['gamma_norm'] / 2.0 + 1.0j * 1.0) / (self.params['gamma_norm']**2 / 4.0 + 1.0**2)
+
+        return Modes
+
     def get_optomechanical_damping_rate_norm(self, c):
         r"""Method to obtain the normalized optomechanical damping rate :math:`\gamma_{om} \omega_{m} / g_{s}^{2}`.
 
@@ -352,8 +792,102 @@ class EM_00(BaseSystem):
         C = 2.0 * self.params['g_0_norm']**2 * 1.0 / (self.params['gamma_norm']**2 / 4.0 + 1.0**2)
         
         return self.params['A_l_norm'], self.params['Delta_0_norm'], self.params['kappa_norm'], C
+
+    def get_params_steady_state_batch(self, Delta_0_norms=None, g_0_norms=None, A_l_norms=None):
+        r"""Method to obtain the parameters required to calculate the optical steady states for arrays of parameters.
+
+        Parameters
+        ----------
+        Delta_0_norms : numpy.ndarray, optional
+            Normalized detunings of the laser. Default is the value in ``params``.
+        g_0_norms : numpy.ndarray, optional
+            Normalized optomechanical coupling strengths. Default is the value in ``params``.
+        A_l_norms : numpy.ndarray, optional
+            Normalized amplitudes of the laser. Default is the value in ``params``.
+
+        Returns
+        -------
+        A_l_norm : numpy.ndarray
+            Normalized amplitudes of the laser.
+        Delta_0_norm : numpy.ndarray
+            Normalized detunings of the laser.
+        g_0_norm : numpy.ndarray
+            Normalized optomechanical coupling strengths.
+        kappa_norm : float
+            Normalized optical decay rate.
+        C : numpy.ndarray
+            Coefficients of :math:`| \alpha_{s} |^{2}`.
+        """
+
+        # broadcast parameters
+        A_l_norm, Delta_0_norm, g_0_norm = np.broadcast_arrays(
+            self.params['A_l_norm'] if A_l_norms is None else np.asarray(A_l_norms),
+            self.params['Delta_0_norm'] if Delta_0_norms is None else np.asarray(Delta_0_norms),
+            self.params['g_0_norm'] if g_0_norms is None else np.asarray(g_0_norms)
+        )
+
+        # coefficient of the mean optical occupancies
+        C = 2.0 * g_0_norm**2 * 1.0 / (self.params['gamma_norm']**2 / 4.0 + 1.0**2)
+        
+        return A_l_norm, Delta_0_norm, g_0_norm, self.params['kappa_norm'], C
     
-class EM_01(BaseSystem):
+
+    def get_rates_modes_corrs(self, t, v, c):
+        """Method to obtain the rates of change of the real-valued modes and correlations.
+
+        The rates of the modes and the correlations are evaluated together with the drift and noise matrices built as arrays.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+        v : numpy.ndarray
+            Real parts of the modes, imaginary parts of the modes and flattened correlations.
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        rates : numpy.ndarray
+            Rates of change of the real-valued modes and correlations.
+        """
+
+        # extract frequently used variables
+        kappa_norm = self.params['kappa_norm']
+        gamma_norm = self.params['gamma_norm']
+        g_0_norm = self.params['g_0_norm']
+        alpha_r, beta_r, alpha_i, beta_i = v[:4]
+        corrs = np.reshape(v[4:], (4, 4))
+        n_th = 0.0 if self.params['T_norm'] == 0.0 else 1.0 / (np.exp(sc.hbar / sc.k / self.params['T_norm']) - 1.0)
+
+        # amplitude of the laser
+        A_l_norm = self.params['A_l_norm']
+
+        # effective values
+        Delta_norm = self.params['Delta_0_norm'] + 2.0 * g_0_norm * beta_r
+
+        # drift matrix
+        A = get_drift_matrices(
+            params=self.params,
+            alpha_r=alpha_r,
+            alpha_i=alpha_i,
+            beta_r=beta_r
+        )
+
+        # noise matrix
+        D = np.diag([kappa_norm / 2.0, kappa_norm / 2.0, gamma_norm * (n_th + 0.5), gamma_norm * (n_th + 0.5)])
+
+        # calculate rates
+        rates = np.empty(20, dtype=np.float_)
+        rates[0] = - kappa_norm / 2.0 * alpha_r - Delta_norm * alpha_i + np.real(A_l_norm)
+        rates[1] = - gamma_norm / 2.0 * beta_r + beta_i
+        rates[2] = - kappa_norm / 2.0 * alpha_i + Delta_norm * alpha_r + np.imag(A_l_norm)
+        rates[3] = g_0_norm * (alpha_r**2 + alpha_i**2) - gamma_norm / 2.0 * beta_i - beta_r
+        rates[4:] = np.ravel(A.dot(corrs) + corrs.dot(np.transpose(A)) + D)
+
+        return rates
+
+class EM_01(RebindableSystem, BaseSystem):
     r"""Class to simulate the modulated QOM system in Phys. Rev. Lett. **103**, 213603 (2009).
 
     Parameters
@@ -408,26 +942,13 @@ class EM_01(BaseSystem):
         # extract frequently used variables
         alpha, beta = modes
 
-        # effective values
-        Delta_norm = self.params['Delta_0_norm'] + 2 * self.params['g_0_norm'] * np.real(beta)
-        g_norm = self.params['g_0_norm'] * alpha
-
-        # X quadratures
-        self.A[0][0] = - self.params['kappa_norm'] / 2.0
-        self.A[0][1] = - Delta_norm
-        self.A[0][2] = - 2.0 * np.imag(g_norm)
-        # Y quadratures
-        self.A[1][0] = Delta_norm
-        self.A[1][1] = - self.params['kappa_norm'] / 2.0
-        self.A[1][2] = 2.0 * np.real(g_norm)
-        # Q quadratures
-        self.A[2][2] = - self.params['gamma_norm'] / 2.0
-        self.A[2][3] = 1.0
-        # P quadratures
-        self.A[3][0] = 2.0 * np.real(g_norm)
-        self.A[3][1] = 2.0 * np.imag(g_norm)
-        self.A[3][2] = - 1.0
-        self.A[3][3] = - self.params['gamma_norm'] / 2.0
+        # drift matrix
+        self.A[:] = get_drift_matrices(
+            params=self.params,
+            alpha_r=np.real(alpha),
+            alpha_i=np.imag(alpha),
+            beta_r=np.real(beta)
+        )
 
         return self.A
     
@@ -490,6 +1011,29 @@ class EM_01(BaseSystem):
 
         return iv_modes, iv_corrs, None
 
+    def get_jacobian_modes_corrs(self, t, v, c):
+        """Method to obtain the Jacobian of the rates of change of the real-valued modes and correlations.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+        v : numpy.ndarray
+            Real parts of the modes, imaginary parts of the modes and flattened correlations.
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        J : numpy.ndarray
+            Jacobian of the rates of change.
+        """
+
+        return get_jacobian_rates(
+            params=self.params,
+            v=v
+        )
+
     def get_mode_rates(self, modes, c, t):
         """Method to obtain the rates of change of the modes.
 
@@ -519,4 +1063,59 @@ class EM_01(BaseSystem):
         dalpha_dt = - self.params['kappa_norm'] / 2 * alpha + 1.0j * Delta_norm * alpha + self.params['A_l_norms'][0] + self.params['A_l_norms'][1] * np.exp(- 1.0j * self.params['Omega_norm'] * t) + self.params['A_l_norms'][2] * np.exp(1.0j * self.params['Omega_norm'] * t) 
         dbeta_dt = 1.0j * g_norm * np.conjugate(alpha) - self.params['gamma_norm'] / 2.0 * beta - 1.0j * beta
 
-        return np.array([dalpha_dt, dbeta_dt], dtype=np.complex_)
\ No newline at end of file
+        return np.array([dalpha_dt, dbeta_dt], dtype=np.complex_)
+
+    def get_rates_modes_corrs(self, t, v, c):
+        """Method to obtain the rates of change of the real-valued modes and correlations.
+
+        The rates of the modes and the correlations are evaluated together with the drift and noise matrices built as arrays.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+        v : numpy.ndarray
+            Real parts of the modes, imaginary parts of the modes and flattened correlations.
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        rates : numpy.ndarray
+            Rates of change of the real-valued modes and correlations.
+        """
+
+        # extract frequently used variables
+        kappa_norm = self.params['kappa_norm']
+        gamma_norm = self.params['gamma_norm']
+        g_0_norm = self.params['g_0_norm']
+        alpha_r, beta_r, alpha_i, beta_i = v[:4]
+        corrs = np.reshape(v[4:], (4, 4))
+        n_th = 0.0 if self.params['T_norm'] == 0.0 else 1.0 / (np.exp(sc.hbar / sc.k / self.params['T_norm']) - 1.0)
+
+        # modulated amplitude of the laser
+        A_l_norm = self.params['A_l_norms'][0] + self.params['A_l_norms'][1] * np.exp(- 1.0j * self.params['Omega_norm'] * t) + self.params['A_l_norms'][2] * np.exp(1.0j * self.params['Omega_norm'] * t)
+
+        # effective values
+        Delta_norm = self.params['Delta_0_norm'] + 2.0 * g_0_norm * beta_r
+
+        # drift matrix
+        A = get_drift_matrices(
+            params=self.params,
+            alpha_r=alpha_r,
+            alpha_i=alpha_i,
+            beta_r=beta_r
+        )
+
+        # noise matrix
+        D = np.diag([kappa_norm / 2.0, kappa_norm / 2.0, gamma_norm * (n_th + 0.5), gamma_norm * (n_th + 0.5)])
+
+        # calculate rates
+        rates = np.empty(20, dtype=np.float_)
+        rates[0] = - kappa_norm / 2.0 * alpha_r - Delta_norm * alpha_i + np.real(A_l_norm)
+        rates[1] = - gamma_norm / 2.0 * beta_r + beta_i
+        rates[2] = - kappa_norm / 2.0 * alpha_i + Delta_norm * alpha_r + np.imag(A_l_norm)
+        rates[3] = g_0_norm * (alpha_r**2 + alpha_i**2) - gamma_norm / 2.0 * beta_i - beta_r
+        rates[4:] = np.ravel(A.dot(corrs) + corrs.dot(np.transpose(A)) + D)
+
+        return rates
\ No newline at end of file
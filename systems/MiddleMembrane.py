@@ -6,16 +6,21 @@
 __authors__ = ["Sampreet Kalita"]
 __toolbox__ = 'qom-v1.0.1'
 __created__ = "2022-04-01"
-__updated__ = "2024-01-09"
+__updated__ = "2026-10-18"
 
 # dependencies
 import numpy as np
-import scipy.integrate as si
 
 # qom modules
 from qom.systems import BaseSystem
 
-class MM_01(BaseSystem):
+# local modules
+from utils.integrals import get_integrals_real_line
+from utils.matrices import get_lyapunov_solutions
+from utils.modulations import HarmonicDrives
+from utils.params import RebindableSystem
+
+class MM_01(RebindableSystem, BaseSystem):
     r"""Class to simulate a membrane-in-the-middle system driven by a modulated laser using constant mode amplitudes.
 
     Parameters
@@ -52,6 +57,11 @@ class MM_01(BaseSystem):
         't_rwa'         : True
     }
 
+    # parameters on which the derived quantities of each instance depend
+    derived_dependencies = {
+        'drives'    : ['alphas', 'betas', 'Omega_norms']
+    }
+
     def __init__(self, params, cb_update=None):
         """Class constructor for MM_01."""
         
@@ -90,7 +100,6 @@ class MM_01(BaseSystem):
         g_norm = self.params['g_norm']
         gamma_norm = self.params['gamma_norm']
         kappa_norm = self.params['kappa_norm']
-        Omega_a_norm, Omega_b_norm = self.params['Omega_norms']
 
         # with RWA
         if self.params['t_rwa']:
@@ -117,13 +126,10 @@ class MM_01(BaseSystem):
         # without RWA
         else:
             # extract frequently used variables
-            alpha_0, alpha_m, alpha_p = self.params['alphas']
-            beta_0, beta_m, beta_p = self.params['betas']
             Delta_norm = self.params['Delta_norm']
             
             # modes
-            alpha = alpha_0 + alpha_m * np.exp(1.0j * Omega_a_norm * t) + alpha_p * np.exp(-1.0j * Omega_a_norm * t)
-            beta = beta_0 + beta_m * np.exp(1.0j * Omega_b_norm * t) + beta_p * np.exp(-1.0j * Omega_b_norm * t)
+            alpha, beta = self.get_drives().get_values(t)
 
             # X quadratures
             self.A[0][0] = - kappa_norm / 2.0
@@ -144,8 +150,8 @@ class MM_01(BaseSystem):
 
         return self.A
 
-    def get_params_ratio(self, c):
-        """Method to obtain the squeezing ratio.
+    def get_corrs_steady_state_rwa(self, c):
+        """Method to obtain the steady-state quantum correlations under RWA.
 
         Parameters
         ----------
@@ -154,49 +160,86 @@ class MM_01(BaseSystem):
         
         Returns
         -------
-        ratio : numpy.ndarray
-            Squeezing ratio.
+        corrs : numpy.ndarray
+            Steady-state quantum correlations, set to ``NaN`` if the drift matrix is unstable.
         """
 
-        # get normalized effective couplings
-        G_minus_norm, G_plus_norm, _, _ = self.get_params_G_norms(
-            c=c
-        )
+        return self.get_corrs_steady_state_rwa_batch()[0]
 
-        return (G_plus_norm - G_minus_norm) / (G_plus_norm + G_minus_norm)
+    def get_corrs_steady_state_rwa_batch(self, alphas=None, betas=None, g_norms=None, gamma_norms=None, kappa_norms=None, ns=None):
+        r"""Method to obtain the steady-state quantum correlations under RWA for a batch of parameters.
 
-    def get_params_G_norms(self, c):
-        """Method to obtain the normalized effective couplings.
+        Under RWA, the drift matrix is constant and the correlations relax to the solution of the Lyapunov equation :math:`A V + V A^{T} + D = 0`, which is obtained directly without integrating in time. The parameters are broadcasted together.
 
         Parameters
         ----------
-        c : numpy.ndarray
-            Derived constants and controls.
+        alphas : list, optional
+            Base and sideband amplitudes of the optical mode, each a float or a numpy.ndarray. Default is the value in ``params``.
+        betas : list, optional
+            Base and sideband amplitudes of the mechanical mode, each a float or a numpy.ndarray. Default is the value in ``params``.
+        g_norms : float or numpy.ndarray, optional
+            Normalized optomechanical coupling strengths. Default is the value in ``params``.
+        gamma_norms : float or numpy.ndarray, optional
+            Normalized mechanical damping rates. Default is the value in ``params``.
+        kappa_norms : float or numpy.ndarray, optional
+            Normalized optical decay rates. Default is the value in ``params``.
+        ns : list, optional
+            Quanta of thermal photons and phonons, each a float or a numpy.ndarray. Default is the value in ``params``.
         
         Returns
         -------
-        values : numpy.ndarray
-            Normalized effective couplings in the order G_minus, G_plus, G_tilde_plus, G_tilde_minus.
+        corrs : numpy.ndarray
+            Steady-state quantum correlations with shape ``(..., 4, 4)``, set to ``NaN`` where the drift matrix is unstable.
+        is_stable : numpy.ndarray
+            Stability of the drift matrices with shape ``(...)``.
         """
 
-        # extract frequently used parameters
-        alpha_0, alpha_m, alpha_p = self.params['alphas']
-        beta_0, beta_m, beta_p = self.params['betas']
-        g_norm = self.params['g_norm']
-        
+        # extract frequently used variables
+        gamma_norm = self.params['gamma_norm'] if gamma_norms is None else gamma_norms
+        kappa_norm = self.params['kappa_norm'] if kappa_norms is None else kappa_norms
+        n_a, n_b = self.params['ns'] if ns is None else ns
+
         # normalized effective couplings
-        G_0_norm = 2 * g_norm * (2 * alpha_0 * beta_0 + (alpha_m + alpha_p) * (beta_m + beta_p))
-        G_1_norm = 2 * g_norm * (alpha_0 * (beta_m + beta_p) + 2 * alpha_p * beta_0)
-        G_tilde_0_norm = 2 * g_norm * (alpha_0**2 + alpha_m**2 + alpha_p**2)
-        G_tilde_1_norm = 2 * g_norm * (alpha_0 * (alpha_m + alpha_p))
+        G_minus_norm, G_plus_norm, G_tilde_minus_norm, G_tilde_plus_norm = self.get_params_G_norms_batch(
+            alphas=alphas,
+            betas=betas,
+            g_norms=g_norms
+        )
 
-        # substituted expressions
-        G_minus_norm = G_0_norm - G_1_norm
-        G_plus_norm = G_0_norm + G_1_norm
-        G_tilde_minus_norm = G_tilde_0_norm - G_tilde_1_norm
-        G_tilde_plus_norm = G_tilde_0_norm + G_tilde_1_norm
+        # broadcast parameters
+        G_minus_norm, G_plus_norm, G_tilde_minus_norm, G_tilde_plus_norm, gamma_norm, kappa_norm, n_a, n_b = np.broadcast_arrays(G_minus_norm, G_plus_norm, G_tilde_minus_norm, G_tilde_plus_norm, gamma_norm, kappa_norm, n_a, n_b)
+        shape = np.shape(G_minus_norm)
+
+        # drift matrices
+        A = np.zeros(shape + (4, 4), dtype=np.float_)
+        # X quadratures
+        A[..., 0, 0] = - kappa_norm / 2.0
+        A[..., 0, 3] = - G_minus_norm
+        # Y quadratures
+        A[..., 1, 1] = - kappa_norm / 2.0
+        A[..., 1, 2] = G_plus_norm
+        # Q quadratures
+        A[..., 2, 1] = - G_minus_norm
+        A[..., 2, 2] = - gamma_norm / 2.0
+        A[..., 2, 3] = - G_tilde_minus_norm
+        # P quadratures
+        A[..., 3, 0] = G_plus_norm
+        A[..., 3, 2] = G_tilde_plus_norm
+        A[..., 3, 3] = - gamma_norm / 2.0
+
+        # noise matrices
+        D = np.zeros(shape + (4, 4), dtype=np.float_)
+        # optical mode
+        D[..., 0, 0] = kappa_norm * (n_a + 0.5)
+        D[..., 1, 1] = kappa_norm * (n_a + 0.5)
+        # mechanical mode
+        D[..., 2, 2] = gamma_norm * (n_b + 0.5)
+        D[..., 3, 3] = gamma_norm * (n_b + 0.5)
 
-        return G_minus_norm, G_plus_norm, G_tilde_minus_norm, G_tilde_plus_norm
+        return get_lyapunov_solutions(
+            A=A,
+            D=D
+        )
 
     def get_D(self, modes, corrs, c, t):
         """Method to obtain the noise matrix.
@@ -232,6 +275,35 @@ class MM_01(BaseSystem):
 
         return self.D
     
+    def get_drives(self):
+        """Method to obtain the harmonic drives of the optical and mechanical modes without RWA.
+
+        The drives are registered once and retained until their parameters change.
+
+        Returns
+        -------
+        drives : :class:`utils.modulations.HarmonicDrives`
+            Drives of the optical and mechanical modes.
+        """
+
+        # function to register the drives
+        def func():
+            drives = HarmonicDrives()
+            drives.add_drive(
+                amps=self.params['alphas'],
+                Omega=self.params['Omega_norms'][0]
+            )
+            drives.add_drive(
+                amps=self.params['betas'],
+                Omega=self.params['Omega_norms'][1]
+            )
+            return drives
+
+        return self.get_derived(
+            name='drives',
+            func=func
+        )
+
     def get_ivc(self):
         """Method to obtain the initial values of the modes, correlations and derived constants and controls.
         
@@ -280,6 +352,258 @@ class MM_01(BaseSystem):
 
         return np.array([0.0, 0.0], dtype=np.complex_)
 
+    def get_params_G_norms(self, c):
+        """Method to obtain the normalized effective couplings.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        values : numpy.ndarray
+            Normalized effective couplings in the order G_minus, G_plus, G_tilde_plus, G_tilde_minus.
+        """
+
+        return self.get_params_G_norms_batch()
+
+    def get_params_G_norms_batch(self, alphas=None, betas=None, g_norms=None):
+        """Method to obtain the normalized effective couplings for a batch of parameters.
+
+        Parameters
+        ----------
+        alphas : list, optional
+            Base and sideband amplitudes of the optical mode, each a float or a numpy.ndarray. Default is the value in ``params``.
+        betas : list, optional
+            Base and sideband amplitudes of the mechanical mode, each a float or a numpy.ndarray. Default is the value in ``params``.
+        g_norms : float or numpy.ndarray, optional
+            Normalized optomechanical coupling strengths. Default is the value in ``params``.
+        
+        Returns
+        -------
+        values : numpy.ndarray
+            Normalized effective couplings in the order G_minus, G_plus, G_tilde_minus, G_tilde_plus, broadcasted over the parameters.
+        """
+
+        # extract frequently used parameters
+        alpha_0, alpha_m, alpha_p = self.params['alphas'] if alphas is None else alphas
+        beta_0, beta_m, beta_p = self.params['betas'] if betas is None else betas
+        g_norm = self.params['g_norm'] if g_norms is None else g_norms
+        
+        # normalized effective couplings
+        G_0_norm = 2 * g_norm * (2 * alpha_0 * beta_0 + (alpha_m + alpha_p) * (beta_m + beta_p))
+        G_1_norm = 2 * g_norm * (alpha_0 * (beta_m + beta_p) + 2 * alpha_p * beta_0)
+        G_tilde_0_norm = 2 * g_norm * (alpha_0**2 + alpha_m**2 + alpha_p**2)
+        G_tilde_1_norm = 2 * g_norm * (alpha_0 * (alpha_m + alpha_p))
+
+        # substituted expressions
+        G_minus_norm = G_0_norm - G_1_norm
+        G_plus_norm = G_0_norm + G_1_norm
+        G_tilde_minus_norm = G_tilde_0_norm - G_tilde_1_norm
+        G_tilde_plus_norm = G_tilde_0_norm + G_tilde_1_norm
+
+        return G_minus_norm, G_plus_norm, G_tilde_minus_norm, G_tilde_plus_norm
+
+    def get_params_ratio(self, c):
+        """Method to obtain the squeezing ratio.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        ratio : numpy.ndarray
+            Squeezing ratio.
+        """
+
+        # get normalized effective couplings
+        G_minus_norm, G_plus_norm, _, _ = self.get_params_G_norms(
+            c=c
+        )
+
+        return (G_plus_norm - G_minus_norm) / (G_plus_norm + G_minus_norm)
+
+    def get_spectra_Q_rwa(self, omega_norms, G_norms=None):
+        """Method to obtain the fluctuation spectra of the position quadrature under RWA.
+
+        Parameters
+        ----------
+        omega_norms : numpy.ndarray
+            Normalized frequencies with shape ``(num_omegas, )``.
+        G_norms : tuple, optional
+            Normalized effective couplings in the order G_minus, G_plus, G_tilde_minus, G_tilde_plus, each a float or a numpy.ndarray, as returned by :meth:`get_params_G_norms_batch`. Default is the value obtained from ``params``.
+        
+        Returns
+        -------
+        S_Q : numpy.ndarray
+            Fluctuation spectra with shape ``(..., num_omegas)``.
+        """
+
+        # extract frequently used variables
+        gamma_norm = self.params['gamma_norm']
+        kappa_norm = self.params['kappa_norm']
+        n_a, n_b = self.params['ns']
+
+        # normalized effective couplings
+        G_minus_norm, G_plus_norm, G_tilde_minus_norm, G_tilde_plus_norm = [np.asarray(G_norm)[..., np.newaxis, np.newaxis] for G_norm in (self.get_params_G_norms_batch() if G_norms is None else G_norms)]
+
+        # frequencies with both signs
+        omega_norm = np.stack((omega_norms, - omega_norms))
+        _den = (kappa_norm - 2.0j * omega_norm)**2 * (- 4.0 * G_tilde_minus_norm * G_tilde_plus_norm + (2.0 * omega_norm + 1.0j * gamma_norm)**2) + 8.0 * G_minus_norm * G_plus_norm * (2.0 * omega_norm + 1.0j * kappa_norm) * (2.0 * omega_norm + 1.0j * gamma_norm) - 16.0 * G_minus_norm**2 * G_plus_norm**2
+        A_num = 8.0 * G_plus_norm * np.sqrt(kappa_norm) * G_tilde_minus_norm * (kappa_norm - 2.0j * omega_norm)
+        B_num = 4.0 * G_minus_norm * np.sqrt(kappa_norm) * (- 4.0 * G_minus_norm * G_plus_norm + (2.0 * omega_norm + 1.0j * kappa_norm) * (2.0 * omega_norm + 1.0j * gamma_norm))
+        C_num = 2.0 * (kappa_norm - 2.0j * omega_norm) * np.sqrt(gamma_norm) * (4.0 * G_minus_norm * G_plus_norm + (kappa_norm - 2.0j * omega_norm) * (gamma_norm - 2.0j * omega_norm))
+        D_num = - 4.0 * G_tilde_minus_norm * (kappa_norm - 2.0j * omega_norm)**2 * np.sqrt(gamma_norm)
+
+        # fluctuation spectra
+        _den_prod = _den[..., 0, :] * _den[..., 1, :]
+        S_Q = (A_num[..., 0, :] * A_num[..., 1, :] + B_num[..., 0, :] * B_num[..., 1, :]) / _den_prod * (n_a + 0.5) + (C_num[..., 0, :] * C_num[..., 1, :] + D_num[..., 0, :] * D_num[..., 1, :]) / _den_prod * (n_b + 0.5)
+
+        return np.real(S_Q)
+
+    def get_templates_A_D(self, c):
+        """Method to obtain the templates of the drift and noise matrices.
+
+        The drift matrix is split into its entries independent of the time, and a function for the remaining entries, which are absent with RWA. The noise matrix is independent of the modes, the correlations and the time.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        A_0 : numpy.ndarray
+            Drift matrix with the constant entries.
+        idxs_A : tuple
+            Rows and columns of the variable entries of the drift matrix.
+        func_A : callable
+            Variable entries of the drift matrix, formatted as ``func_A(modes, t)``.
+        D : numpy.ndarray
+            Noise matrix.
+        """
+
+        # extract frequently used variables
+        g_norm = self.params['g_norm']
+        gamma_norm = self.params['gamma_norm']
+        kappa_norm = self.params['kappa_norm']
+
+        # constant entries of the drift matrix
+        A_0 = np.zeros(self.dim_corrs, dtype=np.float_)
+        A_0[0][0] = - kappa_norm / 2.0
+        A_0[1][1] = - kappa_norm / 2.0
+        A_0[2][2] = - gamma_norm / 2.0
+        A_0[3][3] = - gamma_norm / 2.0
+
+        # with RWA
+        if self.params['t_rwa']:
+            # normalized effective couplings
+            G_minus_norm, G_plus_norm, G_tilde_minus_norm, G_tilde_plus_norm = self.get_params_G_norms(
+                c=c
+            )
+
+            # X quadratures
+            A_0[0][3] = - G_minus_norm
+            # Y quadratures
+            A_0[1][2] = G_plus_norm
+            # Q quadratures
+            A_0[2][1] = - G_minus_norm
+            A_0[2][3] = - G_tilde_minus_norm
+            # P quadratures
+            A_0[3][0] = G_plus_norm
+            A_0[3][2] = G_tilde_plus_norm
+
+            # no variable entries
+            idxs_A = (np.empty(0, dtype=np.int_), np.empty(0, dtype=np.int_))
+            func_A = lambda modes, t: np.empty(0, dtype=np.float_)
+
+        # without RWA
+        else:
+            # extract frequently used variables
+            Delta_norm = self.params['Delta_norm']
+            drives = self.get_drives()
+
+            # X quadratures
+            A_0[0][1] = Delta_norm
+            # Y quadratures
+            A_0[1][0] = - Delta_norm
+            # Q quadratures
+            A_0[2][3] = 1.0
+
+            # positions of the variable entries in the X, Y and P quadratures
+            idxs_A = (np.array([0, 1, 3, 3, 3]), np.array([2, 2, 0, 1, 2]))
+
+            # variable entries of the drift matrix
+            def func_A(modes, t):
+                # modes
+                alpha, beta = drives.get_values(t)
+                G_alpha = 8.0 * g_norm * beta.real * alpha
+                return np.array([- G_alpha.imag, G_alpha.real, G_alpha.real, G_alpha.imag, - 1.0 + 4.0 * g_norm * abs(alpha)**2], dtype=np.float_)
+
+        # constant noise matrix
+        D = np.array(self.get_D(
+            modes=None,
+            corrs=None,
+            c=c,
+            t=None
+        ))
+
+        return A_0, idxs_A, func_A, D
+
+    def get_var_Q_ft_rwa(self, c):
+        """Method to obtain the variance of the position quadrature using the Fourier transform under RWA.
+
+        Parameters
+        ----------
+        c : numpy.ndarray
+            Derived constants and controls.
+        
+        Returns
+        -------
+        var_Q_ft_rwa : float
+            Variance of the position quadrature.
+        """
+
+        return float(self.get_var_Q_ft_rwa_batch()[0])
+
+    def get_var_Q_ft_rwa_batch(self, G_norms=None, atol=1e-12, rtol=1e-8):
+        """Method to obtain the variances of the position quadrature using the Fourier transform under RWA for a batch of effective couplings.
+
+        The fluctuation spectra of all the couplings are integrated together over the real line by adaptive Gauss-Kronrod quadrature.
+
+        Parameters
+        ----------
+        G_norms : tuple, optional
+            Normalized effective couplings in the order G_minus, G_plus, G_tilde_minus, G_tilde_plus, each a float or a numpy.ndarray, as returned by :meth:`get_params_G_norms_batch`. Default is the value obtained from ``params``.
+        atol : float, optional
+            Absolute tolerance of the integrals. Default is :math:`10^{-12}`.
+        rtol : float, optional
+            Relative tolerance of the integrals. Default is :math:`10^{-8}`.
+        
+        Returns
+        -------
+        vars_Q_ft_rwa : numpy.ndarray
+            Variances of the position quadrature.
+        errors : numpy.ndarray
+            Estimated absolute errors of the variances.
+        """
+
+        # integrate the fluctuation spectra
+        integrals, errors = get_integrals_real_line(
+            func=lambda omega_norms: self.get_spectra_Q_rwa(
+                omega_norms=omega_norms,
+                G_norms=G_norms
+            ),
+            atol=atol,
+            rtol=rtol
+        )
+
+        # variances
+        return integrals / 2.0 / np.pi, errors / 2.0 / np.pi
+
     def get_var_Q_ss_rwa(self, c):
         """Method to obtain the steady-state variance of the position quadrature under RWA.
 
@@ -324,39 +648,21 @@ class MM_01(BaseSystem):
         # steady-state variance
         return h * np.exp(- 2.0 * r) / 2.0 / (G_tilde_minus_norm**2 - h**2) * (gamma_norm * (n_b + 0.5) * (_coeff * np.exp(-2.0 * r) - np.exp(2.0 * r)) - 4.0 * G_plus_norm * G_minus_norm / kappa_norm * (n_a + 0.5) * (1.0 + _coeff))
 
-    def get_var_Q_ft_rwa(self, c):
-        """Method to obtain the variance of the position quadrature using the Fourier transform under RWA.
+    def invalidate_derived(self, key):
+        """Method to remove the derived quantities depending on a parameter and update the constancy of the drift matrix.
 
         Parameters
         ----------
-        c : numpy.ndarray
-            Derived constants and controls.
-        
-        Returns
-        -------
-        var_Q_ft_rwa : float
-            Variance of the position quadrature.
+        key : str
+            Name of the changed parameter.
         """
 
-        # extract frequently used variables
-        gamma_norm = self.params['gamma_norm']
-        kappa_norm = self.params['kappa_norm']
-        n_a, n_b = self.params['ns']
-
-        # normalized effective couplings
-        G_minus_norm, G_plus_norm, G_tilde_minus_norm, G_tilde_plus_norm = self.get_params_G_norms(
-            c=c
+        # remove derived quantities
+        super().invalidate_derived(
+            key=key
         )
 
-        # expressions
-        _den = lambda omega_norm: (kappa_norm - 2.0j * omega_norm)**2 * (- 4.0 * G_tilde_minus_norm * G_tilde_plus_norm + (2.0 * omega_norm + 1.0j * gamma_norm)**2) + 8.0 * G_minus_norm * G_plus_norm * (2.0 * omega_norm + 1.0j * kappa_norm) * (2.0 * omega_norm + 1.0j * gamma_norm) - 16.0 * G_minus_norm**2 * G_plus_norm**2
-        A_num = lambda omega_norm: 8.0 * G_plus_norm * np.sqrt(kappa_norm) * G_tilde_minus_norm * (kappa_norm - 2.0j * omega_norm)
-        B_num = lambda omega_norm: 4.0 * G_minus_norm * np.sqrt(kappa_norm) * (- 4.0 * G_minus_norm * G_plus_norm + (2.0 * omega_norm + 1.0j * kappa_norm) * (2.0 * omega_norm + 1.0j * gamma_norm))
-        C_num = lambda omega_norm: 2.0 * (kappa_norm - 2.0j * omega_norm) * np.sqrt(gamma_norm) * (4.0 * G_minus_norm * G_plus_norm + (kappa_norm - 2.0j * omega_norm) * (gamma_norm - 2.0j * omega_norm))
-        D_num = lambda omega: - 4.0 * G_tilde_minus_norm * (kappa_norm - 2.0j * omega)**2 * np.sqrt(gamma_norm)
-
-        # fluctuation spectrum
-        S_Q = lambda omega_norm: (A_num(- omega_norm) * A_num(omega_norm) + B_num(- omega_norm) * B_num(omega_norm)) / _den(- omega_norm) / _den(omega_norm) * (n_a + 0.5) + (C_num(- omega_norm) * C_num(omega_norm) + D_num(- omega_norm) * D_num(omega_norm)) / _den(- omega_norm) / _den(omega_norm) * (n_b + 0.5)
-
-        # variance
-        return 1.0 / 2.0 / np.pi * si.quad(S_Q, -np.inf, np.inf)[0]
\ No newline at end of file
+        # set drift matrix as constant under RWA
+        if key == 't_rwa':
+            assert type(self.params['t_rwa']) is bool, 'Parameter "t_rwa" should be of type boolean'
+            self.is_A_constant = self.params['t_rwa']
\ No newline at end of file
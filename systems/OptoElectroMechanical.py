@@ -6,7 +6,7 @@
 __authors__ = ["Sampreet Kalita"]
 __toolbox__ = 'qom-v1.0.1'
 __created__ = "2021-06-14"
-__updated__ = "2024-01-09"
+__updated__ = "2026-10-18"
 
 # dependencies
 import numpy as np
@@ -14,7 +14,12 @@ import numpy as np
 # qom modules
 from qom.systems import BaseSystem
 
-class OEM_20(BaseSystem):
+# local modules
+from utils.modulations import HarmonicDrives
+from utils.params import RebindableSystem
+from utils.polynomials import get_real_roots, get_stabilities
+
+class OEM_20(RebindableSystem, BaseSystem):
     r"""Class to simulate an OEM system with multiple modulations in laser amplitude, voltage amplitude and mechanical spring constant.
 
     Parameters
@@ -55,6 +60,11 @@ class OEM_20(BaseSystem):
         't_pos'     : 'top'
     }
 
+    # parameters on which the derived quantities of each instance depend
+    derived_dependencies = {
+        'drives'    : ['A_ls', 'A_vs', 'Omegas', 't_mod']
+    }
+
     def __init__(self, params, cb_update=None):
         """Class constructor for OEM_20."""
         
@@ -92,7 +102,6 @@ class OEM_20(BaseSystem):
         # extract frequently used variables
         gamma_a, gamma_b, gamma_c = self.params['gammas']
         g_ab, g_bc = self.params['gs']
-        _, _, Omega_s = self.params['Omegas']
         alpha, beta, chi = modes
 
         # effective values
@@ -106,7 +115,7 @@ class OEM_20(BaseSystem):
         t = 0.0 if t is None else t
 
         # update modulations
-        omega_b = np.sqrt(1.0 + self.params['theta'] * getattr(np, self.params['t_mod'])(Omega_s * t))
+        omega_b = np.sqrt(1.0 + self.params['theta'] * self.get_drives().get_values(t)[2].real)
 
         # optical position quadrature
         self.A[0][0] = - gamma_a 
@@ -149,29 +158,57 @@ class OEM_20(BaseSystem):
 
         Returns
         -------
-        coeffs : int
+        coeffs : numpy.ndarray
             Coefficients of the characteristic equation of the drift matrix.
         """
 
+        return self.get_coeffs_A_batch(
+            modes=modes,
+            ts=t
+        )
+
+    def get_coeffs_A_batch(self, modes, Delta_0s=None, thetas=None, ts=None):
+        """Method to obtain the coefficients of the characteristic equation of the drift matrix for a batch of modes and parameters.
+
+        The parameters are broadcasted with the leading dimensions of the modes.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes with shape ``(..., num_modes)``.
+        Delta_0s : float or numpy.ndarray, optional
+            Detunings of the laser. Default is the value in ``params``.
+        thetas : float or numpy.ndarray, optional
+            Mechanical modulation amplitudes. Default is the value in ``params``.
+        ts : float or numpy.ndarray, optional
+            Times at which the values are calculated. Default is :math:`0.0`.
+
+        Returns
+        -------
+        coeffs : numpy.ndarray
+            Coefficients of the characteristic equation of the drift matrix with shape ``(..., 2 * num_modes + 1)``.
+        """
+
         # extract frequently used variables
         gamma_a, gamma_b, gamma_c = self.params['gammas']
         g_ab, g_bc = self.params['gs']
-        _, _, Omega_s = self.params['Omegas']
         omega_c0 = self.params['omega_c0']
-        alpha, beta, chi = modes
+        alpha, beta, chi = np.moveaxis(np.asarray(modes), -1, 0)
+        Delta_0 = self.params['Delta_0'] if Delta_0s is None else Delta_0s
+        theta = self.params['theta'] if thetas is None else thetas
 
         # effective values
-        Delta = self.params['Delta_0'] - 2.0 * g_ab * np.real(beta)
+        Delta = Delta_0 - 2.0 * g_ab * np.real(beta)
         G_alpha = g_ab * alpha
         g_1 = - g_bc if self.params['t_pos'] == 'bottom' else g_bc
         G_beta = 2.0 * g_1 * np.real(beta)
         G_chi = 2.0 * g_1 * np.real(chi)
 
         # handle fixed point 
-        t = 0.0 if t is None else t
+        t = 0.0 if ts is None else ts
 
         # update modulations
-        omega_b = np.sqrt(1.0 + self.params['theta'] * getattr(np, self.params['t_mod'])(Omega_s * t))
+        omega_b = np.sqrt(1.0 + theta * np.real(self.get_drives().get_values_batch(t)[..., 2]))
 
         # substituted parameters
         D_2 = Delta**2 + gamma_a**2
@@ -180,21 +217,21 @@ class OEM_20(BaseSystem):
         Omega_c_2 = gamma_c**2 + omega_c0 * (omega_c0 - 4.0 * G_beta)
 
         # coefficients
-        coeffs = np.array(2 * self.num_modes + 1, dtype=np.float_)
+        coeffs = np.zeros(np.shape(Delta * omega_b) + (2 * self.num_modes + 1, ), dtype=np.float_)
         # a_0
-        coeffs[0] = 1.0
+        coeffs[..., 0] = 1.0
         # a_1 
-        coeffs[1] = 2.0 * (gamma_a + gamma_b + gamma_c)
+        coeffs[..., 1] = 2.0 * (gamma_a + gamma_b + gamma_c)
         # a_2
-        coeffs[2] = D_2**2 + Omega_b_2**2 + Omega_c_2**2 + 4.0 * (gamma_b * gamma_c + gamma_b * gamma_a + gamma_c * gamma_a)
+        coeffs[..., 2] = D_2 + Omega_b_2 + Omega_c_2 + 4.0 * (gamma_b * gamma_c + gamma_b * gamma_a + gamma_c * gamma_a)
         # a_3
-        coeffs[3] = 2.0 * (gamma_b + gamma_c) * D_2**2 + 2.0 * (Omega_b_2**2 * gamma_c + Omega_c_2**2 * gamma_b) + 2.0 * gamma_a * (Omega_b_2**2 + Omega_c_2**2) + 8.0 * gamma_b * gamma_c * gamma_a
+        coeffs[..., 3] = 2.0 * (gamma_b + gamma_c) * D_2 + 2.0 * (Omega_b_2 * gamma_c + Omega_c_2 * gamma_b) + 2.0 * gamma_a * (Omega_b_2 + Omega_c_2) + 8.0 * gamma_b * gamma_c * gamma_a
         # a_4
-        coeffs[4] = (Omega_b_2**2 + Omega_c_2**2 + 4.0 * gamma_b * gamma_c) * D_2**2 + 4.0 * (Omega_b_2**2 * gamma_c + Omega_c_2**2 * gamma_b) * gamma_a + Omega_b_2**2 * Omega_c_2**2 - 4.0 * G_2**2 * Delta * omega_b - 16.0 * G_chi**2 * omega_b * omega_c0
+        coeffs[..., 4] = (Omega_b_2 + Omega_c_2 + 4.0 * gamma_b * gamma_c) * D_2 + 4.0 * (Omega_b_2 * gamma_c + Omega_c_2 * gamma_b) * gamma_a + Omega_b_2 * Omega_c_2 - 4.0 * G_2 * Delta * omega_b - 16.0 * G_chi**2 * omega_b * omega_c0
         # a_5
-        coeffs[5] = 2.0 * (Omega_b_2**2 * gamma_c + Omega_c_2**2 * gamma_b) * D_2**2 + 2.0 * Omega_b_2**2 * Omega_c_2**2 * gamma_a - 8.0 * G_2**2 * Delta * gamma_c * omega_b - 32.0 * G_chi**2 * gamma_a * omega_b * omega_c0
+        coeffs[..., 5] = 2.0 * (Omega_b_2 * gamma_c + Omega_c_2 * gamma_b) * D_2 + 2.0 * Omega_b_2 * Omega_c_2 * gamma_a - 8.0 * G_2 * Delta * gamma_c * omega_b - 32.0 * G_chi**2 * gamma_a * omega_b * omega_c0
         # a_6
-        coeffs[6] = Omega_b_2**2 * Omega_c_2**2 * D_2**2 - 4.0 * G_2**2 * Omega_c_2**2 * Delta * omega_b - 16.0 * G_chi**2 * D_2**2 * omega_b * omega_c0
+        coeffs[..., 6] = Omega_b_2 * Omega_c_2 * D_2 - 4.0 * G_2 * Omega_c_2 * Delta * omega_b - 16.0 * G_chi**2 * D_2 * omega_b * omega_c0
 
         return coeffs
     
@@ -212,26 +249,53 @@ class OEM_20(BaseSystem):
             Coefficients of the polynomial in the sum of mechanical modes.
         """
 
+        return self.get_coeffs_beta_sum_batch()
+
+    def get_coeffs_beta_sum_batch(self, A_l0s=None, A_v0s=None, Delta_0s=None, thetas=None):
+        """Method to obtain coefficients of the polynomial in the sum of mechanical modes for a batch of parameters.
+
+        The parameters are broadcasted together.
+        
+        Parameters
+        ----------
+        A_l0s : float or numpy.ndarray, optional
+            Base amplitudes of the laser. Default is the value in ``params``.
+        A_v0s : float or numpy.ndarray, optional
+            Base amplitudes of the voltage. Default is the value in ``params``.
+        Delta_0s : float or numpy.ndarray, optional
+            Detunings of the laser. Default is the value in ``params``.
+        thetas : float or numpy.ndarray, optional
+            Mechanical modulation amplitudes. Default is the value in ``params``.
+        
+        Returns 
+        -------
+        coeffs : numpy.ndarray
+            Coefficients of the polynomial in the sum of mechanical modes with shape ``(..., 2 * num_modes)``.
+        """
+
         # extract frequently used variables
-        A_l0, _, _ = self.params['A_ls']
-        A_v0, _, _ = self.params['A_vs']
-        Delta_0 = self.params['Delta_0']
+        A_l0, A_v0, Delta_0, theta = np.broadcast_arrays(
+            self.params['A_ls'][0] if A_l0s is None else A_l0s,
+            self.params['A_vs'][0] if A_v0s is None else A_v0s,
+            self.params['Delta_0'] if Delta_0s is None else Delta_0s,
+            self.params['theta'] if thetas is None else thetas
+        )
         gamma_a, gamma_b, gamma_c = self.params['gammas']
         g_ab, g_bc = self.params['gs']
         omega_c0 = self.params['omega_c0']
 
         # effective values
         g_1 = - g_bc if self.params['t_pos'] == 'bottom' else g_bc
-        omega_b = np.sqrt(1.0 + self.params['theta'])
+        omega_b = np.sqrt(1.0 + theta)
         
         # get coefficients
-        coeffs = np.zeros(2 * self.num_modes, dtype=np.float_)
-        coeffs[0] = 16.0 * omega_c0**2 * g_ab**2 * g_1**2 * (gamma_b**2 + omega_b**2)
-        coeffs[1] = - 8.0 * omega_c0 * g_ab * g_1 * (4.0 * Delta_0 * omega_c0 * g_1 + g_ab * (gamma_c**2 + omega_c0**2)) * (gamma_b**2 + omega_b**2)
-        coeffs[2] = (16.0 * (gamma_a**2 + Delta_0**2) * omega_c0**2 * g_1**2 + g_ab * (gamma_c**2 + omega_c0**2) * (16.0 * Delta_0 * omega_c0 * g_1 + g_ab * (gamma_c**2 + omega_c0**2))) * (gamma_b**2 + omega_b**2)
-        coeffs[3] = (- 2.0 * Delta_0 * g_ab * (gamma_c**2 + omega_c0**2)**2 - 8.0 * omega_c0 * g_1 * (gamma_c**2 + omega_c0**2) * (gamma_a**2 + Delta_0**2)) * (gamma_b**2 + omega_b**2) - 32.0 * omega_b * omega_c0**2 * g_ab * g_1**2 * A_l0**2 - 8.0 * omega_b * omega_c0**2 * g_ab**2 * g_1 * A_v0**2
-        coeffs[4] = (gamma_a**2 + Delta_0**2) * (gamma_c**2 + omega_c0**2)**2 * (gamma_b**2 + omega_b**2) + 16.0 * omega_b * omega_c0 * g_ab * g_1 * A_l0**2 * (gamma_c**2 + omega_c0**2) + 16.0 * omega_b * omega_c0**2 * g_ab * g_1 * A_v0**2 * Delta_0
-        coeffs[5] = - 2.0 * omega_b * g_ab * A_l0**2 * (gamma_c**2 + omega_c0**2) - 8.0 * omega_b * omega_c0**2 * g_1 * A_v0**2 * (gamma_a**2 + Delta_0**2)
+        coeffs = np.zeros(np.shape(theta) + (2 * self.num_modes, ), dtype=np.float_)
+        coeffs[..., 0] = 16.0 * omega_c0**2 * g_ab**2 * g_1**2 * (gamma_b**2 + omega_b**2)
+        coeffs[..., 1] = - 8.0 * omega_c0 * g_ab * g_1 * (4.0 * Delta_0 * omega_c0 * g_1 + g_ab * (gamma_c**2 + omega_c0**2)) * (gamma_b**2 + omega_b**2)
+        coeffs[..., 2] = (16.0 * (gamma_a**2 + Delta_0**2) * omega_c0**2 * g_1**2 + g_ab * (gamma_c**2 + omega_c0**2) * (16.0 * Delta_0 * omega_c0 * g_1 + g_ab * (gamma_c**2 + omega_c0**2))) * (gamma_b**2 + omega_b**2)
+        coeffs[..., 3] = (- 2.0 * Delta_0 * g_ab * (gamma_c**2 + omega_c0**2)**2 - 8.0 * omega_c0 * g_1 * (gamma_c**2 + omega_c0**2) * (gamma_a**2 + Delta_0**2)) * (gamma_b**2 + omega_b**2) - 32.0 * omega_b * omega_c0**2 * g_ab * g_1**2 * A_l0**2 - 8.0 * omega_b * omega_c0**2 * g_ab**2 * g_1 * A_v0**2
+        coeffs[..., 4] = (gamma_a**2 + Delta_0**2) * (gamma_c**2 + omega_c0**2)**2 * (gamma_b**2 + omega_b**2) + 16.0 * omega_b * omega_c0 * g_ab * g_1 * A_l0**2 * (gamma_c**2 + omega_c0**2) + 16.0 * omega_b * omega_c0**2 * g_ab * g_1 * A_v0**2 * Delta_0
+        coeffs[..., 5] = - 2.0 * omega_b * g_ab * A_l0**2 * (gamma_c**2 + omega_c0**2)**2 - 8.0 * omega_b * omega_c0**2 * g_1 * A_v0**2 * (gamma_a**2 + Delta_0**2)
 
         return coeffs
 
@@ -271,6 +335,40 @@ class OEM_20(BaseSystem):
 
         return self.D
     
+    def get_drives(self):
+        """Method to obtain the harmonic drives of the laser and voltage amplitudes and the modulation of the spring constant.
+
+        The drives are registered once and retained until their parameters change.
+
+        Returns
+        -------
+        drives : :class:`utils.modulations.HarmonicDrives`
+            Drives of the laser amplitude, the voltage amplitude and the modulation of the spring constant without the amplitude :math:`\theta`.
+        """
+
+        # function to register the drives
+        def func():
+            drives = HarmonicDrives()
+            drives.add_drive(
+                amps=self.params['A_ls'],
+                Omega=self.params['Omegas'][0]
+            )
+            drives.add_drive(
+                amps=self.params['A_vs'],
+                Omega=self.params['Omegas'][1]
+            )
+            drives.add_drive(
+                amps=[0.0, 1.0],
+                Omega=self.params['Omegas'][2],
+                t_mod=self.params['t_mod']
+            )
+            return drives
+
+        return self.get_derived(
+            name='drives',
+            func=func
+        )
+
     def get_ivc(self):
         """Method to obtain the initial values of the modes, correlations and derived constants and controls.
         
@@ -301,6 +399,51 @@ class OEM_20(BaseSystem):
 
         return iv_modes, iv_corrs, np.empty(0)
 
+    def get_mode_rates(self, modes, c, t):
+        """Method to obtain the rates of change of the modes.
+
+        Parameters
+        ----------
+        modes : numpy.ndarray
+            Classical modes.
+        c : numpy.ndarray
+            Derived constants and controls.
+        t : float
+            Time at which the values are calculated.
+        
+        Returns
+        -------
+        mode_rates : numpy.ndarray
+            Rate of change of the modes.
+        """
+
+        # extract frequently used variables
+        gamma_a, gamma_b, gamma_c = self.params['gammas']
+        g_ab, g_bc = self.params['gs']
+        omega_c0 = self.params['omega_c0']
+        alpha, beta, chi = modes
+
+        # effective values
+        Delta = self.params['Delta_0'] - 2.0 * g_ab * np.real(beta)
+        g_1 = - g_bc if self.params['t_pos'] == 'bottom' else g_bc
+
+        # handle fixed point 
+        t = 0.0 if t is None else t
+
+        # update modulations
+        A_l, A_v, mod_s = self.get_drives().get_values(t)
+        omega_b = np.sqrt(1.0 + self.params['theta'] * mod_s.real)
+
+        # calculate mode rates
+        # optical
+        dalpha_dt = - (gamma_a + 1.0j * Delta) * alpha + A_l
+        # mechanical
+        dbeta_dt = 1.0j * g_ab * np.conjugate(alpha) * alpha - (gamma_b + 1.0j * omega_b) * beta + 4.0j * g_1 * np.real(chi)**2
+        # circuit
+        dchi_dt = 8.0j * g_1 * np.real(beta) * np.real(chi) - (gamma_c + 1.0j * omega_c0) * chi + 1.0j * A_v
+
+        return np.array([dalpha_dt, dbeta_dt, dchi_dt], dtype=np.complex_)
+
     def get_modes_steady_state(self, c):
         """Method to obtain the steady state modes.
         
@@ -315,85 +458,186 @@ class OEM_20(BaseSystem):
             Steady state modes.
         """
 
+        # get modes for all real roots
+        Modes = self.get_modes_steady_state_batch()
+
+        return Modes[~np.isnan(Modes[:, 0])]
+
+    def get_modes_steady_state_batch(self, A_l0s=None, A_v0s=None, Delta_0s=None, thetas=None):
+        """Method to obtain the steady state modes for a batch of parameters.
+
+        The real roots of the polynomial in the sum of mechanical modes are obtained for all the parameters together and each of them gives the three modes. The parameters are broadcasted together.
+        
+        Parameters
+        ----------
+        A_l0s : float or numpy.ndarray, optional
+            Base amplitudes of the laser. Default is the value in ``params``.
+        A_v0s : float or numpy.ndarray, optional
+            Base amplitudes of the voltage. Default is the value in ``params``.
+        Delta_0s : float or numpy.ndarray, optional
+            Detunings of the laser. Default is the value in ``params``.
+        thetas : float or numpy.ndarray, optional
+            Mechanical modulation amplitudes. Default is the value in ``params``.
+        
+        Returns 
+        -------
+        Modes : numpy.ndarray
+            Steady state modes with shape ``(..., 2 * num_modes - 1, num_modes)``, in descending order of the real roots and padded with ``NaN``.
+        """
+
         # extract frequently used variables
-        A_l0, _, _ = self.params['A_ls']
-        A_v0, _, _ = self.params['A_vs']
-        Delta_0 = self.params['Delta_0']
+        A_l0, A_v0, Delta_0, theta = np.broadcast_arrays(
+            self.params['A_ls'][0] if A_l0s is None else A_l0s,
+            self.params['A_vs'][0] if A_v0s is None else A_v0s,
+            self.params['Delta_0'] if Delta_0s is None else Delta_0s,
+            self.params['theta'] if thetas is None else thetas
+        )
         gamma_a, gamma_b, gamma_c = self.params['gammas']
         g_ab, g_bc = self.params['gs']
         omega_c0 = self.params['omega_c0']
 
         # effective values
-        omega_b = np.sqrt(1.0 + self.params['theta'])
+        g_1 = - g_bc if self.params['t_pos'] == 'bottom' else g_bc
+        omega_b = np.sqrt(1.0 + theta)[..., np.newaxis]
+        A_l0 = A_l0[..., np.newaxis]
+        A_v0 = A_v0[..., np.newaxis]
+        Delta_0 = Delta_0[..., np.newaxis]
 
         # get real roots for the sum of betas
-        coeffs = self.get_coeffs_beta_0_sum(c)
-        roots = np.roots(coeffs)
-        beta_sums = np.real(roots[np.imag(roots) == 0.0])
+        beta_sums = get_real_roots(self.get_coeffs_beta_sum_batch(
+            A_l0s=A_l0s,
+            A_v0s=A_v0s,
+            Delta_0s=Delta_0s,
+            thetas=thetas
+        ))
 
         # initialize modes
-        Modes = np.zeros((len(beta_sums), self.num_modes), dtype=np.complex_)
+        Modes = np.zeros(np.shape(beta_sums) + (self.num_modes, ), dtype=np.complex_)
 
         # calculate mode amplitudes for each sum
-        for i in range(len(beta_sums)):
+        with np.errstate(invalid='ignore'):
             # optical mode
-            alpha = A_l0 / (gamma_a + 1.0j * Delta_0 - 1.0j * g_ab * beta_sums[i])
-            Modes[i][0] = alpha
+            alpha = A_l0 / (gamma_a + 1.0j * Delta_0 - 1.0j * g_ab * beta_sums)
+            Modes[..., 0] = alpha
             # sum of chi and its conjugate
-            chi_sum = 2.0 * omega_c0 * A_v0 / (gamma_c**2 + omega_c0**2 - 4.0 * omega_c0 * g_bc * beta_sums[i])
+            chi_sum = 2.0 * omega_c0 * A_v0 / (gamma_c**2 + omega_c0**2 - 4.0 * omega_c0 * g_1 * beta_sums)
             # mechanical mode
-            beta = (1.0j * g_ab * np.conjugate(alpha) * alpha + 1.0j * g_bc * chi_sum**2) / (gamma_b + 1.0j * omega_b)
-            Modes[i][1] = beta
+            Modes[..., 1] = (1.0j * g_ab * np.conjugate(alpha) * alpha + 1.0j * g_1 * chi_sum**2) / (gamma_b + 1.0j * omega_b)
             # LC circuit mode
-            Modes[i][2] = (1.0j * A_v0 + 2.0j * g_bc * beta_sums[i] * chi_sum) / (gamma_c + 1.0j * omega_c0)
+            Modes[..., 2] = (1.0j * A_v0 + 2.0j * g_1 * beta_sums * chi_sum) / (gamma_c + 1.0j * omega_c0)
 
         return Modes
-    
-    def get_mode_rates(self, modes, c, t):
-        """Method to obtain the rates of change of the modes.
+
+    def get_stability_zones_batch(self, A_l0s=None, A_v0s=None, Delta_0s=None, thetas=None):
+        """Method to obtain the stability zones of the steady states for a batch of parameters.
+
+        The Routh-Hurwitz criterion is evaluated for the characteristic polynomials of the drift matrices at all the steady states together. The parameters are broadcasted together.
+
+        Parameters
+        ----------
+        A_l0s : float or numpy.ndarray, optional
+            Base amplitudes of the laser. Default is the value in ``params``.
+        A_v0s : float or numpy.ndarray, optional
+            Base amplitudes of the voltage. Default is the value in ``params``.
+        Delta_0s : float or numpy.ndarray, optional
+            Detunings of the laser. Default is the value in ``params``.
+        thetas : float or numpy.ndarray, optional
+            Mechanical modulation amplitudes. Default is the value in ``params``.
+
+        Returns
+        -------
+        zones : numpy.ndarray
+            Numbers of stable steady states with shape ``(...)``, which are :math:`0` for unstable, :math:`1` for monostable and larger for multistable points.
+        stabilities : numpy.ndarray
+            Stabilities of the steady states in the order of :meth:`get_modes_steady_state_batch` with shape ``(..., 2 * num_modes - 1)``.
+        """
+
+        # get steady states
+        Modes = self.get_modes_steady_state_batch(
+            A_l0s=A_l0s,
+            A_v0s=A_v0s,
+            Delta_0s=Delta_0s,
+            thetas=thetas
+        )
+
+        # get coefficients for each steady state
+        coeffs = self.get_coeffs_A_batch(
+            modes=Modes,
+            Delta_0s=None if Delta_0s is None else np.asarray(Delta_0s)[..., np.newaxis],
+            thetas=None if thetas is None else np.asarray(thetas)[..., np.newaxis]
+        )
+
+        # get stabilities
+        stabilities = get_stabilities(coeffs)
+
+        return np.sum(stabilities, axis=-1), stabilities
+
+    def get_templates_A_D(self, c):
+        """Method to obtain the templates of the drift and noise matrices.
+
+        The drift matrix is split into its entries independent of the modes and the time, and a function for the remaining entries. The noise matrix is independent of the modes, the correlations and the time.
 
         Parameters
         ----------
-        modes : numpy.ndarray
-            Classical modes.
         c : numpy.ndarray
             Derived constants and controls.
-        t : float
-            Time at which the values are calculated.
         
         Returns
         -------
-        mode_rates : numpy.ndarray
-            Rate of change of the modes.
+        A_0 : numpy.ndarray
+            Drift matrix with the constant entries.
+        idxs_A : tuple
+            Rows and columns of the variable entries of the drift matrix.
+        func_A : callable
+            Variable entries of the drift matrix, formatted as ``func_A(modes, t)``.
+        D : numpy.ndarray
+            Noise matrix.
         """
 
         # extract frequently used variables
-        A_l0, A_lm, A_lp = self.params['A_ls']
-        A_v0, A_vm, A_vp = self.params['A_vs']
         gamma_a, gamma_b, gamma_c = self.params['gammas']
         g_ab, g_bc = self.params['gs']
-        Omega_l, Omega_v, Omega_s = self.params['Omegas']
+        Delta_0 = self.params['Delta_0']
         omega_c0 = self.params['omega_c0']
-        alpha, beta, chi = modes
-
-        # effective values
-        Delta = self.params['Delta_0'] - 2.0 * g_ab * np.real(beta)
+        theta = self.params['theta']
+        drives = self.get_drives()
         g_1 = - g_bc if self.params['t_pos'] == 'bottom' else g_bc
 
-        # handle fixed point 
-        t = 0.0 if t is None else t
-
-        # update modulations
-        A_l = A_l0 + A_lm * np.exp(1j * Omega_l * t) + A_lp * np.exp(-1j * Omega_l * t)
-        A_v = A_v0 + A_vm * np.exp(1j * Omega_v * t) + A_vp * np.exp(-1j * Omega_v * t)
-        omega_b = np.sqrt(1.0 + self.params['theta'] * getattr(np, self.params['t_mod'])(Omega_s * t))
-
-        # calculate mode rates
-        # optical
-        dalpha_dt = - (gamma_a + 1.0j * Delta) * alpha + A_l
-        # mechanical
-        dbeta_dt = 1.0j * g_ab * np.conjugate(alpha) * alpha - (gamma_b + 1.0j * omega_b) * beta + 4.0j * g_1 * np.real(chi)**2
-        # circuit
-        dchi_dt = 8.0j * g_1 * np.real(beta) * np.real(chi) - (gamma_c + 1.0j * omega_c0) * chi + 1.0j * A_v
-
-        return np.array([dalpha_dt, dbeta_dt, dchi_dt], dtype=np.complex_)
\ No newline at end of file
+        # constant entries of the drift matrix
+        A_0 = np.zeros(self.dim_corrs, dtype=np.float_)
+        # optical quadratures
+        A_0[0][0] = - gamma_a
+        A_0[1][1] = - gamma_a
+        # mechanical quadratures
+        A_0[2][2] = - gamma_b
+        A_0[3][3] = - gamma_b
+        # LC quadratures
+        A_0[4][4] = - gamma_c
+        A_0[4][5] = omega_c0
+        A_0[5][5] = - gamma_c
+
+        # positions of the variable entries in the optical, mechanical and LC quadratures
+        idxs_A = (np.array([0, 0, 1, 1, 2, 3, 3, 3, 3, 5, 5]), np.array([1, 2, 0, 2, 3, 0, 1, 2, 4, 2, 4]))
+
+        # variable entries of the drift matrix
+        def func_A(modes, t):
+            # effective values
+            Delta = Delta_0 - 2.0 * g_ab * np.real(modes[1])
+            G_alpha = g_ab * modes[0]
+            G_beta = 2.0 * g_1 * np.real(modes[1])
+            G_chi = 2.0 * g_1 * np.real(modes[2])
+
+            # update modulations at the fixed point or the time
+            omega_b = np.sqrt(1.0 + theta * drives.get_values(0.0 if t is None else t)[2].real)
+
+            return np.array([Delta, - 2.0 * np.imag(G_alpha), - Delta, 2.0 * np.real(G_alpha), omega_b, 2.0 * np.real(G_alpha), 2.0 * np.imag(G_alpha), - omega_b, 4.0 * G_chi, 4.0 * G_chi, - omega_c0 + 4.0 * G_beta], dtype=np.float_)
+
+        # constant noise matrix
+        D = np.array(self.get_D(
+            modes=None,
+            corrs=None,
+            c=c,
+            t=None
+        ))
+
+        return A_0, idxs_A, func_A, D
\ No newline at end of file
@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Module with caches for derived quantities of the systems and results of the scripts."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+from collections import OrderedDict
+import hashlib
+import inspect
+import json
+import numpy as np
+import os
+import sys
+import tempfile
+
+def get_key(*values):
+    """Function to obtain a hashable key from a sequence of values.
+
+    Lists and tuples are converted recursively, arrays are represented by their data type, shape and bytes, scalars of NumPy by their Python values and dictionaries by their sorted items.
+
+    Parameters
+    ----------
+    values : tuple
+        Values to include in the key.
+
+    Returns
+    -------
+    key : tuple
+        Hashable key.
+    """
+
+    # initialize key
+    key = list()
+
+    # for each value
+    for value in values:
+        if isinstance(value, dict):
+            key.append(tuple((k, get_key(value[k])) for k in sorted(value)))
+        elif isinstance(value, (list, tuple)):
+            key.append(get_key(*value))
+        elif isinstance(value, np.ndarray):
+            key.append((str(value.dtype), value.shape, value.tobytes()))
+        elif isinstance(value, np.generic):
+            key.append(value.item())
+        else:
+            key.append(value)
+
+    return tuple(key)
+
+def get_hash(*values):
+    """Function to obtain a canonical hash of a sequence of values.
+
+    The values are converted by :func:`get_key` and their representation is hashed by SHA-256, so that the hash is identical across processes and sessions.
+
+    Parameters
+    ----------
+    values : tuple
+        Values to include in the hash.
+
+    Returns
+    -------
+    hash : str
+        Hexadecimal digest of the hash.
+    """
+
+    return hashlib.sha256(repr(get_key(*values)).encode()).hexdigest()
+
+class DiskCache():
+    """Class to store results on disk addressed by the hashes of their keys.
+
+    Each result is stored as a binary array file named by its hash in a subdirectory of the first two characters of the hash. The file is written to a temporary file in the same directory and renamed atomically, so that parallel workers sharing the directory never read partial results and at most evaluate a result twice. Hits refresh the modification times of the files and the least recently used files are removed once the total size exceeds the maximum size, which each worker checks against its own estimate updated by a scan of the directory at every eviction. The counters of each process are accumulated in the subdirectory ``stats``.
+
+    Parameters
+    ----------
+    dir_path : str, optional
+        Path of the directory. Default is ``'data/cache'``.
+    size_max : int, optional
+        Maximum total size of the stored results in bytes. Default is :math:`2^{30}`.
+    """
+
+    def __init__(self, dir_path='data/cache', size_max=2**30):
+        """Class constructor for DiskCache."""
+
+        # set attributes
+        self.dir_path = dir_path
+        self.size_max = size_max
+        self.size = None
+        self.counts = {
+            'hits'      : 0,
+            'misses'    : 0,
+            'evictions' : 0
+        }
+
+    def clear(self):
+        """Method to remove all stored results and counters."""
+
+        for path in self.get_paths() + self.get_paths(
+            stats=True
+        ):
+            self.remove(
+                path=path
+            )
+        for key in self.counts:
+            self.counts[key] = 0
+        self.size = 0
+
+    def evict(self):
+        """Method to remove the least recently used results until the total size is within the maximum size."""
+
+        # sort results by modification time
+        entries = list()
+        for path in self.get_paths():
+            try:
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+            except FileNotFoundError:
+                continue
+        entries.sort()
+
+        # remove oldest results
+        self.size = sum(entry[1] for entry in entries)
+        for _, size, path in entries:
+            if self.size <= self.size_max:
+                break
+            if self.remove(
+                path=path
+            ):
+                self.counts['evictions'] += 1
+            self.size -= size
+
+    def get(self, key, func):
+        """Method to obtain a stored result or evaluate and store it.
+
+        Parameters
+        ----------
+        key : tuple
+            Values identifying the result, hashed by :func:`get_hash`.
+        func : callable
+            Function without arguments to evaluate the result on a miss.
+
+        Returns
+        -------
+        value : numpy.ndarray
+            Stored or evaluated result.
+        """
+
+        # extract frequently used variables
+        path = self.get_path(get_hash(*key))
+
+        # hit
+        try:
+            value = np.load(path, allow_pickle=False)
+            os.utime(path)
+            self.update_counts(
+                name='hits'
+            )
+            return value
+        except FileNotFoundError:
+            pass
+
+        # miss
+        value = np.asarray(func())
+        self.set(
+            path=path,
+            value=value
+        )
+        self.update_counts(
+            name='misses'
+        )
+
+        return value
+
+    def get_info(self):
+        """Method to obtain the counters accumulated over all processes and the contents of the cache.
+
+        Returns
+        -------
+        info : dict
+            Number of hits, misses and evictions, number of stored results, their total size in bytes and the maximum size.
+        """
+
+        # accumulate counters of all processes
+        info = {key: 0 for key in self.counts}
+        for path in self.get_paths(
+            stats=True
+        ):
+            try:
+                with open(path, 'r') as file:
+                    counts = json.load(file)
+            except (FileNotFoundError, ValueError):
+                continue
+            for key in info:
+                info[key] += counts.get(key, 0)
+
+        # contents
+        paths = self.get_paths()
+        info['length'] = len(paths)
+        info['bytes'] = sum(os.path.getsize(path) for path in paths if os.path.exists(path))
+        info['size_max'] = self.size_max
+
+        return info
+
+    def get_path(self, hash):
+        """Method to obtain the path of the file of a result.
+
+        Parameters
+        ----------
+        hash : str
+            Hash of the key of the result.
+
+        Returns
+        -------
+        path : str
+            Path of the file.
+        """
+
+        return os.path.join(self.dir_path, hash[:2], hash + '.npy')
+
+    def get_paths(self, stats=False):
+        """Method to obtain the paths of the stored files.
+
+        Parameters
+        ----------
+        stats : bool, optional
+            Option to obtain the paths of the counters instead of those of the results. Default is ``False``.
+
+        Returns
+        -------
+        paths : list
+            Paths of the files excluding those being written.
+        """
+
+        # extract frequently used variables
+        if not os.path.isdir(self.dir_path):
+            return list()
+
+        # scan subdirectories
+        paths = list()
+        for entry in os.scandir(self.dir_path):
+            if not entry.is_dir() or (entry.name == 'stats') != stats:
+                continue
+            paths += [file.path for file in os.scandir(entry.path) if not file.name.endswith('.tmp')]
+
+        return paths
+
+    def remove(self, path):
+        """Method to remove a file which may have been removed by another process.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file.
+
+        Returns
+        -------
+        removed : bool
+            Whether the file was removed.
+        """
+
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def set(self, path, value):
+        """Method to store a result atomically and evict the old results if required.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file.
+        value : numpy.ndarray
+            Result to store.
+        """
+
+        # write temporary file and rename it
+        self.write(
+            path=path,
+            func=lambda file: np.save(file, value, allow_pickle=False)
+        )
+
+        # update size
+        if self.size is None:
+            self.evict()
+        else:
+            self.size += os.path.getsize(path) if os.path.exists(path) else 0
+            if self.size > self.size_max:
+                self.evict()
+
+    def update_counts(self, name):
+        """Method to increment a counter and accumulate the counters of the process.
+
+        Parameters
+        ----------
+        name : str
+            Name of the counter.
+        """
+
+        # increment counter
+        self.counts[name] += 1
+
+        # accumulate with the stored counters of the process
+        path = os.path.join(self.dir_path, 'stats', str(os.getpid()) + '.json')
+        try:
+            with open(path, 'r') as file:
+                counts = json.load(file)
+        except (FileNotFoundError, ValueError):
+            counts = dict()
+        for key in self.counts:
+            counts[key] = counts.get(key, 0) + self.counts[key]
+            self.counts[key] = 0
+        self.write(
+            path=path,
+            func=lambda file: file.write(json.dumps(counts).encode())
+        )
+
+    def write(self, path, func):
+        """Method to write a file atomically through a temporary file in the same directory.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file.
+        func : callable
+            Function writing the contents, formatted as ``func(file)``, where ``file`` is opened in binary mode.
+        """
+
+        # create directory
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # write and rename
+        fd, path_temp = tempfile.mkstemp(
+            dir=os.path.dirname(path),
+            suffix='.tmp'
+        )
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                func(file)
+            os.replace(path_temp, path)
+        except BaseException:
+            self.remove(
+                path=path_temp
+            )
+            raise
+
+class DiskCachedFunction():
+    """Class to evaluate a function of the parameters of a system through a disk cache.
+
+    The key of each result contains the name of the class of the system, all its parameters resolved with the defaults, the parameters of the solver and the code version. Unless given, the version is the hash of the source of the function, the sources of the loaded modules of the packages ``systems``, ``solvers`` and ``utils``, which include the system and the local solvers and measures, and the version of ``qom``, so that a change in any of them evaluates the results again. Instances can be passed to the loopers running in parallel if the function is defined at the module level.
+
+    Parameters
+    ----------
+    func : callable
+        Function to evaluate, formatted as ``func(system_params)``.
+    SystemClass : class
+        Class of the system.
+    params_solver : dict, optional
+        Parameters of the solver used by the function.
+    cache : :class:`utils.caches.DiskCache`, optional
+        Disk cache. Default is a cache in ``'data/cache'``.
+    version : str, optional
+        Code version. Default is the hash of the sources.
+    """
+
+    # packages of the local modules included in the default version
+    packages_local = ['solvers', 'systems', 'utils']
+
+    def __init__(self, func, SystemClass, params_solver={}, cache=None, version=None):
+        """Class constructor for DiskCachedFunction."""
+
+        # set attributes
+        self.func = func
+        self.SystemClass = SystemClass
+        self.params_solver = params_solver
+        self.cache = DiskCache() if cache is None else cache
+        self.version = self.get_version() if version is None else version
+
+    def __call__(self, system_params):
+        """Method to obtain the stored or evaluated result for the parameters of the system."""
+
+        return self.cache.get(
+            key=(self.SystemClass.__name__, {**self.SystemClass.system_defaults, **system_params}, self.params_solver, self.version),
+            func=lambda: self.func(system_params)
+        )
+
+    def get_version(self):
+        """Method to obtain the default code version.
+
+        Returns
+        -------
+        version : str
+            Hash of the source of the function, the sources of the loaded local modules and the version of ``qom``.
+        """
+
+        # sources of the loaded local modules sorted by name
+        sources = list()
+        for name in sorted(sys.modules):
+            file_path = getattr(sys.modules[name], '__file__', None)
+            if name.split('.')[0] in self.packages_local and file_path is not None and file_path.endswith('.py'):
+                with open(file_path, 'r') as file:
+                    sources.append((name, file.read()))
+
+        return get_hash(inspect.getsource(self.func), sources, getattr(sys.modules.get('qom'), '__version__', None))
+
+class LRUCache():
+    """Class to store a bounded number of results with least-recently-used eviction.
+
+    Parameters
+    ----------
+    size : int, optional
+        Maximum number of stored results. Default is ``128``.
+    """
+
+    def __init__(self, size=128):
+        """Class constructor for LRUCache."""
+
+        # set attributes
+        self.size = size
+        self.values = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """Method to remove all stored results and reset the counters."""
+
+        self.values.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, func):
+        """Method to obtain a stored result or evaluate and store it.
+
+        Parameters
+        ----------
+        key : tuple
+            Hashable key of the result.
+        func : callable
+            Function without arguments to evaluate the result on a miss.
+
+        Returns
+        -------
+        value : any
+            Stored or evaluated result.
+        """
+
+        # hit
+        if key in self.values:
+            self.hits += 1
+            self.values.move_to_end(key)
+            return self.values[key]
+
+        # miss
+        self.misses += 1
+        value = func()
+        self.values[key] = value
+        # evict least recently used
+        if len(self.values) > self.size:
+            self.values.popitem(last=False)
+
+        return value
+
+    def get_info(self):
+        """Method to obtain the counters of the cache.
+
+        Returns
+        -------
+        info : dict
+            Number of hits, misses, stored results and maximum size.
+        """
+
+        return {
+            'hits'  : self.hits,
+            'misses': self.misses,
+            'length': len(self.values),
+            'size'  : self.size
+        }
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module with utility functions for the numerical continuation of solution curves."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import numpy as np
+
+def get_pseudo_arclength_continuation(func, x_0, p_0, p_min, p_max, scales=None, ds_init=1e-2, ds_min=1e-8, ds_max=1e-1, num_max=10000, tol=1e-12):
+    r"""Function to trace a curve of solutions of :math:`F ( x, p ) = 0` in a parameter by pseudo-arclength continuation.
+
+    The variables :math:`y = [ x, p ]` are divided by ``scales`` and each step predicts along the unit tangent :math:`t` of the curve, which is the null vector of the Jacobian :math:`[ \partial_{x} F, \partial_{p} F ]` obtained by forward differences at the last Newton iteration. Newton iterations then correct the prediction within the hyperplane normal to the tangent, so that the steps pass through the turning points, where :math:`\partial_{x} F` is singular. The step size is halved on failed corrections and increased on fast ones. A turning point is detected by a change in the sign of the parameter component of the tangent, and located by the secant method on the step size until the component vanishes. A turning point is not recorded if a correction fails during its location. The continuation stops when the parameter leaves the interval, with the last point corrected onto its boundary.
+
+    Parameters
+    ----------
+    func : callable
+        Residuals with shape ``(n, )``, formatted as ``func(x, p)``.
+    x_0 : numpy.ndarray
+        Initial solution with shape ``(n, )``.
+    p_0 : float
+        Initial parameter, from which the parameter increases.
+    p_min : float
+        Minimum parameter.
+    p_max : float
+        Maximum parameter.
+    scales : numpy.ndarray, optional
+        Scales of the variables and the parameter with shape ``(n + 1, )``. Default is unity.
+    ds_init : float, optional
+        Initial step size in the scaled variables. Default is :math:`10^{-2}`.
+    ds_min : float, optional
+        Minimum step size, below which the continuation stops. Default is :math:`10^{-8}`.
+    ds_max : float, optional
+        Maximum step size. Default is :math:`10^{-1}`.
+    num_max : int, optional
+        Maximum number of steps. Default is :math:`10^{4}`.
+    tol : float, optional
+        Tolerance of the Newton corrections and of the parameter component of the tangent at the turning points, in the scaled variables. Default is :math:`10^{-12}`.
+
+    Returns
+    -------
+    ys : numpy.ndarray
+        Points :math:`[ x, p ]` along the curve with shape ``(num_points, n + 1)``, including the turning points.
+    idxs_turning : numpy.ndarray
+        Indices of the turning points in ``ys``.
+    num_evals : int
+        Number of evaluations of the residuals.
+    """
+
+    # extract frequently used variables
+    x_0 = np.atleast_1d(np.asarray(x_0, dtype=np.float_))
+    n = len(x_0)
+    scales = np.ones(n + 1, dtype=np.float_) if scales is None else np.asarray(scales, dtype=np.float_)
+    counts = {
+        'num_evals': 0
+    }
+
+    # scaled residuals
+    def func_scaled(u):
+        counts['num_evals'] += 1
+        y = u * scales
+        return np.atleast_1d(func(y[:n], y[n]))
+
+    # scaled Jacobian by forward differences
+    def func_jac(u, F):
+        hs = 1e-7 * (1.0 + np.abs(u))
+        return np.transpose([(func_scaled(u + hs[j] * np.eye(n + 1)[j]) - F) / hs[j] for j in range(n + 1)])
+
+    # unit tangent oriented along the previous tangent
+    def func_tangent(J, t_prev):
+        t = np.linalg.solve(np.vstack((J, t_prev)), np.concatenate((np.zeros(n), [1.0])))
+        return t / np.linalg.norm(t)
+
+    # Newton corrections within the hyperplane normal to the tangent
+    def func_correct(u, t, ds):
+        u_pred = u + ds * t
+        v = u_pred.copy()
+        for i in range(8):
+            F = func_scaled(v)
+            J = func_jac(v, F)
+            dv = np.linalg.solve(np.vstack((J, t)), - np.concatenate((F, [t.dot(v - u_pred)])))
+            v = v + dv
+            # quadratic convergence
+            if np.linalg.norm(dv)**2 <= tol * (1.0 + np.linalg.norm(v)):
+                return v, func_tangent(J, t), i + 1
+        return None, None, i + 1
+
+    # Newton corrections at a fixed parameter
+    def func_correct_fixed(u, p):
+        v = np.concatenate((u[:n], [p / scales[n]]))
+        for i in range(20):
+            F = func_scaled(v)
+            dv = np.linalg.solve(func_jac(v, F)[:, :n], - F)
+            v[:n] = v[:n] + dv
+            if np.linalg.norm(dv)**2 <= tol * (1.0 + np.linalg.norm(v)):
+                break
+        return v
+
+    # initial point and tangent
+    u = np.concatenate((x_0, [p_0])) / scales
+    t = func_tangent(func_jac(u, func_scaled(u)), np.concatenate((np.zeros(n), [1.0])))
+    us = [u]
+    idxs_turning = list()
+    ds = ds_init
+
+    for _ in range(num_max):
+        # predict and correct
+        v, t_new, num_iter = func_correct(u, t, ds)
+        if v is None:
+            ds /= 2.0
+            if ds < ds_min:
+                break
+            continue
+
+        # boundary of the interval
+        if not p_min <= v[n] * scales[n] <= p_max:
+            us.append(func_correct_fixed(v, p_min if v[n] * scales[n] < p_min else p_max))
+            break
+
+        # turning point by the secant method on the step size
+        if np.sign(t_new[n]) != np.sign(t[n]):
+            ds_a, f_a = 0.0, t[n]
+            ds_b, f_b = ds, t_new[n]
+            for _ in range(50):
+                ds_c = (ds_a * f_b - ds_b * f_a) / (f_b - f_a)
+                # bisect outside the step
+                if not 0.0 < ds_c < ds:
+                    ds_c = ds / 2.0
+                v_c, t_c, _ = func_correct(u, t, ds_c)
+                if v_c is None or np.abs(t_c[n]) <= tol**0.5:
+                    break
+                ds_a, f_a, ds_b, f_b = ds_b, f_b, ds_c, t_c[n]
+            # record only located turning points
+            if v_c is not None:
+                idxs_turning.append(len(us))
+                us.append(v_c)
+
+        # update point and step size
+        us.append(v)
+        u, t = v, t_new
+        if num_iter <= 3:
+            ds = min(ds * 1.5, ds_max)
+
+    return np.array(us) * scales, np.array(idxs_turning, dtype=np.int_), counts['num_evals']
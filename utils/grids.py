@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module with chunked memory-mapped storage of the results of the loopers."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import copy
+import json
+import multiprocessing
+import numpy as np
+import os
+
+class ChunkedGrid():
+    """Class to store the values of a function on a grid of parameters in a memory-mapped array file filled chunk by chunk.
+
+    The axes are given in the format of the parameters of the loopers, with the values of ``'Z'``, ``'Y'`` and ``'X'`` forming the leading dimensions of the array in this order, followed by the shape of the value at each point. Each chunk contains all the points along the axis ``'X'`` for one point of the other axes, which are evaluated together by passing the values of the axis as an array. The array is preallocated in the file ``<file_path_prefix>.npy`` with its data type and shape in the header, the axes are stored in ``<file_path_prefix>.json`` and the filled chunks are flagged in ``<file_path_prefix>_chunks.npy``, so that parallel workers write their chunks in place and interrupted runs resume from the remaining chunks. Without axes, an existing grid is opened lazily for slicing.
+
+    Parameters
+    ----------
+    file_path_prefix : str
+        Prefix of the paths of the files.
+    axes : dict, optional
+        Parameters of the axes, formatted as ``{'X': {'var': 'delta', 'min': -1.0, 'max': 1.0, 'dim': 1001}, 'Y': {'var': 'L_p', 'val': [0, 1]}}``, where an optional key ``'idx'`` selects an element of a list parameter. Other keys are ignored. Default is ``None`` to open an existing grid.
+    shape_values : tuple, optional
+        Shape of the value at each point. Default is an empty tuple for scalars.
+    dtype : str or numpy.dtype, optional
+        Data type of the stored values, for example ``'float32'`` to halve the size where single precision suffices. Default is ``'float64'``.
+    """
+
+    # names of the axes from the outermost to the innermost
+    axes_names = ['Z', 'Y', 'X']
+
+    def __init__(self, file_path_prefix, axes=None, shape_values=(), dtype='float64'):
+        """Class constructor for ChunkedGrid."""
+
+        # set attributes
+        self.file_path_prefix = file_path_prefix
+        self.file_path_values = file_path_prefix + '.npy'
+        self.file_path_meta = file_path_prefix + '.json'
+        self.file_path_chunks = file_path_prefix + '_chunks.npy'
+
+        # open existing grid
+        if axes is None:
+            with open(self.file_path_meta, 'r') as file:
+                self.meta = json.load(file)
+            return
+
+        # metadata
+        self.meta = {
+            'axes'          : {name: {key: (np.asarray(value).tolist() if key == 'val' else value) for key, value in axes[name].items()} for name in self.axes_names if name in axes},
+            'shape_values'  : list(shape_values),
+            'dtype'         : np.dtype(dtype).str
+        }
+
+        # resume existing grid with the same metadata
+        try:
+            with open(self.file_path_meta, 'r') as file:
+                if json.load(file) == self.meta and os.path.exists(self.file_path_values) and os.path.exists(self.file_path_chunks):
+                    return
+        except (FileNotFoundError, ValueError):
+            pass
+
+        # preallocate files
+        os.makedirs(os.path.dirname(os.path.abspath(file_path_prefix)), exist_ok=True)
+        values = np.lib.format.open_memmap(
+            filename=self.file_path_values,
+            mode='w+',
+            dtype=self.meta['dtype'],
+            shape=self.get_shape()
+        )
+        del values
+        chunks = np.lib.format.open_memmap(
+            filename=self.file_path_chunks,
+            mode='w+',
+            dtype=np.bool_,
+            shape=self.get_shape()[:len(self.meta['axes']) - 1]
+        )
+        del chunks
+        with open(self.file_path_meta, 'w') as file:
+            json.dump(self.meta, file)
+
+    def fill(self, func, params_system, num_processes=None):
+        """Method to evaluate the remaining chunks and write them in place.
+
+        Parameters
+        ----------
+        func : callable
+            Function to evaluate a chunk, formatted as ``func(system_params)``, where the parameter of the axis ``'X'`` is an array and the values are returned with shape ``(dim_X, *shape_values)``. It should be defined at the module level for parallel workers.
+        params_system : dict
+            Parameters of the system.
+        num_processes : int, optional
+            Number of parallel workers. Default is ``None`` for the number of CPUs, while :math:`1` evaluates the chunks in the current process.
+
+        Returns
+        -------
+        num_chunks : int
+            Number of chunks evaluated.
+        """
+
+        # remaining chunks
+        idxs = [tuple(idx) for idx in np.argwhere(~np.load(self.file_path_chunks))]
+        tasks = [(func, params_system, idx) for idx in idxs]
+
+        # evaluate in the current process
+        if num_processes == 1 or len(tasks) <= 1:
+            for task in tasks:
+                self.fill_chunk(task)
+        # evaluate in parallel
+        else:
+            with multiprocessing.Pool(num_processes) as pool:
+                for _ in pool.imap_unordered(self.fill_chunk, tasks):
+                    pass
+
+        return len(tasks)
+
+    def fill_chunk(self, task):
+        """Method to evaluate a chunk and write it in place.
+
+        Parameters
+        ----------
+        task : tuple
+            Function, parameters of the system and indices of the chunk along the axes other than ``'X'``.
+        """
+
+        # extract frequently used variables
+        func, params_system, idx = task
+        axes = self.get_axes()
+        names = list(axes.keys())
+
+        # values of the axes at the chunk with all the values of the innermost axis
+        vals = [axes[name]['val'][i] for name, i in zip(names[:-1], idx)] + [axes[names[-1]]['val']]
+
+        # set the values of the axes
+        system_params = copy.deepcopy(params_system)
+        for name, value in zip(names, vals):
+            if 'idx' in axes[name]:
+                system_params[axes[name]['var']][axes[name]['idx']] = value
+            else:
+                system_params[axes[name]['var']] = value
+
+        # evaluate and write in place
+        values = np.lib.format.open_memmap(
+            filename=self.file_path_values,
+            mode='r+'
+        )
+        values[idx] = np.reshape(func(system_params), values.shape[len(idx):])
+        values.flush()
+        del values
+
+        # flag chunk
+        chunks = np.lib.format.open_memmap(
+            filename=self.file_path_chunks,
+            mode='r+'
+        )
+        chunks[idx] = True
+        chunks.flush()
+        del chunks
+
+    def get_axes(self):
+        """Method to obtain the axes with their values.
+
+        Returns
+        -------
+        axes : dict
+            Parameters of the axes from the outermost to the innermost with the key ``'val'`` containing their values.
+        """
+
+        # initialize axes
+        axes = dict()
+
+        # for each axis
+        for name, axis in self.meta['axes'].items():
+            axes[name] = dict(axis)
+            if 'val' not in axis:
+                axes[name]['val'] = np.linspace(axis['min'], axis['max'], axis['dim'])
+            axes[name]['val'] = np.asarray(axes[name]['val'])
+
+        return axes
+
+    def get_shape(self):
+        """Method to obtain the shape of the stored array.
+
+        Returns
+        -------
+        shape : tuple
+            Dimensions of the axes from the outermost to the innermost followed by the shape of the values.
+        """
+
+        return tuple(len(axis['val']) if 'val' in axis else axis['dim'] for axis in self.meta['axes'].values()) + tuple(self.meta['shape_values'])
+
+    def get_values(self, mode='r'):
+        """Method to open the stored array lazily.
+
+        Parameters
+        ----------
+        mode : str, optional
+            Mode of the memory map. Default is ``'r'`` for read-only.
+
+        Returns
+        -------
+        values : numpy.memmap
+            Stored array, whose slices are read from the file on access. Unfilled chunks contain zeros.
+        """
+
+        return np.lib.format.open_memmap(
+            filename=self.file_path_values,
+            mode=mode
+        )
+
+    def is_filled(self):
+        """Method to check whether all the chunks are filled.
+
+        Returns
+        -------
+        filled : bool
+            Whether all the chunks are filled.
+        """
+
+        return bool(np.all(np.load(self.file_path_chunks)))
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module with utility functions for the integrals of batches of functions."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import numpy as np
+
+# nodes of the 15-point Kronrod rule on [-1, 1], with the 7-point Gauss rule at the odd indices
+xs_kronrod = np.array([
+    - 0.991455371120812639206854697526329,
+    - 0.949107912342758524526189684047851,
+    - 0.864864423359769072789712788640926,
+    - 0.741531185599394439863864773280788,
+    - 0.586087235467691130294144845693013,
+    - 0.405845151377397166906606412076961,
+    - 0.207784955007898467600689403773245,
+    0.0,
+    0.207784955007898467600689403773245,
+    0.405845151377397166906606412076961,
+    0.586087235467691130294144845693013,
+    0.741531185599394439863864773280788,
+    0.864864423359769072789712788640926,
+    0.949107912342758524526189684047851,
+    0.991455371120812639206854697526329
+])
+# weights of the 15-point Kronrod rule
+ws_kronrod = np.array([
+    0.022935322010529224963732008058970,
+    0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518,
+    0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550,
+    0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649,
+    0.209482141084727828012999174891714,
+    0.204432940075298892414161999234649,
+    0.190350578064785409913256402421014,
+    0.169004726639267902826583426598550,
+    0.140653259715525918745189590510238,
+    0.104790010322250183839876322541518,
+    0.063092092629978553290700663189204,
+    0.022935322010529224963732008058970
+])
+# weights of the 7-point Gauss rule padded to the Kronrod nodes
+ws_gauss = np.array([
+    0.0,
+    0.129484966168869693270611432679082,
+    0.0,
+    0.279705391489276667901467771423780,
+    0.0,
+    0.381830050505118944950369775488975,
+    0.0,
+    0.417959183673469387755102040816327,
+    0.0,
+    0.381830050505118944950369775488975,
+    0.0,
+    0.279705391489276667901467771423780,
+    0.0,
+    0.129484966168869693270611432679082,
+    0.0
+])
+
+def get_integrals_gauss_kronrod(func, a, b):
+    """Function to obtain the integrals and the error estimates over a set of intervals using the 7-point Gauss and 15-point Kronrod rules.
+
+    The integrand is evaluated at the nodes of all the intervals in a single call.
+
+    Parameters
+    ----------
+    func : callable
+        Vectorized integrand formatted as ``func(xs)``, where ``xs`` has shape ``(num_nodes, )`` and the values have shape ``(..., num_nodes)``.
+    a : numpy.ndarray
+        Lower limits of the intervals with shape ``(num_intervals, )``.
+    b : numpy.ndarray
+        Upper limits of the intervals with shape ``(num_intervals, )``.
+
+    Returns
+    -------
+    integrals : numpy.ndarray
+        Kronrod estimates of the integrals over each interval with shape ``(..., num_intervals)``.
+    errors : numpy.ndarray
+        Differences between the Kronrod and Gauss estimates with shape ``(..., num_intervals)``.
+    """
+
+    # extract frequently used variables
+    centers = (a + b) / 2.0
+    half_lengths = (b - a) / 2.0
+
+    # evaluate at all nodes
+    xs = centers[:, np.newaxis] + half_lengths[:, np.newaxis] * xs_kronrod
+    values = func(np.ravel(xs))
+    values = np.reshape(values, np.shape(values)[:-1] + np.shape(xs))
+
+    # estimates of the rules
+    integrals = half_lengths * np.sum(values * ws_kronrod, axis=-1)
+    errors = np.abs(integrals - half_lengths * np.sum(values * ws_gauss, axis=-1))
+
+    return integrals, errors
+
+def get_integrals_real_line(func, atol=1e-12, rtol=1e-8, num_intervals=32, max_intervals=8192):
+    r"""Function to obtain the integrals over the real line of a batch of integrands using adaptive Gauss-Kronrod quadrature.
+
+    The real line is mapped to :math:`( - \pi / 2, \pi / 2 )` by :math:`x = \tan \theta`. All the integrands share the same partition, whose intervals are bisected wherever the error of any unconverged integrand exceeds its share of the tolerance. Only the new intervals are evaluated in each iteration.
+
+    Parameters
+    ----------
+    func : callable
+        Vectorized integrand formatted as ``func(xs)``, where ``xs`` has shape ``(num_nodes, )`` and the values have shape ``(..., num_nodes)``.
+    atol : float, optional
+        Absolute tolerance of the integrals. Default is :math:`10^{-12}`.
+    rtol : float, optional
+        Relative tolerance of the integrals. Default is :math:`10^{-8}`.
+    num_intervals : int, optional
+        Number of intervals in the initial partition. Default is :math:`32`.
+    max_intervals : int, optional
+        Maximum number of intervals, after which the refinement stops. Default is :math:`8192`.
+
+    Returns
+    -------
+    integrals : numpy.ndarray
+        Integrals with shape ``(...)``.
+    errors : numpy.ndarray
+        Estimated absolute errors of the integrals with shape ``(...)``.
+    """
+
+    # integrand in the mapped variable
+    func_theta = lambda thetas: func(np.tan(thetas)) / np.cos(thetas)**2
+
+    # initial partition
+    edges = np.linspace(- np.pi / 2.0, np.pi / 2.0, num_intervals + 1)
+    a = edges[:-1]
+    b = edges[1:]
+    values, errs = get_integrals_gauss_kronrod(
+        func=func_theta,
+        a=a,
+        b=b
+    )
+
+    while True:
+        # total estimates
+        integrals = np.sum(values, axis=-1)
+        errors = np.sum(errs, axis=-1)
+        tols = np.maximum(atol, rtol * np.abs(integrals))
+        is_unconverged = errors > tols
+
+        # check convergence
+        if not np.any(is_unconverged) or len(a) >= max_intervals:
+            break
+
+        # intervals to bisect
+        _axes = tuple(range(np.ndim(errs) - 1))
+        is_bisected = np.any(is_unconverged[..., np.newaxis] & (errs > tols[..., np.newaxis] / len(a)), axis=_axes)
+        mids = (a[is_bisected] + b[is_bisected]) / 2.0
+        values_new, errs_new = get_integrals_gauss_kronrod(
+            func=func_theta,
+            a=np.concatenate((a[is_bisected], mids)),
+            b=np.concatenate((mids, b[is_bisected]))
+        )
+
+        # update partition
+        a = np.concatenate((a[~is_bisected], a[is_bisected], mids))
+        b = np.concatenate((b[~is_bisected], mids, b[is_bisected]))
+        values = np.concatenate((values[..., ~is_bisected], values_new), axis=-1)
+        errs = np.concatenate((errs[..., ~is_bisected], errs_new), axis=-1)
+
+    return integrals, errors
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module with utility functions for the drift and correlation matrices."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import numpy as np
+
+def get_dim_packed(num_packed):
+    """Function to obtain the dimension of the symmetric matrices from the number of elements in their upper triangles.
+
+    Parameters
+    ----------
+    num_packed : int
+        Number of elements in the upper triangles.
+
+    Returns
+    -------
+    dim : int
+        Dimension of the matrices.
+    """
+
+    # solve dim * (dim + 1) / 2 = num_packed
+    dim = int(round((np.sqrt(8 * num_packed + 1) - 1) / 2))
+    assert dim * (dim + 1) // 2 == num_packed, "Number of elements {} is not triangular".format(num_packed)
+
+    return dim
+
+def get_jacobian_corrs(A, corrs, dAs):
+    r"""Function to obtain the Jacobian blocks of the rates of the flattened correlations :math:`A V + V A^{T} + D`.
+
+    The correlations are flattened in row-major order, for which the derivative with respect to the correlations is the Kronecker sum :math:`A \otimes I + I \otimes A`. The derivative with respect to each real-valued variable of the modes is :math:`\partial A V + V \partial A^{T}`, assuming that the noise matrix is independent of the modes.
+
+    Parameters
+    ----------
+    A : numpy.ndarray
+        Drift matrix with shape ``(dim, dim)``.
+    corrs : numpy.ndarray
+        Quantum correlations with shape ``(dim, dim)``.
+    dAs : numpy.ndarray
+        Derivatives of the drift matrix with respect to the real-valued variables of the modes with shape ``(num_vars, dim, dim)``.
+
+    Returns
+    -------
+    J_corrs_modes : numpy.ndarray
+        Derivatives of the rates of the correlations with respect to the variables of the modes with shape ``(dim**2, num_vars)``.
+    J_corrs_corrs : numpy.ndarray
+        Derivatives of the rates of the correlations with respect to the correlations with shape ``(dim**2, dim**2)``.
+    """
+
+    # extract frequently used variables
+    dim = np.shape(A)[0]
+
+    # derivatives with respect to the modes
+    dcorrs = np.matmul(dAs, corrs) + np.matmul(corrs, np.transpose(dAs, (0, 2, 1)))
+    J_corrs_modes = np.transpose(np.reshape(dcorrs, (np.shape(dAs)[0], dim**2)))
+
+    # derivatives with respect to the correlations
+    J_corrs_corrs = get_kronecker_sums(
+        A=A
+    )
+
+    return J_corrs_modes, J_corrs_corrs
+
+def get_kronecker_sums(A):
+    r"""Function to obtain the Kronecker sums :math:`A \otimes I + I \otimes A` for a batch of square matrices.
+
+    Parameters
+    ----------
+    A : numpy.ndarray
+        Square matrices with shape ``(..., dim, dim)``.
+
+    Returns
+    -------
+    K : numpy.ndarray
+        Kronecker sums with shape ``(..., dim**2, dim**2)``.
+    """
+
+    # extract frequently used variables
+    dim = np.shape(A)[-1]
+    I = np.eye(dim, dtype=np.float_)
+
+    # broadcast over the indices (i, j, k, l) of the element ((i, j), (k, l))
+    K = A[..., :, np.newaxis, :, np.newaxis] * I[:, np.newaxis, :] + I[:, np.newaxis, :, np.newaxis] * A[..., np.newaxis, :, np.newaxis, :]
+
+    return np.reshape(K, np.shape(A)[:-2] + (dim**2, dim**2))
+
+def get_lyapunov_solutions(A, D):
+    r"""Function to obtain the steady-state correlations from the Lyapunov equations :math:`A V + V A^{T} + D = 0` for a batch of drift and noise matrices.
+
+    The flattened equations are solved together using the Kronecker sums of the drift matrices. The solutions are set to ``NaN`` where any eigenvalue of the drift matrix has a non-negative real part, for which no steady state exists.
+
+    Parameters
+    ----------
+    A : numpy.ndarray
+        Drift matrices with shape ``(..., dim, dim)``.
+    D : numpy.ndarray
+        Noise matrices with shape ``(..., dim, dim)``.
+
+    Returns
+    -------
+    V : numpy.ndarray
+        Steady-state correlations with shape ``(..., dim, dim)``.
+    is_stable : numpy.ndarray
+        Stability of the drift matrices with shape ``(...)``.
+    """
+
+    # extract frequently used variables
+    shape = np.shape(A)[:-2]
+    dim = np.shape(A)[-1]
+
+    # stability from the eigenvalues of the drift matrices
+    is_stable = np.max(np.real(np.linalg.eigvals(A)), axis=-1) < 0.0
+
+    # solve the flattened equations
+    K = get_kronecker_sums(
+        A=A
+    )
+    V = np.full(shape + (dim, dim), np.NaN, dtype=np.float_)
+    V[is_stable] = np.reshape(np.linalg.solve(K[is_stable], - np.reshape(np.broadcast_to(D, shape + (dim, dim))[is_stable], (-1, dim**2, 1))), (-1, dim, dim))
+
+    # symmetrize
+    V = (V + np.swapaxes(V, -1, -2)) / 2.0
+
+    return V, is_stable
+
+def get_packed(matrices):
+    """Function to obtain the upper triangles of a batch of symmetric matrices in row-major order.
+
+    Parameters
+    ----------
+    matrices : numpy.ndarray
+        Symmetric matrices with shape ``(..., dim, dim)``.
+
+    Returns
+    -------
+    packed : numpy.ndarray
+        Upper triangles with shape ``(..., dim * (dim + 1) // 2)``.
+    """
+
+    # extract upper triangles
+    rows, cols = np.triu_indices(np.shape(matrices)[-1])
+
+    return matrices[..., rows, cols]
+
+def get_unpacked(packed):
+    """Function to obtain a batch of symmetric matrices from their upper triangles in row-major order.
+
+    Parameters
+    ----------
+    packed : numpy.ndarray
+        Upper triangles with shape ``(..., dim * (dim + 1) // 2)``.
+
+    Returns
+    -------
+    matrices : numpy.ndarray
+        Symmetric matrices with shape ``(..., dim, dim)``.
+    """
+
+    # extract frequently used variables
+    dim = get_dim_packed(np.shape(packed)[-1])
+    rows, cols = np.triu_indices(dim)
+
+    # fill both triangles
+    matrices = np.zeros(np.shape(packed)[:-1] + (dim, dim), dtype=packed.dtype)
+    matrices[..., rows, cols] = packed
+    matrices[..., cols, rows] = packed
+
+    return matrices
+
+class PackedSymmetricMatrices():
+    """Class to store a batch of symmetric matrices by their upper triangles and unpack them lazily.
+
+    Indexing follows that of the unpacked array with shape ``(..., dim, dim)``, with the indices of the batch and the matrix axes applied separately. Only the matrices selected by the leading indices are unpacked, and the selection of a single element of all the matrices is read directly from the packed array.
+
+    Parameters
+    ----------
+    packed : numpy.ndarray
+        Upper triangles of the matrices in row-major order with shape ``(..., dim * (dim + 1) // 2)``.
+    """
+
+    def __init__(self, packed):
+        """Class constructor for PackedSymmetricMatrices."""
+
+        # set attributes
+        self.packed = packed
+        self.dim = get_dim_packed(np.shape(packed)[-1])
+        self.shape = np.shape(packed)[:-1] + (self.dim, self.dim)
+        self.ndim = len(self.shape)
+        self.dtype = packed.dtype
+
+        # positions of the elements in the packed array
+        self.positions = np.zeros((self.dim, self.dim), dtype=np.int_)
+        rows, cols = np.triu_indices(self.dim)
+        self.positions[rows, cols] = np.arange(len(rows))
+        self.positions[cols, rows] = np.arange(len(rows))
+
+    def __array__(self, dtype=None, copy=None):
+        """Method to obtain the unpacked array."""
+
+        return get_unpacked(self.packed).astype(self.dtype if dtype is None else dtype, copy=False)
+
+    def __getitem__(self, key):
+        """Method to obtain the unpacked matrices or elements at the given indices."""
+
+        # extract frequently used variables
+        key = key if type(key) is tuple else (key, )
+        num_batch = self.ndim - 2
+        has_ellipsis = any(k is Ellipsis for k in key)
+
+        # single element of the selected matrices
+        if not has_ellipsis and len(key) == self.ndim and all(isinstance(k, (int, np.integer)) for k in key[num_batch:]):
+            return self.packed[key[:num_batch] + (self.positions[key[num_batch], key[num_batch + 1]], )]
+
+        # unpack all the matrices
+        if has_ellipsis:
+            return get_unpacked(self.packed)[key]
+
+        # unpack the selected matrices
+        matrices = get_unpacked(self.packed[key[:num_batch]])
+
+        return matrices[(slice(None), ) * (np.ndim(matrices) - 2) + key[num_batch:]]
+
+    def __len__(self):
+        """Method to obtain the length of the first axis."""
+
+        return self.shape[0]
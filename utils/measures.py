@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module with utility functions for the quantum measures of batches of correlations."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import numpy as np
+
+def get_log_negativities(corrs, pos_i=0, pos_j=1):
+    """Function to obtain the logarithmic negativities between two modes for a batch of quantum correlations.
+
+    The convention follows ``entan_ln`` of :class:`qom.solvers.measure.QCMSolver`, with the vacuum variance being :math:`1 / 2`.
+
+    Parameters
+    ----------
+    corrs : numpy.ndarray
+        Quantum correlations with shape ``(..., 2 * num_modes, 2 * num_modes)``.
+    pos_i : int, optional
+        Index of the first mode. Default is :math:`0`.
+    pos_j : int, optional
+        Index of the second mode. Default is :math:`1`.
+
+    Returns
+    -------
+    entan_lns : numpy.ndarray
+        Logarithmic negativities with shape ``(...)``.
+    """
+
+    # correlation matrices of the two modes gathered in a single pass
+    idxs = np.array([2 * pos_i, 2 * pos_i + 1, 2 * pos_j, 2 * pos_j + 1])
+    V = np.asarray(corrs)[..., idxs[:, np.newaxis], idxs]
+
+    # determinants of the blocks in closed form
+    det_A = V[..., 0, 0] * V[..., 1, 1] - V[..., 0, 1] * V[..., 1, 0]
+    det_B = V[..., 2, 2] * V[..., 3, 3] - V[..., 2, 3] * V[..., 3, 2]
+    det_C = V[..., 0, 2] * V[..., 1, 3] - V[..., 0, 3] * V[..., 1, 2]
+
+    # symplectic invariant
+    Sigma = det_A + det_B - 2.0 * det_C
+
+    # smallest symplectic eigenvalue of the partially transposed matrices
+    eta_minus = 1.0 / np.sqrt(2.0) * np.sqrt(Sigma - np.sqrt(Sigma**2 - 4.0 * np.linalg.det(V)))
+
+    return np.maximum(0.0, - np.log(2.0 * eta_minus))
+
+def get_Pearson_correlations(corrs, pos_i=0, pos_j=1, quad=1):
+    """Function to obtain the Pearson correlation coefficients between the quadratures of two modes for a batch of quantum correlations.
+
+    The coefficients are the correlations of the fluctuations of the quadratures normalized by their standard deviations, following ``corrs_P_p`` of :class:`qom.solvers.measure.QCMSolver` for the momentum quadratures.
+
+    Parameters
+    ----------
+    corrs : numpy.ndarray
+        Quantum correlations with shape ``(..., 2 * num_modes, 2 * num_modes)``.
+    pos_i : int, optional
+        Index of the first mode. Default is :math:`0`.
+    pos_j : int, optional
+        Index of the second mode. Default is :math:`1`.
+    quad : int, optional
+        Index of the quadrature, which is :math:`0` for the positions and :math:`1` for the momenta. Default is :math:`1`.
+
+    Returns
+    -------
+    corrs_P : numpy.ndarray
+        Pearson correlation coefficients with shape ``(...)``.
+    """
+
+    # extract frequently used variables
+    corrs = np.asarray(corrs)
+    k_i = 2 * pos_i + quad
+    k_j = 2 * pos_j + quad
+
+    return corrs[..., k_i, k_j] / np.sqrt(corrs[..., k_i, k_i] * corrs[..., k_j, k_j])
+
+def get_synchronizations_phase(modes, corrs, pos_i=0, pos_j=1):
+    r"""Function to obtain the quantum phase synchronizations between two modes for a batch of classical modes and quantum correlations.
+
+    The momentum quadratures are rotated by the phases of the classical modes and the synchronization is :math:`1 / 2 \langle p_{-}^{\prime 2} \rangle` with :math:`p_{-}^{\prime} = ( p_{i}^{\prime} - p_{j}^{\prime} ) / \sqrt{2}`, following ``sync_p`` of :class:`qom.solvers.measure.QCMSolver`.
+
+    Parameters
+    ----------
+    modes : numpy.ndarray
+        Classical modes with shape ``(..., num_modes)``.
+    corrs : numpy.ndarray
+        Quantum correlations with shape ``(..., 2 * num_modes, 2 * num_modes)``.
+    pos_i : int, optional
+        Index of the first mode. Default is :math:`0`.
+    pos_j : int, optional
+        Index of the second mode. Default is :math:`1`.
+
+    Returns
+    -------
+    sync_ps : numpy.ndarray
+        Quantum phase synchronizations with shape ``(...)``.
+    """
+
+    # extract frequently used variables
+    corrs = np.asarray(corrs)
+    modes = np.asarray(modes)
+    arg_i = np.angle(modes[..., pos_i])
+    arg_j = np.angle(modes[..., pos_j])
+
+    # rotations of the momentum quadratures
+    r_i = np.stack((- np.sin(arg_i), np.cos(arg_i)), axis=-1)
+    r_j = np.stack((- np.sin(arg_j), np.cos(arg_j)), axis=-1)
+
+    # correlations of the rotated momentum quadratures
+    p_i_prime_2 = np.einsum('...k,...kl,...l->...', r_i, corrs[..., 2 * pos_i:2 * pos_i + 2, 2 * pos_i:2 * pos_i + 2], r_i)
+    p_j_prime_2 = np.einsum('...k,...kl,...l->...', r_j, corrs[..., 2 * pos_j:2 * pos_j + 2, 2 * pos_j:2 * pos_j + 2], r_j)
+    p_i_prime_p_j_prime = np.einsum('...k,...kl,...l->...', r_i, corrs[..., 2 * pos_i:2 * pos_i + 2, 2 * pos_j:2 * pos_j + 2], r_j)
+
+    # mean square of the difference of the momentum quadratures
+    p_minus_prime_2 = (p_i_prime_2 + p_j_prime_2 - 2.0 * p_i_prime_p_j_prime) / 2.0
+
+    return 0.5 / p_minus_prime_2
+
+def get_Wigner_distributions_chunks(corrs, xs, ys, idxs=[0, 1], num_chunk=16, dtype=np.float_):
+    """Function to obtain the Gaussian Wigner distributions of a pair of quadratures for a batch of quantum correlations in chunks.
+
+    The distributions are centred at the origin with the covariance matrix of the pair of quadratures, following the convention of the vacuum variance being :math:`1 / 2`. The products of the coordinates of the grid are obtained once and the quadratic forms of all the correlations of a chunk are evaluated together, so that the memory is bounded by the size of a chunk.
+
+    Parameters
+    ----------
+    corrs : numpy.ndarray or :class:`utils.matrices.PackedSymmetricMatrices`
+        Quantum correlations with shape ``(num_corrs, 2 * num_modes, 2 * num_modes)``.
+    xs : numpy.ndarray
+        Values of the first quadrature.
+    ys : numpy.ndarray
+        Values of the second quadrature.
+    idxs : list, optional
+        Indices of the quadratures in the correlations. Default is ``[0, 1]``.
+    num_chunk : int, optional
+        Number of correlations evaluated together. Default is :math:`16`.
+    dtype : numpy.dtype, optional
+        Data type of the distributions, for example ``numpy.float32`` to halve the memory. Default is ``numpy.float_``.
+
+    Yields
+    ------
+    Wigners : numpy.ndarray
+        Wigner distributions of the next chunk with shape ``(num_chunk, len(ys), len(xs))``.
+    """
+
+    # products of the coordinates of the grid
+    X, Y = np.meshgrid(np.asarray(xs, dtype=np.float_), np.asarray(ys, dtype=np.float_))
+    G = np.stack((X**2, 2.0 * X * Y, Y**2)).astype(dtype)
+
+    # for each chunk
+    for i in range(0, len(corrs), num_chunk):
+        # covariance matrices of the quadratures
+        V = np.asarray(corrs[i:i + num_chunk])[:, idxs][:, :, idxs]
+        dets = V[:, 0, 0] * V[:, 1, 1] - V[:, 0, 1]**2
+
+        # coefficients of the quadratic forms from the inverse matrices
+        coeffs = np.transpose([V[:, 1, 1], - V[:, 0, 1], V[:, 0, 0]]) / dets[:, np.newaxis]
+
+        # evaluate in place
+        Wigners = np.tensordot(- 0.5 * coeffs.astype(dtype), G, axes=1)
+        np.exp(Wigners, out=Wigners)
+        Wigners *= (1.0 / 2.0 / np.pi / np.sqrt(dets)).astype(dtype)[:, np.newaxis, np.newaxis]
+
+        yield Wigners
+
+def get_Wigner_distributions_single_mode(corrs, xs, ys, pos=0, dtype=np.float_):
+    """Function to obtain the Gaussian Wigner distributions of a single mode for a batch of quantum correlations.
+
+    The convention follows :func:`qom.solvers.measure.get_Wigner_distributions_single_mode` for the position and momentum quadratures of the mode.
+
+    Parameters
+    ----------
+    corrs : numpy.ndarray or :class:`utils.matrices.PackedSymmetricMatrices`
+        Quantum correlations with shape ``(num_corrs, 2 * num_modes, 2 * num_modes)``.
+    xs : numpy.ndarray
+        Values of the position quadrature.
+    ys : numpy.ndarray
+        Values of the momentum quadrature.
+    pos : int, optional
+        Index of the mode. Default is :math:`0`.
+    dtype : numpy.dtype, optional
+        Data type of the distributions. Default is ``numpy.float_``.
+
+    Returns
+    -------
+    Wigners : numpy.ndarray
+        Wigner distributions with shape ``(num_corrs, len(ys), len(xs))``.
+    """
+
+    return np.concatenate(list(get_Wigner_distributions_chunks(
+        corrs=corrs,
+        xs=xs,
+        ys=ys,
+        idxs=[2 * pos, 2 * pos + 1],
+        num_chunk=max(1, len(corrs)),
+        dtype=dtype
+    )))
+
+def get_Wigner_distributions_two_mode(corrs, xs, ys, pos_i=0, pos_j=1, dtype=np.float_):
+    """Function to obtain the Gaussian Wigner distributions of the positions of two modes for a batch of quantum correlations.
+
+    The distributions are the marginals of the two-mode distributions over the momenta, which are Gaussian with the covariance matrix of the positions.
+
+    Parameters
+    ----------
+    corrs : numpy.ndarray or :class:`utils.matrices.PackedSymmetricMatrices`
+        Quantum correlations with shape ``(num_corrs, 2 * num_modes, 2 * num_modes)``.
+    xs : numpy.ndarray
+        Values of the position quadrature of the first mode.
+    ys : numpy.ndarray
+        Values of the position quadrature of the second mode.
+    pos_i : int, optional
+        Index of the first mode. Default is :math:`0`.
+    pos_j : int, optional
+        Index of the second mode. Default is :math:`1`.
+    dtype : numpy.dtype, optional
+        Data type of the distributions. Default is ``numpy.float_``.
+
+    Returns
+    -------
+    Wigners : numpy.ndarray
+        Wigner distributions with shape ``(num_corrs, len(ys), len(xs))``.
+    """
+
+    return np.concatenate(list(get_Wigner_distributions_chunks(
+        corrs=corrs,
+        xs=xs,
+        ys=ys,
+        idxs=[2 * pos_i, 2 * pos_j],
+        num_chunk=max(1, len(corrs)),
+        dtype=dtype
+    )))
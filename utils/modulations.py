@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module with the harmonic drives of the modulated systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import cmath
+import numpy as np
+
+class HarmonicDrives():
+    r"""Class to evaluate the harmonic drives of a system from the phasors of their frequencies.
+
+    Each drive :math:`a_{0} + a_{-} e^{i \Omega t} + a_{+} e^{- i \Omega t}` is registered once with its amplitudes, frequency and type of modulation. Cosinusoidal and sinusoidal drives :math:`a_{0} + a_{1} \cos ( \Omega t )` and :math:`a_{0} + a_{1} \sin ( \Omega t )` are converted to the same form, so that no dispatch on the type is required during the evaluation. The phasors :math:`e^{i \Omega t}` are evaluated once for each distinct frequency with those of the negative frequencies obtained by conjugation, using scalar arithmetic for single times. The values at the last time are retained, so that the rates of the modes and the drift matrix at the same time share them, and the values on a grid of times are obtained together as a table.
+    """
+
+    # types of modulation
+    types_mod = ['cos', 'exp', 'sin']
+
+    def __init__(self):
+        """Class constructor for HarmonicDrives."""
+
+        # set attributes
+        self.amps = list()
+        self.idxs = list()
+        self.Omegas = list()
+        self.t_last = None
+        self.values_last = None
+
+    def add_drive(self, amps, Omega, t_mod='exp'):
+        r"""Method to register a drive.
+
+        Parameters
+        ----------
+        amps : list
+            Amplitudes of the drive, in the format :math:`\left[ a_{0}, a_{-}, a_{+} \right]` for ``'exp'`` and :math:`\left[ a_{0}, a_{1} \right]` for ``'cos'`` and ``'sin'``.
+        Omega : float
+            Frequency of the drive.
+        t_mod : str, optional
+            Type of modulation. Options are ``'exp'`` for complex exponentials, ``'cos'`` for cosinusoidal and ``'sin'`` for sinusoidal. Default is ``'exp'``.
+
+        Returns
+        -------
+        idx : int
+            Index of the drive in the values.
+        """
+
+        # validate type
+        assert t_mod in self.types_mod, "Parameter ``'t_mod'`` can only assume the values {}".format(self.types_mod)
+
+        # convert to the amplitudes of the phasors
+        if t_mod == 'cos':
+            amps = [amps[0], amps[1] / 2.0, amps[1] / 2.0]
+        elif t_mod == 'sin':
+            amps = [amps[0], - 0.5j * amps[1], 0.5j * amps[1]]
+
+        # register frequency
+        Omega = float(Omega)
+        if Omega not in self.Omegas:
+            self.Omegas.append(Omega)
+
+        # register drive
+        self.amps.append(tuple(complex(amp) for amp in amps))
+        self.idxs.append(self.Omegas.index(Omega))
+        self.t_last = None
+
+        return len(self.amps) - 1
+
+    def get_values(self, t):
+        """Method to obtain the values of the drives at a time.
+
+        Parameters
+        ----------
+        t : float
+            Time at which the values are calculated.
+
+        Returns
+        -------
+        values : list
+            Complex values of the drives in the order of registration.
+        """
+
+        # values at the last time
+        if t == self.t_last:
+            return self.values_last
+
+        # phasors of the distinct frequencies
+        phasors = [cmath.exp(1.0j * Omega * t) for Omega in self.Omegas]
+
+        # update values
+        self.values_last = [a_0 + a_m * phasors[i] + a_p * phasors[i].conjugate() for (a_0, a_m, a_p), i in zip(self.amps, self.idxs)]
+        self.t_last = t
+
+        return self.values_last
+
+    def get_values_batch(self, ts):
+        """Method to obtain the table of the values of the drives on a grid of times.
+
+        Parameters
+        ----------
+        ts : float or numpy.ndarray
+            Times at which the values are calculated.
+
+        Returns
+        -------
+        values : numpy.ndarray
+            Complex values of the drives with shape ``(..., num_drives)``, where the leading dimensions are those of the times.
+        """
+
+        # phasors of the drives
+        phasors = np.exp(1.0j * np.multiply.outer(ts, self.Omegas))[..., self.idxs]
+        amps = np.array(self.amps, dtype=np.complex_)
+
+        return amps[:, 0] + amps[:, 1] * phasors + amps[:, 2] * np.conjugate(phasors)
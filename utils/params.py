@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Module with fixed-layout parameters and their rebinding for the systems."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import numpy as np
+
+# local modules
+from utils.caches import get_key
+
+# types of the values compared by equality
+types_scalar = (bool, int, float, complex, str, np.bool_, np.int_, np.float_, np.complex_)
+# types of the values compared by the snapshots of their contents
+types_container = (list, tuple, dict)
+
+def get_snapshot(value):
+    """Function to obtain a snapshot of the contents of a container to detect its changes.
+
+    Parameters
+    ----------
+    value : any
+        Value of a parameter.
+
+    Returns
+    -------
+    snapshot : tuple
+        Key of the contents for lists, tuples and dictionaries, or ``None`` for other values.
+    """
+
+    return get_key(value) if type(value) in types_container else None
+
+class FixedParams():
+    """Class to store the parameters of a system as values in a fixed layout of keys.
+
+    The positions of the keys are shared by all the instances with the same keys, so that each instance only holds a list of values. Indexing, iteration and updates follow those of a dictionary, but keys outside the layout cannot be added or removed. Assignments of values different from the current ones are reported to ``func_invalidate``, with scalars compared by equality and lists, tuples and dictionaries compared by snapshots of their contents taken at the last assignment, so that containers mutated in place and assigned again are detected. Assignments of other values, such as arrays, are always reported.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters to store, whose keys define the layout.
+    func_invalidate : callable, optional
+        Function to invalidate the quantities depending on a changed parameter, formatted as ``func_invalidate(key)``.
+    """
+
+    # positions of the keys for each layout
+    layouts = dict()
+
+    __slots__ = ('positions', 'vals', 'snapshots', 'func_invalidate')
+
+    def __init__(self, params, func_invalidate=None):
+        """Class constructor for FixedParams."""
+
+        # set attributes
+        keys = tuple(params)
+        if keys not in self.layouts:
+            self.layouts[keys] = {key: i for i, key in enumerate(keys)}
+        self.positions = self.layouts[keys]
+        self.vals = [params[key] for key in keys]
+        self.snapshots = [get_snapshot(value) for value in self.vals]
+        self.func_invalidate = func_invalidate
+
+    def __contains__(self, key):
+        """Method to check whether a key is in the layout."""
+
+        return key in self.positions
+
+    def __getitem__(self, key):
+        """Method to obtain the value of a parameter."""
+
+        return self.vals[self.positions[key]]
+
+    def __iter__(self):
+        """Method to iterate over the keys."""
+
+        return iter(self.positions)
+
+    def __len__(self):
+        """Method to obtain the number of parameters."""
+
+        return len(self.vals)
+
+    def __repr__(self):
+        """Method to obtain the representation of the parameters."""
+
+        return 'FixedParams({})'.format(self.copy())
+
+    def __setitem__(self, key, value):
+        """Method to update the value of a parameter and invalidate the dependent quantities if it changes."""
+
+        self.update(
+            params={key: value}
+        )
+
+    def copy(self):
+        """Method to obtain the parameters as a dictionary.
+
+        Returns
+        -------
+        params : dict
+            Shallow copy of the parameters.
+        """
+
+        return dict(zip(self.positions, self.vals))
+
+    def get(self, key, default=None):
+        """Method to obtain the value of a parameter or a default value for keys outside the layout."""
+
+        return self.vals[self.positions[key]] if key in self.positions else default
+
+    def items(self):
+        """Method to obtain the pairs of keys and values."""
+
+        return zip(self.positions, self.vals)
+
+    def keys(self):
+        """Method to obtain the keys."""
+
+        return self.positions.keys()
+
+    def update(self, params, skip_missing=False):
+        """Method to update the values of the parameters and invalidate the dependent quantities of those which change.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters to update.
+        skip_missing : bool, optional
+            Option to ignore the keys outside the layout instead of raising ``KeyError``. Default is ``False``.
+        """
+
+        # extract frequently used variables
+        positions = self.positions
+        vals = self.vals
+        snapshots = self.snapshots
+
+        for key in params:
+            i = positions.get(key)
+            if i is None:
+                if skip_missing:
+                    continue
+                raise KeyError(key)
+
+            # update value
+            value = params[key]
+            _value = vals[i]
+            vals[i] = value
+
+            # compare scalars by equality and containers by snapshots
+            if type(value) in types_scalar and type(_value) in types_scalar:
+                is_changed = _value != value
+            else:
+                snapshot = get_snapshot(value)
+                is_changed = snapshot is None or snapshot != snapshots[i]
+                snapshots[i] = snapshot
+
+            # invalidate dependent quantities
+            if is_changed and self.func_invalidate is not None:
+                self.func_invalidate(key)
+
+    def values(self):
+        """Method to obtain the values."""
+
+        return list(self.vals)
+
+class RebindableSystem():
+    """Class to reuse a system for new values of its parameters by rebinding them.
+
+    The class is inherited before ``BaseSystem``, whose parameters are stored as ``FixedParams`` after initialization. Derived quantities obtained by ``get_derived`` are retained until a parameter listed for them in ``derived_dependencies`` changes, either by ``rebind`` or by a direct assignment. Quantities without listed parameters depend on all of them.
+
+    Parameters
+    ----------
+    params : dict
+        Parameters for the system.
+    kwargs : dict
+        Remaining arguments of ``BaseSystem``.
+    """
+
+    # parameters on which each derived quantity depends
+    derived_dependencies = {}
+
+    def __init__(self, params, **kwargs):
+        """Class constructor for RebindableSystem."""
+
+        # initialize super class
+        super().__init__(
+            params=params,
+            **kwargs
+        )
+
+        # set attributes
+        self.derived = dict()
+        self.params = FixedParams(
+            params=self.params,
+            func_invalidate=self.invalidate_derived
+        )
+
+    def get_derived(self, name, func):
+        """Method to obtain a stored derived quantity or evaluate and store it.
+
+        Parameters
+        ----------
+        name : str
+            Name of the derived quantity.
+        func : callable
+            Function without arguments to evaluate the quantity.
+
+        Returns
+        -------
+        value : any
+            Value of the derived quantity.
+        """
+
+        if name not in self.derived:
+            self.derived[name] = func()
+
+        return self.derived[name]
+
+    def invalidate_derived(self, key):
+        """Method to remove the derived quantities depending on a parameter.
+
+        Parameters
+        ----------
+        key : str
+            Name of the changed parameter.
+        """
+
+        for name in [name for name in self.derived if key in self.derived_dependencies.get(name, (key, ))]:
+            del self.derived[name]
+
+    def rebind(self, params):
+        """Method to update the parameters of the system.
+
+        Only the parameters of the system are updated, and only the derived quantities depending on the changed values are invalidated.
+
+        Parameters
+        ----------
+        params : dict
+            Parameters to update. Keys which are not parameters of the system are ignored.
+
+        Returns
+        -------
+        system : RebindableSystem
+            The updated system.
+        """
+
+        self.params.update(
+            params=params,
+            skip_missing=True
+        )
+
+        return self
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+ 
+"""Module with utility functions for batches of polynomials."""
+
+__authors__ = ["Sampreet Kalita"]
+__toolbox__ = 'qom-v1.0.1'
+__created__ = "2026-10-18"
+__updated__ = "2026-10-18"
+
+# dependencies
+import numpy as np
+
+def get_roots(coeffs):
+    """Function to obtain the roots of a batch of polynomials using their companion matrices.
+
+    The companion matrices of all the polynomials are stacked and their eigenvalues are obtained in a single call, following the convention of ``numpy.roots``. Real coefficients lead to real companion matrices, so that real roots have vanishing imaginary parts. Polynomials with vanishing leading coefficients are solved individually and padded with ``NaN``.
+
+    Parameters
+    ----------
+    coeffs : numpy.ndarray
+        Coefficients of the polynomials in descending powers along the last axis, with shape ``(..., n + 1)``.
+
+    Returns
+    -------
+    roots : numpy.ndarray
+        Complex roots of the polynomials with shape ``(..., n)``.
+    """
+
+    # extract frequently used variables
+    coeffs = np.asarray(coeffs)
+    shape = coeffs.shape[:-1]
+    n = coeffs.shape[-1] - 1
+    dtype = np.complex_ if np.iscomplexobj(coeffs) else np.float_
+    coeffs = np.reshape(coeffs, (-1, n + 1)).astype(dtype)
+
+    # initialize roots
+    roots = np.full((len(coeffs), n), np.nan, dtype=np.complex_)
+    if n == 0:
+        return np.reshape(roots, shape + (n, ))
+
+    # polynomials with non-vanishing leading coefficients
+    _regular = coeffs[:, 0] != 0.0
+    if np.any(_regular):
+        # companion matrices
+        companions = np.zeros((np.count_nonzero(_regular), n, n), dtype=dtype)
+        companions[:, 0, :] = - coeffs[_regular, 1:] / coeffs[_regular, 0:1]
+        companions[:, np.arange(1, n), np.arange(0, n - 1)] = 1.0
+        roots[_regular] = np.linalg.eigvals(companions)
+
+    # fallback for the remaining polynomials
+    for i in np.flatnonzero(~ _regular):
+        _roots = np.roots(coeffs[i])
+        roots[i, :len(_roots)] = _roots
+
+    return np.reshape(roots, shape + (n, ))
+
+def get_real_roots(coeffs, descending=True):
+    """Function to obtain the real roots of a batch of polynomials.
+
+    Roots with vanishing imaginary parts are retained, sorted and moved to the front of the last axis, and the remaining entries are padded with ``NaN``.
+
+    Parameters
+    ----------
+    coeffs : numpy.ndarray
+        Real coefficients of the polynomials in descending powers along the last axis, with shape ``(..., n + 1)``.
+    descending : bool, optional
+        Option to sort the real roots in descending order. Default is ``True``.
+
+    Returns
+    -------
+    reals : numpy.ndarray
+        Real roots padded with ``NaN``, with shape ``(..., n)``.
+    """
+
+    # get all roots
+    roots = get_roots(coeffs)
+
+    # retain real roots
+    reals = np.where(np.imag(roots) == 0.0, np.real(roots), np.nan)
+
+    # sort with NaNs at the end
+    reals = np.sort(- reals if descending else reals, axis=-1)
+
+    return - reals if descending else reals
+
+def get_routh_columns(coeffs):
+    """Function to obtain the first columns of the Routh arrays of a batch of polynomials.
+
+    The rows of all the arrays are eliminated together. The elements of the first column are the ratios of the successive Hurwitz determinants, so that a polynomial with a positive leading coefficient is Hurwitz stable if and only if all of them are positive. Vanishing pivots lead to non-finite elements.
+
+    Parameters
+    ----------
+    coeffs : numpy.ndarray
+        Real coefficients of the polynomials in descending powers along the last axis, with shape ``(..., n + 1)``.
+
+    Returns
+    -------
+    columns : numpy.ndarray
+        First columns of the Routh arrays with shape ``(..., n + 1)``.
+    """
+
+    # extract frequently used variables
+    coeffs = np.asarray(coeffs, dtype=np.float_)
+    shape = coeffs.shape[:-1]
+    n = coeffs.shape[-1] - 1
+    coeffs = np.reshape(coeffs, (-1, n + 1))
+
+    # first two rows padded with zeros
+    row_0 = np.zeros((len(coeffs), n // 2 + 2), dtype=np.float_)
+    row_0[:, :n // 2 + 1] = coeffs[:, 0::2]
+    row_1 = np.zeros_like(row_0)
+    row_1[:, :(n + 1) // 2] = coeffs[:, 1::2]
+
+    # initialize columns
+    columns = np.zeros_like(coeffs)
+    columns[:, 0] = row_0[:, 0]
+    columns[:, 1] = row_1[:, 0]
+
+    # eliminate the remaining rows
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i in range(2, n + 1):
+            row = np.zeros_like(row_0)
+            row[:, :-1] = row_0[:, 1:] - (row_0[:, 0] / row_1[:, 0])[:, np.newaxis] * row_1[:, 1:]
+            row_0, row_1 = row_1, row
+            columns[:, i] = row[:, 0]
+
+    return np.reshape(columns, shape + (n + 1, ))
+
+def get_stabilities(coeffs):
+    """Function to obtain the Routh-Hurwitz stabilities of a batch of characteristic polynomials.
+
+    Parameters
+    ----------
+    coeffs : numpy.ndarray
+        Real coefficients of the polynomials in descending powers along the last axis, with shape ``(..., n + 1)``. Polynomials containing ``NaN`` are considered unstable.
+
+    Returns
+    -------
+    stabilities : numpy.ndarray
+        Boolean stabilities with shape ``(...)``, which are ``True`` if all the roots have negative real parts.
+    """
+
+    # get first columns
+    columns = get_routh_columns(coeffs)
+
+    # normalize by the leading coefficients
+    with np.errstate(invalid='ignore'):
+        return np.all(columns * np.sign(columns[..., 0:1]) > 0.0, axis=-1)